@@ -0,0 +1,37 @@
+from harness import measure
+
+from udataclasses import dataclass, field
+
+STORAGES = ("property", "plain")
+
+
+def bench_get() -> None:
+    for storage in STORAGES:
+
+        @dataclass(storage=storage)
+        class Class:
+            a: int = field()
+
+        obj = Class(a=1)
+
+        def get() -> None:
+            for _ in range(100):
+                obj.a
+
+        measure("get_x100", get, storage=storage)
+
+
+def bench_set() -> None:
+    for storage in STORAGES:
+
+        @dataclass(storage=storage)
+        class Class:
+            a: int = field()
+
+        obj = Class(a=1)
+
+        def set() -> None:
+            for _ in range(100):
+                obj.a = 2
+
+        measure("set_x100", set, storage=storage)
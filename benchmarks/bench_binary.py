@@ -0,0 +1,36 @@
+import json
+
+from harness import measure
+
+from udataclasses import asdict, dataclass, field
+
+
+@dataclass
+class Sample:
+    channel: int = field(format="<B")
+    humidity: float = field(format="f")
+    pressure: float = field(format="f")
+    sequence: int = field(format="I")
+    temperature: float = field(format="f")
+
+
+def bench_binary() -> None:
+    sample = Sample(
+        channel=1, humidity=40.5, pressure=1013.25, sequence=7, temperature=21.5
+    )
+    data = sample.to_bytes()
+    buf = bytearray(len(data))
+    measure("binary_to_bytes", lambda: sample.to_bytes(), iterations=1000)
+    measure("binary_pack_into", lambda: sample.pack_into(buf), iterations=1000)
+    measure("binary_from_bytes", lambda: Sample.from_bytes(data), iterations=1000)
+    measure("binary_json_dumps", lambda: json.dumps(asdict(sample)), iterations=1000)
+
+
+def bench_decode_into() -> None:
+    sample = Sample(
+        channel=1, humidity=40.5, pressure=1013.25, sequence=7, temperature=21.5
+    )
+    data = sample.to_bytes()
+    update = {"sequence": 8, "temperature": 22.0}
+    measure("binary_decode_into", lambda: sample.decode_into(data), iterations=1000)
+    measure("update_from", lambda: sample.update_from(update), iterations=1000)
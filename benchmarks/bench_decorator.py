@@ -0,0 +1,53 @@
+from harness import measure
+
+from udataclasses import dataclass, field
+from udataclasses.decorator import methods_cache
+
+try:
+    from typing import Any
+except ImportError:
+    pass
+
+FIELD_COUNTS = (1, 5, 20)
+
+
+def make_class(field_count: int) -> type[Any]:
+    """Creates a new, undecorated class with field_count fields."""
+    namespace = {f"f{i}": field(default=i) for i in range(field_count)}
+    return type(f"Class{field_count}", (), namespace)
+
+
+def bench_decorate() -> None:
+    for field_count in FIELD_COUNTS:
+        measure(
+            "decorate",
+            lambda: dataclass(make_class(field_count)),
+            iterations=100,
+            fields=field_count,
+        )
+
+
+def bench_decorate_order_frozen() -> None:
+    for field_count in FIELD_COUNTS:
+        measure(
+            "decorate_order_frozen",
+            lambda: dataclass(make_class(field_count), order=True, frozen=True),
+            iterations=100,
+            fields=field_count,
+        )
+
+
+def bench_decorate_uncached() -> None:
+    maxsize = methods_cache.maxsize
+    methods_cache.maxsize = 0
+    methods_cache.clear()
+    try:
+        for field_count in FIELD_COUNTS:
+            measure(
+                "decorate_uncached",
+                lambda: dataclass(make_class(field_count)),
+                iterations=100,
+                fields=field_count,
+            )
+    finally:
+        methods_cache.maxsize = maxsize
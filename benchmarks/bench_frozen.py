@@ -0,0 +1,89 @@
+import json
+
+from harness import allocated_bytes, measure
+
+from udataclasses import asdict, dataclass, field, make_dataclass, replace
+
+try:
+    from typing import Any
+except ImportError:
+    pass
+
+STORAGES = ("property", "tuple")
+
+
+def make_class(storage: str, slots: bool = False) -> type[Any]:
+    @dataclass(frozen=True, storage=storage, slots=slots)
+    class Class:
+        a: int = field()
+        b: int = field()
+        c: int = field()
+        d: int = field()
+
+    return Class
+
+
+def bench_eq() -> None:
+    for storage in STORAGES:
+        cls = make_class(storage)
+        x = cls(a=1, b=2, c=3, d=4)
+        y = cls(a=1, b=2, c=3, d=4)
+        measure("frozen_eq", lambda: x == y, iterations=1000, storage=storage)
+
+
+def bench_hash() -> None:
+    for storage in STORAGES:
+        cls = make_class(storage)
+        x = cls(a=1, b=2, c=3, d=4)
+        measure("frozen_hash", lambda: hash(x), iterations=1000, storage=storage)
+
+
+def bench_replace() -> None:
+    for storage in STORAGES:
+        cls = make_class(storage)
+        x = cls(a=1, b=2, c=3, d=4)
+        measure("frozen_replace", lambda: replace(x, b=5), storage=storage)
+
+
+def bench_instance_size() -> None:
+    count = 100
+    for slots in (False, True):
+        for storage in STORAGES:
+            cls = make_class(storage, slots)
+            instances = []
+
+            def create() -> None:
+                for _ in range(count):
+                    instances.append(cls(a=1, b=2, c=3, d=4))
+
+            result = {
+                "benchmark": "frozen_instance_bytes",
+                "storage": storage,
+                "slots": slots,
+                "bytes": allocated_bytes(create) // count,
+            }
+            print(json.dumps(result))
+
+
+def bench_cache_hash() -> None:
+    for cache_hash in (False, True):
+        cls = make_dataclass(
+            "Class",
+            [(f"f{i}", int, field()) for i in range(10)],
+            frozen=True,
+            cache_hash=cache_hash,
+        )
+        x = cls(**{f"f{i}": i for i in range(10)})
+        measure("hash_10_fields", lambda: hash(x), iterations=1000, cache=cache_hash)
+
+
+def bench_cache_asdict() -> None:
+    for cache_asdict in (False, True):
+        cls = make_dataclass(
+            "Class",
+            [(f"f{i}", int, field()) for i in range(10)],
+            frozen=True,
+            cache_asdict=cache_asdict,
+        )
+        x = cls(**{f"f{i}": i for i in range(10)})
+        measure("asdict_10_fields", lambda: asdict(x), cache=cache_asdict)
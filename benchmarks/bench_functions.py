@@ -0,0 +1,108 @@
+from harness import measure
+
+from udataclasses import (
+    asdict,
+    build_iter,
+    build_many,
+    dataclass,
+    field,
+    fields,
+    fromdict,
+    make_dataclass,
+)
+
+try:
+    from typing import Any
+except ImportError:
+    pass
+
+
+@dataclass
+class Point:
+    x: float = 0.0
+    y: float = 0.0
+
+
+@dataclass
+class Reading:
+    name: str = field()
+    points: list[Point] = field(type=Point, default_factory=list)
+    position: Any = field(type=Point, default=None)
+    timestamp: int = 0
+    value: float = 0.0
+
+
+def bench_asdict() -> None:
+    flat = Reading(name="flat", timestamp=1, value=2.0)
+    nested = Reading(
+        name="nested",
+        position=Point(x=1.0, y=2.0),
+        points=[Point(x=1.0), Point(y=2.0)],
+    )
+    measure("asdict_flat", lambda: asdict(flat), iterations=1000)
+    measure("asdict_nested", lambda: asdict(nested), iterations=1000)
+
+
+def bench_fields() -> None:
+    for count in (1, 10, 100):
+        cls = make_dataclass("Class", [f"f{i}" for i in range(count)])
+        measure("fields", lambda: fields(cls), iterations=1000, fields=count)
+
+
+def bench_fromdict() -> None:
+    data = {
+        "name": "nested",
+        "points": [{"x": 1.0, "y": 0.0}, {"x": 0.0, "y": 2.0}],
+        "position": {"x": 1.0, "y": 2.0},
+        "timestamp": 0,
+        "value": 0.0,
+    }
+
+    def manual() -> Reading:
+        kwargs = dict(data)
+        kwargs["points"] = [Point(**p) for p in data["points"]]  # type: ignore[attr-defined]
+        kwargs["position"] = Point(**data["position"])  # type: ignore[arg-type]
+        return Reading(**kwargs)
+
+    assert manual() == fromdict(Reading, data)
+    measure("fromdict_manual", manual, iterations=1000)
+    measure("fromdict", lambda: fromdict(Reading, data), iterations=1000)
+
+
+def bench_fromdict_fields() -> None:
+    for count in (1, 10, 100):
+        cls = make_dataclass(
+            "Class", [(f"f{i}", int, field(default=0)) for i in range(count)]
+        )
+        data = {f"f{i}": i for i in range(count)}
+        measure("fromdict_kwargs", lambda: cls(**data), iterations=1000, fields=count)
+        measure("fromdict", lambda: fromdict(cls, data), iterations=1000, fields=count)
+
+
+def bench_build_many() -> None:
+    row_count = 1000
+    for count in (1, 10):
+        cls = make_dataclass(
+            "Class", [(f"f{i}", int, field(default=0)) for i in range(count)]
+        )
+        dicts = [{f"f{i}": j for i in range(count)} for j in range(row_count)]
+        tuples = [tuple(row.values()) for row in dicts]
+        names = tuple(dicts[0])
+        params = {"fields": count, "rows": row_count}
+        # Exclude generating the loops from the results.
+        build_many(cls, [])
+        build_many(cls, [], fields=names)
+        measure("build_kwargs", lambda: [cls(**r) for r in dicts], 10, **params)
+        measure("build_many_dicts", lambda: build_many(cls, dicts), 10, **params)
+        measure(
+            "build_many_tuples",
+            lambda: build_many(cls, tuples, fields=names),
+            10,
+            **params,
+        )
+        measure(
+            "build_iter_tuples",
+            lambda: list(build_iter(cls, tuples, fields=names)),
+            10,
+            **params,
+        )
@@ -0,0 +1,77 @@
+"""Time and heap used by importing udataclasses.
+
+Each iteration of bench_import removes the package's modules from sys.modules
+and imports it again. Standard library modules stay loaded, so on CPython
+bench_import_process also measures imports in a new interpreter, including the
+standard library modules they load.
+"""
+
+import sys
+
+from harness import measure, report
+
+try:
+    from typing import Any
+except ImportError:
+    pass
+
+IMPORTS = {
+    "import_decorator": "from udataclasses import dataclass, field",
+    "import_all": "import udataclasses; [getattr(udataclasses, n) for n in udataclasses.__all__]",
+}
+"""Statements to measure, by benchmark name."""
+
+
+def unload() -> dict[str, Any]:
+    """Removes udataclasses modules from sys.modules, and returns them."""
+    modules: dict[str, Any] = {}
+    for name in list(sys.modules):
+        if name == "udataclasses" or name.startswith("udataclasses."):
+            modules[name] = sys.modules.pop(name)
+    return modules
+
+
+def bench_import() -> None:
+    original = unload()
+    try:
+        for name, statement in IMPORTS.items():
+
+            def run() -> None:
+                unload()
+                exec(statement, {})
+
+            measure(name, run, iterations=10)
+    finally:
+        unload()
+        sys.modules.update(original)
+
+
+def bench_import_process() -> None:
+    try:
+        import subprocess
+    except ImportError:
+        # MicroPython
+        return
+
+    # Heap usage is measured in a separate run, as tracing slows down imports.
+    # _tracemalloc avoids the imports done by the tracemalloc module.
+    code = (
+        "import _tracemalloc, time\n"
+        "if {trace}: _tracemalloc.start()\n"
+        "start = time.perf_counter_ns()\n"
+        "{statement}\n"
+        "us = (time.perf_counter_ns() - start) / 1000\n"
+        "print(us, _tracemalloc.get_traced_memory()[1])\n"
+    )
+
+    def run(statement: str, trace: bool) -> list[str]:
+        args = [sys.executable, "-c", code.format(statement=statement, trace=trace)]
+        return subprocess.run(
+            args, capture_output=True, check=True, text=True
+        ).stdout.split()
+
+    iterations = 10
+    for name, statement in IMPORTS.items():
+        us = sum(float(run(statement, False)[0]) for _ in range(iterations))
+        bytes = int(run(statement, True)[1])
+        report(f"{name}_process", us / iterations, bytes)
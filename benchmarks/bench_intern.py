@@ -0,0 +1,34 @@
+from harness import measure
+
+from udataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class Key:
+    channel: int = field()
+    unit: int = field()
+
+
+@dataclass(frozen=True, intern=True)
+class InternedKey:
+    channel: int = field()
+    unit: int = field()
+
+
+KEY_COUNT = 1000
+DISTINCT_KEYS = 10
+
+
+def bench_intern() -> None:
+    for cls in (Key, InternedKey):
+        params = {"cls": cls.__name__}
+        # Keeps the interned instance alive, so that construction finds it.
+        a = cls(unit=1, channel=2)
+        measure("intern_construct", lambda: cls(unit=1, channel=2), 1000, **params)
+        b = cls(unit=1, channel=2)
+        measure("intern_eq", lambda: a == b, 1000, **params)
+
+        def many() -> None:
+            [cls(unit=i % DISTINCT_KEYS, channel=0) for i in range(KEY_COUNT)]
+
+        measure("intern_many", many, 10, keys=KEY_COUNT, **params)
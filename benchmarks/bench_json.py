@@ -0,0 +1,41 @@
+import json
+
+from harness import measure
+
+from udataclasses import asdict, dataclass, field
+
+try:
+    from typing import Any
+except ImportError:
+    pass
+
+
+@dataclass
+class Point:
+    x: float = 0.0
+    y: float = 0.0
+
+
+@dataclass
+class Track:
+    name: str = field(default="")
+    points: list[Point] = field(default_factory=list)
+
+
+class NullStream:
+    """Discards its input, like a socket or UART."""
+
+    def write(self, data: Any) -> None:
+        pass
+
+
+def bench_json() -> None:
+    stream = NullStream()
+    for count in (1, 10, 100):
+        track = Track(name="track", points=[Point(x=i, y=i) for i in range(count)])
+        measure(
+            "json_dumps_asdict",
+            lambda: stream.write(json.dumps(asdict(track))),
+            points=count,
+        )
+        measure("json_write_json", lambda: track.write_json(stream), points=count)
@@ -0,0 +1,230 @@
+"""Core dataclass operations across field counts.
+
+On CPython, each benchmark is also run with the standard library's dataclasses
+module as a baseline. Results are tagged with the implementation that was used.
+Methods of classes with the same fields are compiled only once by udataclasses,
+so op_decorate measures decorating a class whose methods are already compiled.
+"""
+
+from harness import measure
+
+import udataclasses
+from udataclasses.decorator import methods_cache
+
+try:
+    from typing import Any
+except ImportError:
+    pass
+
+FIELD_COUNTS = (1, 10, 50, 200)
+
+IMPLEMENTATIONS: list[Any] = [udataclasses]
+try:
+    import dataclasses
+
+    IMPLEMENTATIONS.append(dataclasses)
+except ImportError:
+    # MicroPython
+    pass
+
+
+def make_class(impl: Any, field_count: int) -> type[Any]:
+    """Creates a new, undecorated class with field_count fields."""
+    namespace: dict[str, Any] = {
+        f"f{i}": impl.field(default=i) for i in range(field_count)
+    }
+    # Only needed by the standard library.
+    namespace["__annotations__"] = {f"f{i}": int for i in range(field_count)}
+    namespace["__module__"] = "bench_operations"
+    return type(f"Class{field_count}", (), namespace)
+
+
+def make_dataclass(impl: Any, field_count: int, **kwargs: Any) -> type[Any]:
+    return impl.make_dataclass(  # type: ignore[no-any-return]
+        f"Class{field_count}",
+        [(f"f{i}", int, impl.field(default=i)) for i in range(field_count)],
+        **kwargs,
+    )
+
+
+def values(field_count: int) -> dict[str, int]:
+    return {f"f{i}": i for i in range(field_count)}
+
+
+def bench_decorate() -> None:
+    for impl in IMPLEMENTATIONS:
+        for count in FIELD_COUNTS:
+            # Exclude compiling the methods of a new shape of class from the
+            # results. That is measured by op_decorate_uncached below.
+            impl.dataclass(make_class(impl, count))
+            measure(
+                "op_decorate",
+                lambda: impl.dataclass(make_class(impl, count)),
+                iterations=10,
+                impl=impl.__name__,
+                fields=count,
+            )
+
+
+def bench_decorate_uncached() -> None:
+    def decorate() -> None:
+        methods_cache.clear()
+        udataclasses.dataclass(make_class(udataclasses, count))
+
+    for count in FIELD_COUNTS:
+        measure(
+            "op_decorate_uncached",
+            decorate,
+            iterations=10,
+            impl=udataclasses.__name__,
+            fields=count,
+        )
+
+
+def bench_decorate_lazy_uncached() -> None:
+    def decorate() -> None:
+        methods_cache.clear()
+        udataclasses.dataclass(make_class(udataclasses, count), lazy=True)
+
+    for count in FIELD_COUNTS:
+        measure(
+            "op_decorate_lazy_uncached",
+            decorate,
+            iterations=10,
+            impl=udataclasses.__name__,
+            fields=count,
+        )
+
+
+def bench_make_dataclass() -> None:
+    for impl in IMPLEMENTATIONS:
+        for count in FIELD_COUNTS:
+            measure(
+                "op_make_dataclass",
+                lambda: make_dataclass(impl, count),
+                iterations=10,
+                impl=impl.__name__,
+                fields=count,
+            )
+
+
+def bench_instantiate() -> None:
+    for impl in IMPLEMENTATIONS:
+        for count in FIELD_COUNTS:
+            cls = make_dataclass(impl, count)
+            kwargs = values(count)
+            measure(
+                "op_instantiate",
+                lambda: cls(**kwargs),
+                impl=impl.__name__,
+                fields=count,
+            )
+
+
+def bench_instantiate_positional() -> None:
+    for impl in IMPLEMENTATIONS:
+        for count in FIELD_COUNTS:
+            names = tuple(f"f{i}" for i in range(count))
+            kwargs = {}
+            if impl is udataclasses:
+                kwargs["positional"] = names
+            cls = make_dataclass(impl, count, **kwargs)
+            # Field names sort differently from their declaration order, so
+            # _make() and __init__ take the same values in a different order.
+            args = tuple(values(count).values())
+            make_args = tuple(int(name[1:]) for name in sorted(names))
+            params = {"impl": impl.__name__, "fields": count}
+            measure("op_instantiate_positional", lambda: cls(*args), **params)
+            if impl is udataclasses:
+                measure("op_make", lambda: cls._make(*make_args), **params)
+
+
+def bench_get_set() -> None:
+    for impl in IMPLEMENTATIONS:
+        for count in FIELD_COUNTS:
+            obj = make_dataclass(impl, count)(**values(count))
+
+            def get() -> None:
+                for _ in range(100):
+                    obj.f0
+
+            def set() -> None:
+                for _ in range(100):
+                    obj.f0 = 1
+
+            measure("op_get_x100", get, impl=impl.__name__, fields=count)
+            measure("op_set_x100", set, impl=impl.__name__, fields=count)
+
+
+def bench_compare() -> None:
+    for impl in IMPLEMENTATIONS:
+        for count in FIELD_COUNTS:
+            cls = make_dataclass(impl, count, order=True, frozen=True)
+            x = cls(**values(count))
+            y = cls(**values(count))
+            params = {"impl": impl.__name__, "fields": count}
+            measure("op_eq", lambda: x == y, iterations=1000, **params)
+            measure("op_lt", lambda: x < y, iterations=1000, **params)
+            measure("op_hash", lambda: hash(x), iterations=1000, **params)
+
+
+def bench_sort() -> None:
+    size = 1000
+    for impl in IMPLEMENTATIONS:
+        for count in (1, 10):
+            cls = make_dataclass(impl, count, order=True, frozen=True)
+            # Only the last field differs, so every field is compared.
+            objects = [
+                cls(**{**values(count), f"f{count - 1}": (i * 7919) % size})
+                for i in range(size)
+            ]
+            target = objects[-1]
+            params = {"impl": impl.__name__, "fields": count, "size": size}
+            measure("op_sort", lambda: sorted(objects), iterations=10, **params)
+            # Counting compares every object with ==, as deduplication does.
+            measure("op_count", lambda: objects.count(target), iterations=10, **params)
+
+
+def bench_lookup() -> None:
+    size = 1000
+    for impl in IMPLEMENTATIONS:
+        for count in (1, 3, 10):
+            cls = make_dataclass(impl, count, frozen=True)
+            keys = [cls(**{**values(count), f"f{count - 1}": i}) for i in range(size)]
+            table = {key: i for i, key in enumerate(keys)}
+            # Equal but distinct instances, as when keys are parsed from
+            # messages, so every lookup hashes a key and compares it.
+            lookups = [
+                cls(**{**values(count), f"f{count - 1}": i}) for i in range(size)
+            ]
+
+            def run() -> None:
+                for key in lookups:
+                    table[key]
+
+            params = {"impl": impl.__name__, "fields": count, "size": size}
+            measure("op_lookup", run, iterations=10, **params)
+
+
+def bench_asdict() -> None:
+    for impl in IMPLEMENTATIONS:
+        for count in FIELD_COUNTS:
+            obj = make_dataclass(impl, count)(**values(count))
+            measure(
+                "op_asdict",
+                lambda: impl.asdict(obj),
+                impl=impl.__name__,
+                fields=count,
+            )
+
+
+def bench_replace() -> None:
+    for impl in IMPLEMENTATIONS:
+        for count in FIELD_COUNTS:
+            obj = make_dataclass(impl, count, frozen=True)(**values(count))
+            measure(
+                "op_replace",
+                lambda: impl.replace(obj, f0=1),
+                impl=impl.__name__,
+                fields=count,
+            )
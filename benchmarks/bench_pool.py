@@ -0,0 +1,26 @@
+from harness import measure
+
+from udataclasses import Pool, dataclass, field
+
+
+@dataclass
+class Message:
+    payload: list[int] = field(default_factory=list)
+    sequence: int = field(default=0)
+    status: str = field(default="new")
+
+
+def bench_pool() -> None:
+    pool = Pool(Message, 4)
+
+    def acquire_release() -> None:
+        pool.release(pool.acquire())
+
+    measure("pool_construct", lambda: Message(), iterations=1000)
+    measure("pool_acquire_release", acquire_release, iterations=1000)
+    debug_pool = Pool(Message, 4, debug=True)
+
+    def acquire_release_debug() -> None:
+        debug_pool.release(debug_pool.acquire())
+
+    measure("pool_acquire_release_debug", acquire_release_debug, iterations=1000)
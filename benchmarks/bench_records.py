@@ -0,0 +1,44 @@
+from harness import measure
+
+from udataclasses import RecordArray, dataclass, field
+
+
+@dataclass(frozen=True, storage="tuple")
+class Sample:
+    sequence: int = field(format="<I")
+    temperature: float = field(format="<f")
+    timestamp: int = field(format="<I")
+
+
+SAMPLE_COUNT = 100
+
+
+def bench_records_storage() -> None:
+    samples = [
+        Sample(sequence=i, temperature=20.0, timestamp=i) for i in range(SAMPLE_COUNT)
+    ]
+
+    def store_list() -> None:
+        [Sample(sequence=s.sequence, temperature=0.0, timestamp=0) for s in samples]
+
+    def store_records() -> None:
+        records = RecordArray(Sample, SAMPLE_COUNT)
+        for sample in samples:
+            records.append(sample)
+
+    params = {"samples": SAMPLE_COUNT}
+    measure("records_store_list", store_list, iterations=10, **params)
+    measure("records_store_array", store_records, iterations=10, **params)
+
+
+def bench_records_access() -> None:
+    records = RecordArray(Sample, SAMPLE_COUNT, ring=True)
+    sample = Sample(sequence=1, temperature=20.0, timestamp=2)
+    for _ in range(SAMPLE_COUNT):
+        records.append(sample)
+    temperatures = records.columns["temperature"]
+
+    measure("records_append_ring", lambda: records.append(sample), iterations=1000)
+    measure("records_view", lambda: records[-1].temperature, iterations=1000)
+    measure("records_get", lambda: records.get(-1), iterations=1000)
+    measure("records_sum_column", lambda: sum(temperatures), iterations=100)
@@ -0,0 +1,75 @@
+"""Timing and heap measurement helpers for both CPython and MicroPython."""
+
+import gc
+import json
+import sys
+
+try:
+    from time import ticks_diff, ticks_us  # type: ignore[attr-defined]
+except ImportError:
+    from time import perf_counter_ns
+
+    def ticks_us() -> int:
+        return perf_counter_ns() // 1000
+
+    def ticks_diff(end: int, start: int) -> int:
+        return end - start
+
+
+try:
+    from collections.abc import Callable
+    from typing import Any
+except ImportError:
+    pass
+
+try:
+    from gc import mem_alloc  # type: ignore[attr-defined]
+
+    def allocated_bytes(function: Callable[[], Any]) -> int:
+        """Bytes allocated on the heap while running function."""
+        gc.collect()
+        gc.disable()
+        try:
+            before = mem_alloc()
+            function()
+            return int(mem_alloc() - before)
+        finally:
+            gc.enable()
+
+except ImportError:
+    import tracemalloc
+
+    def allocated_bytes(function: Callable[[], Any]) -> int:
+        """Peak bytes allocated on the heap while running function."""
+        gc.collect()
+        tracemalloc.start()
+        try:
+            function()
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+
+def elapsed_us(function: Callable[[], Any], iterations: int) -> float:
+    """Average wall time in microseconds of calling function."""
+    start = ticks_us()
+    for _ in range(iterations):
+        function()
+    return ticks_diff(ticks_us(), start) / iterations
+
+
+def measure(
+    name: str, function: Callable[[], Any], iterations: int = 100, **params: Any
+) -> None:
+    """Measures time and heap usage of function and prints a JSON result line."""
+    us = elapsed_us(function, iterations)
+    report(name, us, allocated_bytes(function), **params)
+
+
+def report(name: str, us: float, bytes: int, **params: Any) -> None:
+    """Prints a JSON result line for a measurement made by the caller."""
+    result: dict[str, Any] = {"benchmark": name, "runtime": sys.implementation.name}
+    result.update(params)
+    result["us"] = us
+    result["bytes"] = bytes
+    print(json.dumps(result))
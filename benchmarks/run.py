@@ -0,0 +1,44 @@
+"""Runs every benchmark and prints one JSON line per result.
+
+Works under both CPython and MicroPython, with ``src`` and ``benchmarks`` on the
+import path::
+
+    PYTHONPATH=src:benchmarks python benchmarks/run.py
+    MICROPYPATH=src:benchmarks micropython benchmarks/run.py
+
+Optional arguments restrict the run to benchmark files containing any of the
+given strings.
+"""
+
+import os
+import sys
+
+try:
+    from typing import Any
+except ImportError:
+    pass
+
+
+def run_benchmarks(path: str) -> None:
+    bench_globals: dict[str, Any] = {}
+    with open(path, "rt") as f:
+        exec(f.read(), bench_globals)
+
+    for name, bench_function in bench_globals.items():
+        if name.startswith("bench_") and callable(bench_function):
+            bench_function()
+
+
+def main() -> None:
+    benchmarks_dir = __file__.rsplit("/", 1)[0] if "/" in __file__ else "."
+    filters = sys.argv[1:]
+    for name in sorted(os.listdir(benchmarks_dir)):
+        if not name.startswith("bench_"):
+            continue
+        if filters and not any(f in name for f in filters):
+            continue
+        run_benchmarks(f"{benchmarks_dir}/{name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,75 @@
+from sys import modules as _modules
+
 from .constants import MISSING
 from .decorator import dataclass
 from .field import Field, FrozenInstanceError, field
-from .functions import asdict, astuple, fields, is_dataclass, make_dataclass, replace
+from .footprint import Footprint, footprint
 
 VERSION = "0.0.0"
 """Read and written by the ``hatch version`` command."""
 
 __all__ = [
     "Field",
+    "Footprint",
     "FrozenInstanceError",
     "MISSING",
+    "Pool",
+    "RecordArray",
     "asdict",
     "astuple",
+    "build_iter",
+    "build_many",
     "dataclass",
     "field",
     "fields",
+    "footprint",
+    "fromdict",
     "is_dataclass",
     "make_dataclass",
     "replace",
 ]
+
+_LAZY_MODULES = {
+    "Pool": "pool",
+    "RecordArray": "records",
+    "asdict": "functions",
+    "astuple": "functions",
+    "build_iter": "functions",
+    "build_many": "functions",
+    "fields": "functions",
+    "fromdict": "functions",
+    "is_dataclass": "functions",
+    "make_dataclass": "functions",
+    "replace": "functions",
+}
+"""Submodule defining each name that is only imported on first access.
+
+``from udataclasses import dataclass, field`` then only imports the modules
+needed by the decorator. The footprint module is imported eagerly, as the
+decorator depends on it. On MicroPython ports built without
+MICROPY_MODULE_GETATTR, all of them are imported eagerly instead.
+"""
+
+
+def __getattr__(name: str) -> object:
+    if name == "_LAZY_SUPPORTED":
+        return True
+    module_name = _LAZY_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module 'udataclasses' has no attribute '{name}'")
+    module = __import__(f"udataclasses.{module_name}", None, None, (name,))
+    value = getattr(module, name)
+    # Later lookups find the value without calling __getattr__.
+    globals()[name] = value
+    return value
+
+
+def _import_lazy_names(module: object) -> None:
+    """Imports all lazy names if the module doesn't support __getattr__."""
+    if getattr(module, "_LAZY_SUPPORTED", False):
+        return
+    for name in _LAZY_MODULES:
+        __getattr__(name)
+
+
+_import_lazy_names(_modules[__name__])
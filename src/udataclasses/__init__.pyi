@@ -3,25 +3,42 @@
 Inspired by: https://github.com/python/typeshed/blob/main/stdlib/dataclasses.pyi#L36-L44
 """
 
-from collections.abc import Callable
-from typing import Any, Generic, TypeVar, dataclass_transform, overload
+from collections.abc import Callable, Iterator
+from typing import Any, Generic, Literal, TypeVar, dataclass_transform, overload
 
 from .constants import MISSING
 from .field import Field, FrozenInstanceError
-from .functions import astuple, fields, is_dataclass, make_dataclass, replace
+from .footprint import Footprint, footprint
+from .functions import (
+    astuple,
+    build_iter,
+    build_many,
+    fields,
+    fromdict,
+    is_dataclass,
+    make_dataclass,
+    replace,
+)
 
 T = TypeVar("T")
 R = TypeVar("R")
 
 __all__ = [
     "Field",
+    "Footprint",
     "FrozenInstanceError",
     "MISSING",
+    "Pool",
+    "RecordArray",
     "asdict",
     "astuple",
+    "build_iter",
+    "build_many",
     "dataclass",
     "field",
     "fields",
+    "footprint",
+    "fromdict",
     "is_dataclass",
     "make_dataclass",
     "replace",
@@ -46,6 +63,13 @@ def dataclass(
     order: bool = ...,
     unsafe_hash: bool = ...,
     frozen: bool = ...,
+    storage: Literal["property", "plain", "tuple"] = ...,
+    slots: bool = ...,
+    cache_hash: bool = ...,
+    cache_asdict: bool = ...,
+    lazy: bool = ...,
+    positional: tuple[str, ...] = ...,
+    intern: bool = ...,
 ) -> Callable[[type[T]], type[T]]: ...
 
 # Overload that infers type from ``default``
@@ -57,6 +81,8 @@ def field(
     repr: bool = ...,
     hash: bool | None = ...,
     compare: bool = ...,
+    format: str | None = ...,
+    type: type[Any] = ...,
 ) -> T: ...
 
 # Overload that infers type from ``default_factory``
@@ -68,6 +94,8 @@ def field(
     repr: bool = ...,
     hash: bool | None = ...,
     compare: bool = ...,
+    format: str | None = ...,
+    type: type[Any] = ...,
 ) -> T: ...
 
 # Overload with no default specified in any way.
@@ -78,8 +106,32 @@ def field(
     repr: bool = ...,
     hash: bool | None = ...,
     compare: bool = ...,
+    format: str | None = ...,
+    type: type[Any] = ...,
 ) -> Any: ...
 
+class Pool(Generic[T]):
+    size: int
+    debug: bool
+    def __init__(self, cls: type[T], size: int, *, debug: bool = False) -> None: ...
+    def __len__(self) -> int: ...
+    def acquire(self) -> T: ...
+    def release(self, obj: T) -> None: ...
+
+class RecordArray(Generic[T]):
+    cls: type[T]
+    capacity: int
+    ring: bool
+    columns: dict[str, Any]
+    def __init__(self, cls: type[T], capacity: int, *, ring: bool = False) -> None: ...
+    def __len__(self) -> int: ...
+    def __getitem__(self, index: int) -> Any: ...
+    def __iter__(self) -> Iterator[Any]: ...
+    def append(self, obj: T) -> None: ...
+    def physical_index(self, index: int) -> int: ...
+    def get(self, index: int) -> T: ...
+    def clear(self) -> None: ...
+
 # Overload with no `dict_factory` specified, which returns a simple dict.
 @overload
 def asdict(obj: T) -> dict[str, Any]: ...
@@ -0,0 +1,66 @@
+import sys
+
+from .constants import TYPE_CHECKING
+
+if TYPE_CHECKING or sys.implementation.name in ("micropython", "circuitpython"):
+    # Dicts don't preserve insertion order on these implementations.
+    from collections import OrderedDict
+else:
+    # Importing collections takes longer than the rest of the package on CPython.
+    OrderedDict = dict
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any, TypeAlias
+
+    MethodsFactory: TypeAlias = Callable[..., dict[str, Any]]
+
+
+class MethodsCache:
+    """Least-recently-used cache of compiled method factories.
+
+    Keyed by TransformSpec fingerprint, so that classes with the same shape
+    share the same compiled code, even if their default values differ.
+    """
+
+    maxsize: int
+    """Maximum number of factories to keep. 0 disables caching."""
+
+    hits: int
+    """Number of lookups that found a cached factory."""
+
+    misses: int
+    """Number of lookups that did not find a cached factory."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._factories: OrderedDict[str, MethodsFactory] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._factories)
+
+    def get(self, fingerprint: str) -> "MethodsFactory | None":
+        """Looks up a factory, marking it as the most recently used."""
+        factory = self._factories.pop(fingerprint, None)
+        if factory is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._factories[fingerprint] = factory
+        return factory
+
+    def put(self, fingerprint: str, factory: "MethodsFactory") -> None:
+        """Adds a factory, evicting the least recently used ones if needed."""
+        if self.maxsize <= 0:
+            return
+        self._factories[fingerprint] = factory
+        while len(self._factories) > self.maxsize:
+            self._factories.pop(next(iter(self._factories)))
+
+    def clear(self) -> None:
+        """Removes all factories and resets the counters."""
+        self._factories.clear()
+        self.hits = 0
+        self.misses = 0
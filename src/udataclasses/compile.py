@@ -0,0 +1,120 @@
+"""Ahead-of-time compiler for dataclass methods.
+
+Imports the given modules and writes a plain Python module containing the
+methods of every dataclass defined in them::
+
+    python -m udataclasses.compile mypackage.sensors mypackage.config -o udataclasses_precompiled.py
+
+The output module can be frozen into firmware or compiled with ``mpy-cross``.
+Importing it before the modules it was generated from lets ``@dataclass`` skip
+runtime code generation for those classes. Each set of methods is stamped with
+the fingerprint of the class it was generated from. Classes whose fingerprint
+doesn't match, e.g. because their fields changed after compilation, fall back to
+runtime generation.
+"""
+
+import sys
+
+from . import source
+from .constants import PARAMS_NAME, TYPE_CHECKING
+from .decorator import lazy_method_key, make_global_bindings
+from .transform_spec import TransformSpec
+
+if TYPE_CHECKING:
+    from typing import Any, Iterable
+
+
+def find_transforms(module: "Any") -> list[tuple[str, TransformSpec]]:
+    """Finds the dataclasses defined in a module.
+
+    Returns (qualified class name, TransformSpec) pairs.
+    """
+    module_name = module.__name__
+    transforms: list[tuple[str, TransformSpec]] = []
+    for name in sorted(dir(module)):
+        value = getattr(module, name)
+        if not isinstance(value, type):
+            continue
+        transform = value.__dict__.get(PARAMS_NAME)
+        if transform is None:
+            # Not a dataclass, or a non-dataclass subclass of a dataclass.
+            continue
+        transforms.append((f"{module_name}.{name}", transform))
+    return transforms
+
+
+def compile_module(modules: "Iterable[Any]") -> str:
+    """Generates a module of precompiled methods for dataclasses in the given modules."""
+    # Classes with identical fingerprints share a single factory.
+    classes: dict[str, list[str]] = {}
+    transforms: dict[str, TransformSpec] = {}
+    for module in modules:
+        for class_name, transform in find_transforms(module):
+            fingerprint = transform.fingerprint()
+            classes.setdefault(fingerprint, []).append(class_name)
+            transforms[fingerprint] = transform
+
+    lines = [
+        '"""Precompiled dataclass methods.',
+        "",
+        "Generated by `python -m udataclasses.compile`. Do not edit.",
+        '"""',
+        "",
+        "from udataclasses.decorator import register_precompiled",
+    ]
+    for i, fingerprint in enumerate(sorted(transforms)):
+        transform = transforms[fingerprint]
+        name = f"_methods_{i}"
+        params = sorted(make_global_bindings(transform))
+        lines.append("")
+        lines.append("")
+        lines.extend(f"# {class_name}" for class_name in classes[fingerprint])
+        lines.append(
+            source.factory(
+                name,
+                params,
+                source.class_properties(transform),
+                source.class_methods(transform),
+            )
+        )
+        lines.append("")
+        lines.append(f"register_precompiled({fingerprint!r}, {name})")
+        if not transform.lazy:
+            continue
+        # Methods of lazy dataclasses that are generated on first use.
+        for j, method_name in enumerate(source.special_methods(transform)):
+            lazy_name = f"{name}_{j}"
+            code = source.special_method(transform, method_name)
+            lines.append("")
+            lines.append("")
+            lines.append(source.factory(lazy_name, params, {}, {method_name: code}))
+            lines.append("")
+            key = lazy_method_key(fingerprint, method_name)
+            lines.append(f"register_precompiled({key!r}, {lazy_name})")
+    return "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    import argparse
+    import importlib
+
+    parser = argparse.ArgumentParser(
+        prog="python -m udataclasses.compile",
+        description="Ahead-of-time compiler for dataclass methods.",
+    )
+    parser.add_argument("modules", nargs="+", help="Modules to import.")
+    parser.add_argument(
+        "-o", "--output", help="Output file. Defaults to standard output."
+    )
+    args = parser.parse_args()
+
+    code = compile_module(importlib.import_module(name) for name in args.modules)
+    if args.output is None:
+        sys.stdout.write(code)
+        return
+    with open(args.output, "w") as f:
+        f.write(code)
+
+
+if __name__ == "__main__":
+    main()
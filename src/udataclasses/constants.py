@@ -1,11 +1,96 @@
+from sys import implementation as _implementation
+
+TYPE_CHECKING = False
+"""Guards imports only needed by type checkers, which treat it as True.
+
+Avoids importing typing at runtime, which is slow on CPython and fails after a
+search of the import path on MicroPython.
+"""
+
 FIELDS_NAME = "__dataclass_fields__"
 """Class attribute used to store dataclass fields."""
 
+FIELD_TUPLE_NAME = "__dataclass_field_tuple__"
+"""Class attribute used to store fields as a tuple sorted by name."""
+
+NAMES_NAME = "__dataclass_names__"
+"""Class attribute used to store the names of all fields, sorted."""
+
+INIT_NAMES_NAME = "__dataclass_init_names__"
+"""Class attribute used to store the names of fields with init=True, sorted."""
+
+COMPARE_NAMES_NAME = "__dataclass_compare_names__"
+"""Class attribute used to store the names of fields with compare=True, sorted."""
+
+HASH_NAMES_NAME = "__dataclass_hash_names__"
+"""Class attribute used to store the names of fields used by __hash__, sorted."""
+
+ASDICT_NAME = "__dataclass_asdict__"
+"""Class attribute used to store the generated asdict() converter."""
+
+WRITE_JSON_NAME = "__dataclass_write_json__"
+"""Class attribute used to store the generated write_json() method."""
+
+FROMDICT_NAME = "__dataclass_fromdict__"
+"""Class attribute used to store the generated fromdict() constructor."""
+
+BUILDERS_NAME = "__dataclass_builders__"
+"""Class attribute used to store the functions generated by build_many()."""
+
+PARAMS_NAME = "__dataclass_params__"
+"""Class attribute used to store the TransformSpec the class was generated from."""
+
+STORAGE_PROPERTY = "property"
+"""Field values are stored in underscore-prefixed attributes behind properties."""
+
+STORAGE_PLAIN = "plain"
+"""Field values are stored directly in attributes with the field's name."""
+
+STORAGE_TUPLE = "tuple"
+"""Field values of frozen instances are stored together in a single tuple."""
+
+VALUES_NAME = "__dataclass_values__"
+"""Instance attribute used to store the values tuple of tuple storage."""
+
+HASH_NAME = "__dataclass_hash__"
+"""Instance attribute used to store the hash computed with cache_hash=True."""
+
+DICT_NAME = "__dataclass_dict__"
+"""Instance attribute used to store the asdict() result with cache_asdict=True."""
+
+
+class _SlotsProbe:
+    __slots__ = ()
+
+
+try:
+    _SlotsProbe().attribute = None  # type: ignore[attr-defined]
+    SLOTS_SUPPORTED = False
+except AttributeError:
+    SLOTS_SUPPORTED = True
+"""False in environments like MicroPython, which ignore __slots__."""
+
+FOLD_HASHES = _implementation.name in ("micropython", "circuitpython")
+"""Whether generated __hash__ methods combine field hashes without a tuple.
+
+On these implementations, creating a tuple allocates heap memory, while
+arithmetic on small integers doesn't. CPython reuses freed tuples, and hashing
+one is faster than arithmetic in bytecode.
+"""
+
 FACTORY_SENTINEL = object()
 """Placeholder used in generated __init__ parameters for fields with a default_factory."""
 
-try:
-    # If enum is available, use it to define MISSING so that we can use it with
+SOURCE_VERSION = 28
+"""Version of the generated source code.
+
+Part of every TransformSpec fingerprint, so that precompiled methods are ignored
+after a change to the generated code. Increment whenever source.py changes its
+output.
+"""
+
+if TYPE_CHECKING:
+    # Type checkers see MISSING as an enum member, so that it can be used with
     # typing.Literal. Inspired by:
     # https://github.com/python/typeshed/blob/adde7cc3ac277953d558ba42dc0fbdb2e4565326/stdlib/dataclasses.pyi#L36-L44
     import enum
@@ -17,17 +102,18 @@ try:
     MISSING = MissingType.MISSING
     MissingLiteral: TypeAlias = Literal[MissingType.MISSING]
 
-except ImportError:
-    # Fallback to our own singleton type in environments like MicroPython
+else:
+    # At runtime, a plain singleton avoids importing enum and typing.
 
-    class MissingType:  # type: ignore[no-redef]
+    class MissingType:
         """Singleton type for MISSING value."""
 
-        def __repr__(self) -> str:
+        def __repr__(self):
             return "MISSING"
 
-        def __eq__(self, other: object) -> bool:
-            return other is self
+        def __reduce__(self):
+            # Copies and unpickled values are the MISSING singleton itself.
+            return "MISSING"
 
-    MISSING = MissingType()  # type: ignore[call-arg]
+    MISSING = MissingType()
     """Sentinel default value for fields without a default value."""
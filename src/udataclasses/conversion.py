@@ -0,0 +1,106 @@
+"""Helpers used by generated code to convert values to builtin types."""
+
+from .constants import ASDICT_NAME, FROMDICT_NAME, TYPE_CHECKING, WRITE_JSON_NAME
+
+if TYPE_CHECKING:
+    from typing import Any
+
+SIMPLE_TYPES = {int, float, bool, bytes, str, type(None)}
+"""Types that asdict() copies over without recursion."""
+
+try:
+    SIMPLE_TYPES.add(complex)
+except NameError:
+    # Some MicroPython ports are built without complex number support.
+    pass
+
+
+def asdict_value(obj: object, dict_factory: "Any") -> "Any":
+    """Internal helper for asdict.
+
+    Converts obj into a for storing into asdict entries, recursing to find
+    nested dataclass instances as needed."""
+    if type(obj) in SIMPLE_TYPES:
+        return obj
+    converter = getattr(type(obj), ASDICT_NAME, None)
+    if converter is not None:
+        return converter(obj, dict_factory)
+    if isinstance(obj, (list, tuple)):
+        return (type(obj))(asdict_value(item, dict_factory) for item in obj)
+    if isinstance(obj, dict):
+        return {
+            asdict_value(key, dict_factory): asdict_value(value, dict_factory)
+            for key, value in obj.items()
+        }
+    raise TypeError(f"Unsupported type: {type(obj)}")
+
+
+def fromdict_value(value: "Any", cls: "Any") -> "Any":
+    """Internal helper for fromdict.
+
+    Converts a dict into an instance of the dataclass cls. Lists and tuples are
+    converted item by item. Other values, e.g. None, are returned as-is.
+    """
+    if isinstance(value, dict):
+        return getattr(cls, FROMDICT_NAME)(value)
+    if isinstance(value, (list, tuple)):
+        items = [fromdict_value(item, cls) for item in value]
+        return items if type(value) is list else (type(value))(items)
+    return value
+
+
+JSON_KEY_TYPES = {int, float, bool, str, type(None)}
+"""Types of dict keys that json.dumps() accepts."""
+
+
+def write_json_value(obj: object, stream: "Any") -> None:
+    """Internal helper for write_json.
+
+    Writes obj to the stream as JSON, with the same output as json.dumps() of
+    the value asdict() would produce for obj.
+    """
+    t = type(obj)
+    if t is int:
+        stream.write(str(obj))
+        return
+    if t is float and obj - obj == 0:  # type: ignore[operator]
+        # Finite floats are written like their repr(), but NaN and infinities
+        # need special handling by json.dumps().
+        stream.write(repr(obj))
+        return
+    if t in SIMPLE_TYPES:
+        # json is only imported when needed, as it is slow to import.
+        from json import dumps
+
+        stream.write(dumps(obj))
+        return
+    if getattr(t, ASDICT_NAME, None) is not None:
+        getattr(obj, WRITE_JSON_NAME)(stream)
+        return
+    write = stream.write
+    if isinstance(obj, (list, tuple)):
+        write("[")
+        separator = ""
+        for item in obj:
+            write(separator)
+            write_json_value(item, stream)
+            separator = ", "
+        write("]")
+        return
+    if isinstance(obj, dict):
+        from json import dumps
+
+        write("{")
+        separator = ""
+        for key, value in obj.items():
+            if type(key) not in JSON_KEY_TYPES:
+                raise TypeError(f"Unsupported key type: {type(key)}")
+            write(separator)
+            # json.dumps() converts non-string keys to strings.
+            write(dumps(key if type(key) is str else dumps(key)))
+            write(": ")
+            write_json_value(value, stream)
+            separator = ", "
+        write("}")
+        return
+    raise TypeError(f"Unsupported type: {type(obj)}")
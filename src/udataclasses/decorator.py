@@ -1,23 +1,66 @@
 from . import source
-from .constants import FACTORY_SENTINEL, FIELDS_NAME, MISSING
+from .cache import MethodsCache
+from .constants import (
+    BUILDERS_NAME,
+    COMPARE_NAMES_NAME,
+    DICT_NAME,
+    FACTORY_SENTINEL,
+    FIELD_TUPLE_NAME,
+    FIELDS_NAME,
+    FOLD_HASHES,
+    HASH_NAME,
+    HASH_NAMES_NAME,
+    INIT_NAMES_NAME,
+    MISSING,
+    NAMES_NAME,
+    PARAMS_NAME,
+    SLOTS_SUPPORTED,
+    STORAGE_PLAIN,
+    STORAGE_PROPERTY,
+    STORAGE_TUPLE,
+    TYPE_CHECKING,
+    VALUES_NAME,
+)
+from .conversion import (
+    SIMPLE_TYPES,
+    asdict_value,
+    fromdict_value,
+    write_json_value,
+)
 from .field import FrozenInstanceError
+from .footprint import heap_allocated
 from .transform_spec import TransformSpec
 
-try:
+if TYPE_CHECKING:
     from collections.abc import Callable
     from typing import Any, TypeVar
 
+    from .cache import MethodsFactory
+
     T = TypeVar("T")
-except ImportError:
-    pass
+
+methods_cache = MethodsCache(maxsize=32)
+"""Compiled methods shared between classes with the same fingerprint."""
+
+_precompiled: "dict[str, MethodsFactory]" = {}
+"""Precompiled method factories, keyed by TransformSpec fingerprint."""
+
+
+def register_precompiled(fingerprint: str, factory: "MethodsFactory") -> None:
+    """Registers methods generated ahead-of-time by ``udataclasses.compile``.
+
+    Classes decorated afterwards whose TransformSpec has the given fingerprint
+    use the factory instead of generating their methods at runtime.
+    """
+    _precompiled[fingerprint] = factory
 
 
 def dataclass(
-    cls: type[T] | None = None, **kwargs: Any
-) -> type[T] | Callable[[type[T]], type[T]]:
+    cls: "type[T] | None" = None, **kwargs: "Any"
+) -> "type[T] | Callable[[type[T]], type[T]]":
     """Decorator to transform a normal class into a dataclass."""
 
-    def wrapper(cls: type[T]) -> type[T]:
+    def wrapper(cls: "type[T]") -> "type[T]":
         return _dataclass(cls, **kwargs)
 
     if cls is None:
@@ -29,7 +72,7 @@ def dataclass(
 
 
 def _dataclass(
-    cls: type[T],
+    cls: "type[T]",
     *,
     init: bool = True,
     repr: bool = True,
@@ -37,7 +80,15 @@ def _dataclass(
     order: bool = False,
     unsafe_hash: bool = False,
     frozen: bool = False,
-) -> type[T]:
+    storage: str = STORAGE_PROPERTY,
+    slots: bool = False,
+    cache_hash: bool = False,
+    cache_asdict: bool = False,
+    lazy: bool = False,
+    positional: tuple[str, ...] = (),
+    intern: bool = False,
+) -> "type[T]":
+    start = heap_allocated()
     transform = TransformSpec(
         cls,
         init=init,
@@ -46,56 +97,281 @@ def _dataclass(
         order=order,
         unsafe_hash=unsafe_hash,
         frozen=frozen,
+        storage=storage,
+        cache_hash=cache_hash,
+        cache_asdict=cache_asdict,
+        lazy=lazy,
+        positional=positional,
+        intern=intern,
     )
+    if intern:
+        # Imported on first use, as weakref isn't otherwise needed.
+        from .intern import make_intern_table
 
-    for name, value in make_methods(transform).items():
+        transform.intern_table = make_intern_table()
+
+    if storage == STORAGE_PLAIN:
+        remove_field_specifiers(cls, transform)
+
+    methods = make_methods(transform)
+    for name, value in methods.items():
         setattr(cls, name, value)
+    generated = list(methods)
+    if (cache_hash or cache_asdict) and "__getstate__" not in cls.__dict__:
+        setattr(cls, "__getstate__", getstate_without_caches)
+        generated.append("__getstate__")
+    if intern and "__reduce__" not in cls.__dict__:
+        from .intern import reduce_interned
+
+        setattr(cls, "__reduce__", reduce_interned)
+        generated.append("__reduce__")
 
     # Store fields metadata
-    setattr(cls, FIELDS_NAME, {f.name: f for f in transform.fields})
+    fields = tuple(transform.fields)
+    setattr(cls, FIELDS_NAME, {f.name: f for f in fields})
+    setattr(cls, FIELD_TUPLE_NAME, fields)
+    setattr(cls, NAMES_NAME, tuple(f.name for f in fields))
+    setattr(cls, INIT_NAMES_NAME, tuple(f.name for f in fields if f.init))
+    setattr(cls, COMPARE_NAMES_NAME, tuple(f.name for f in fields if f.compare))
+    setattr(
+        cls, HASH_NAMES_NAME, tuple(f.name for f in fields if f.contributes_to_hash)
+    )
+    setattr(cls, PARAMS_NAME, transform)
+
+    if slots and SLOTS_SUPPORTED:
+        cls = add_slots(cls, transform)
+    if lazy:
+        # Installed after add_slots(), as the stubs refer to the final class.
+        for name in source.special_methods(transform):
+            setattr(cls, name, lazy_method_stub(cls, transform, name))
+            generated.append(name)
+    transform.generated = tuple(generated)
+    if start is not None:
+        transform.decoration_bytes = (heap_allocated() or 0) - start
     return cls
 
 
-def make_global_bindings(transform: TransformSpec) -> dict[str, Any]:
+def getstate_without_caches(self: "Any") -> "Any":
+    """__getstate__ of classes with cache_hash or cache_asdict.
+
+    Copies and pickles don't include the cached values. A cached hash is only
+    valid in the process that computed it, as hashes of str and bytes differ
+    between processes.
+    """
+    state: Any = object.__getstate__(self)
+    slots = None
+    if isinstance(state, tuple):
+        state, slots = state
+        slots = {k: v for k, v in slots.items() if k not in (HASH_NAME, DICT_NAME)}
+    if state:
+        state = {k: v for k, v in state.items() if k not in (HASH_NAME, DICT_NAME)}
+    return state if slots is None else (state or None, slots)
+
+
+def add_slots(cls: "type[T]", transform: TransformSpec) -> "type[T]":
+    """Recreates the class with __slots__ for each field's storage attribute."""
+    if "__slots__" in cls.__dict__:
+        raise TypeError(f"{cls.__name__} already specifies __slots__")
+    inherited: set[str] = set()
+    for base in cls.__mro__[1:]:
+        inherited.update(base.__dict__.get("__slots__", ()))
+
+    namespace = dict(cls.__dict__)
+    if transform.storage == STORAGE_TUPLE:
+        names = [VALUES_NAME]
+    else:
+        names = [source.attribute(f, transform.storage) for f in transform.fields]
+    if transform.cache_hash:
+        names.append(HASH_NAME)
+    if transform.cache_asdict:
+        names.append(DICT_NAME)
+    if transform.intern:
+        from .intern import WEAK_TABLES
+
+        # Instances must support weak references from the intern table.
+        weakref_inherited = any(
+            getattr(base, "__weakrefoffset__", 0) for base in cls.__bases__
+        )
+        if WEAK_TABLES and not weakref_inherited:
+            names.append("__weakref__")
+    slots: list[str] = []
+    for name in names:
+        if name not in inherited:
+            slots.append(name)
+        # Class attributes can't share a name with a slot.
+        namespace.pop(name, None)
+    namespace["__slots__"] = tuple(slots)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+
+    metaclass: Any = type(cls)
+    new_cls: type[T] = metaclass(cls.__name__, cls.__bases__, namespace)
+    new_cls.__qualname__ = cls.__qualname__
+    return new_cls
+
+
+def remove_field_specifiers(cls: type, transform: TransformSpec) -> None:
+    """Replaces field() class attributes with their default value, if any.
+
+    Without generated properties, these would otherwise be visible through
+    instances whose field has been deleted.
+    """
+    for field in transform.fields:
+        if field.name not in cls.__dict__:
+            continue
+        if field.default is MISSING:
+            delattr(cls, field.name)
+        else:
+            setattr(cls, field.name, field.default)
+
+
+def make_global_bindings(transform: TransformSpec) -> "dict[str, Any]":
     bindings: dict[str, Any] = {
         "FrozenInstanceError": FrozenInstanceError,
         "FACTORY_SENTINEL": FACTORY_SENTINEL,
+        "__dataclass_simple_types": SIMPLE_TYPES,
+        "__dataclass_asdict_value": asdict_value,
+        "__dataclass_write_json_value": write_json_value,
+        "__dataclass_fromdict_value": fromdict_value,
     }
+    if transform.hash:
+        bindings["__dataclass_fold_hashes"] = FOLD_HASHES
+    if transform.make or transform.intern:
+        bindings["__dataclass_object_new"] = object.__new__
+    if transform.intern:
+        bindings["__dataclass_intern_table"] = transform.intern_table
+        bindings["__dataclass_type"] = type
+    if transform.struct_format is not None:
+        import struct
+
+        bindings["__dataclass_pack"] = struct.pack
+        bindings["__dataclass_pack_into"] = struct.pack_into
+        bindings["__dataclass_unpack_from"] = struct.unpack_from
     for field in transform.fields:
         if field.default is not MISSING:
             bindings[field.default_value_name] = field.default
         if field.default_factory is not MISSING:
             bindings[field.default_value_name] = field.default_factory
+        if field.nested:
+            bindings[field.type_value_name] = field.type
     return bindings
 
 
-def make_methods(transform: TransformSpec) -> dict[str, Any]:
+def make_methods(transform: TransformSpec) -> "dict[str, Any]":
     global_bindings = make_global_bindings(transform)
-    methods: dict[str, Any] = {}
+    fingerprint = transform.fingerprint()
+    factory = _precompiled.get(fingerprint) or methods_cache.get(fingerprint)
+    if factory is None:
+        factory = make_factory(transform, list(global_bindings))
+        methods_cache.put(fingerprint, factory)
+    return factory(**global_bindings)
 
-    def add_method(code: str) -> None:
-        exec(code, global_bindings, methods)
 
-    for field in transform.fields:
-        add_method(source.getter(field))
-        add_method(source.setter(field, transform.frozen))
-        add_method(source.deleter(field, transform.frozen))
-
-    if transform.init:
-        add_method(source.init(transform.fields, post_init=transform.post_init))
-    if transform.repr:
-        add_method(source.repr(transform.fields))
-    if transform.eq:
-        add_method(source.eq(transform.fields))
-    if transform.order:
-        add_method(source.lt(transform.fields))
-        add_method(source.le(transform.fields))
-        add_method(source.gt(transform.fields))
-        add_method(source.ge(transform.fields))
-
-    if transform.hash is None:
-        methods["__hash__"] = None
-    if transform.hash:
-        add_method(source.hash(transform.fields))
+def make_factory(transform: TransformSpec, params: list[str]) -> "MethodsFactory":
+    """Compiles a function that creates all methods for the class.
+
+    All of the methods are compiled together in a single exec() call.
+    """
+    return compile_factory(
+        params, source.class_properties(transform), source.class_methods(transform)
+    )
+
+
+def compile_factory(
+    params: list[str], properties: dict[str, str], methods: dict[str, str]
+) -> "MethodsFactory":
+    name = "__dataclass_methods"
+    namespace: dict[str, Any] = {}
+    exec(source.factory(name, params, properties, methods), namespace)
+    return namespace[name]  # type: ignore[no-any-return]
+
+
+def lazy_method_key(fingerprint: str, name: str) -> str:
+    """Key of a lazily generated method in the methods cache."""
+    return f"{fingerprint}|{name}"
+
+
+def make_lazy_method(transform: TransformSpec, name: str) -> "Any":
+    """Generates one of the special methods of a lazy dataclass."""
+    global_bindings = make_global_bindings(transform)
+    key = lazy_method_key(transform.fingerprint(), name)
+    factory = _precompiled.get(key) or methods_cache.get(key)
+    if factory is None:
+        code = source.special_method(transform, name)
+        factory = compile_factory(list(global_bindings), {}, {name: code})
+        methods_cache.put(key, factory)
+    return factory(**global_bindings)[name]
+
+
+def lazy_method_stub(cls: type, transform: TransformSpec, name: str) -> "Any":
+    """Method that generates the real method on first call and replaces itself."""
+
+    def stub(self: "Any", *args: "Any") -> "Any":
+        method = make_lazy_method(transform, name)
+        setattr(cls, name, method)
+        return method(self, *args)
+
+    return stub
+
+
+def make_builders(cls: type, names: "tuple[str, ...] | None") -> "dict[str, Any]":
+    """Gets the build_many() and build_iter() functions for rows of given fields.
+
+    Functions are generated on first use, and stored on the class by field names.
+    names defaults to all fields with init=True.
+    """
+    transform: TransformSpec | None = cls.__dict__.get(PARAMS_NAME)
+    if transform is None:
+        raise TypeError(f"Expected a dataclass, got {cls}")
+    if names is None:
+        names = tuple(f.name for f in transform.fields if f.init)
+    builders: dict[tuple[str, ...], dict[str, Any]] | None = cls.__dict__.get(
+        BUILDERS_NAME
+    )
+    if builders is None:
+        builders = {}
+        setattr(cls, BUILDERS_NAME, builders)
+    functions = builders.get(names)
+    if functions is not None:
+        return functions
+
+    check_build_names(transform, names)
+    global_bindings = make_global_bindings(transform)
+    key = lazy_method_key(transform.fingerprint(), f"build({','.join(names)})")
+    factory = methods_cache.get(key)
+    if factory is None:
+        code = {
+            name: source.build(
+                transform.fields,
+                names,
+                transform.storage,
+                post_init=transform.post_init,
+                call_init=transform.custom_init or transform.intern,
+                generator=name == "build_iter",
+            )
+            for name in ("build_many", "build_iter")
+        }
+        factory = compile_factory(list(global_bindings), {}, code)
+        methods_cache.put(key, factory)
+    functions = factory(**global_bindings)
+    builders[names] = functions
+    return functions
+
 
-    return methods
+def check_build_names(transform: TransformSpec, names: "tuple[str, ...]") -> None:
+    """Validates the names of the fields given by each row to build_many()."""
+    by_name = {f.name: f for f in transform.fields}
+    for i, name in enumerate(names):
+        f = by_name.get(name)
+        if f is None:
+            raise TypeError(f"Unknown field: {name}")
+        if name in names[:i]:
+            raise ValueError(f"Duplicate field: {name}")
+        if not f.init:
+            raise ValueError(f"Cannot build field defined with init=False: {name}")
+    if transform.custom_init:
+        # The class's own __init__() decides which arguments are required.
+        return
+    for f in transform.fields:
+        if f.init and f.name not in names and not source.default_value(f):
+            raise TypeError(f"Missing field: {f.name}")
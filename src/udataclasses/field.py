@@ -1,14 +1,12 @@
-from .constants import MISSING
+from .constants import FROMDICT_NAME, MISSING, TYPE_CHECKING
 
-try:
+if TYPE_CHECKING:
     from collections.abc import Callable
     from typing import Any, TypeAlias
 
     from .constants import MissingLiteral
 
     DefaultFactory: TypeAlias = Callable[[], Any]
-except ImportError:
-    pass
 
 
 class FrozenInstanceError(AttributeError):
@@ -19,14 +17,23 @@ class FrozenInstanceError(AttributeError):
 
 def field(
     *,
-    default: Any | MissingLiteral = MISSING,
-    default_factory: DefaultFactory | MissingLiteral = MISSING,
+    default: "Any | MissingLiteral" = MISSING,
+    default_factory: "DefaultFactory | MissingLiteral" = MISSING,
     init: bool = True,
     repr: bool = True,
     hash: bool | None = None,
     compare: bool = True,
+    format: str | None = None,
+    type: "Any" = object,
 ) -> "Field":
-    """Function for explicitly declaring a field."""
+    """Function for explicitly declaring a field.
+
+    format is a :py:mod:`struct` format code for the field's value, e.g.
+    ``'<h'`` or ``'8s'``, used by the generated binary conversion methods.
+
+    type is the type of the field's value. If it is a dataclass, fromdict()
+    converts dicts, or lists or tuples of dicts, into instances of it.
+    """
     return Field(
         default=default,
         default_factory=default_factory,
@@ -34,6 +41,8 @@ def field(
         repr=repr,
         hash=hash,
         compare=compare,
+        format=format,
+        type=type,
     )
 
 
@@ -45,25 +54,28 @@ class Field:
 
     name: str
     type: type = object
-    default: Any | MissingLiteral
-    default_factory: DefaultFactory | MissingLiteral
+    default: "Any | MissingLiteral"
+    default_factory: "DefaultFactory | MissingLiteral"
     init: bool
     repr: bool
     hash: bool | None
     compare: bool
+    format: str | None
 
     init_only: bool
 
     def __init__(
         self,
         name: str = "<UNSET>",
-        default: Any = MISSING,
-        default_factory: DefaultFactory | MissingLiteral = MISSING,
+        default: "Any" = MISSING,
+        default_factory: "DefaultFactory | MissingLiteral" = MISSING,
         init: bool = True,
         repr: bool = True,
         hash: bool | None = None,
         compare: bool = True,
         init_only: bool = False,
+        format: str | None = None,
+        type: "Any" = object,
     ) -> None:
         self.name = name
         self.default = default
@@ -73,6 +85,8 @@ class Field:
         self.hash = hash
         self.compare = compare
         self.init_only = init_only
+        self.format = format
+        self.type = type
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, Field):
@@ -91,6 +105,16 @@ class Field:
         """Name to use for storing the default value as a global."""
         return f"__dataclass_default_{self.name}"
 
+    @property
+    def type_value_name(self) -> str:
+        """Name to use for storing the type as a global."""
+        return f"__dataclass_type_{self.name}"
+
+    @property
+    def nested(self) -> bool:
+        """True if the field's type is a dataclass, converted by fromdict()."""
+        return hasattr(self.type, FROMDICT_NAME)
+
     @property
     def contributes_to_hash(self) -> bool:
         """True if this field should contribute to generated __hash__() method."""
@@ -0,0 +1,206 @@
+"""Memory footprint introspection."""
+
+import sys
+
+from .constants import (
+    COMPARE_NAMES_NAME,
+    FIELD_TUPLE_NAME,
+    FIELDS_NAME,
+    HASH_NAMES_NAME,
+    INIT_NAMES_NAME,
+    NAMES_NAME,
+    PARAMS_NAME,
+    STORAGE_TUPLE,
+    TYPE_CHECKING,
+    VALUES_NAME,
+)
+from .source import attribute
+from .transform_spec import TransformSpec
+
+try:
+    from gc import mem_alloc  # type: ignore[attr-defined]
+except ImportError:
+    mem_alloc = None
+
+if TYPE_CHECKING:
+    from typing import Any
+
+NAME_TUPLES = (NAMES_NAME, INIT_NAMES_NAME, COMPARE_NAMES_NAME, HASH_NAMES_NAME)
+"""Class attributes holding tuples of field names."""
+
+
+def heap_allocated() -> int | None:
+    """Bytes currently allocated on the heap, or None if it can't be measured.
+
+    Uses gc.mem_alloc() on MicroPython. On CPython, memory is only measured while
+    tracemalloc is tracing, as tracing is too slow to enable by default.
+    """
+    if mem_alloc is not None:
+        return int(mem_alloc())
+    tracemalloc = sys.modules.get("tracemalloc")
+    if tracemalloc is not None and tracemalloc.is_tracing():
+        return int(tracemalloc.get_traced_memory()[0])
+    return None
+
+
+class Footprint:
+    """Memory used by a dataclass, and optionally one of its instances.
+
+    Byte counts are approximate, and are None if they can't be measured on the
+    current platform.
+    """
+
+    functions: int
+    """Number of generated functions, including property accessors."""
+
+    properties: int
+    """Number of generated properties."""
+
+    bytecode_bytes: int | None
+    """Total bytecode size of the generated functions. CPython only."""
+
+    bindings: int
+    """Number of values bound to the generated code, e.g. default values."""
+
+    bindings_bytes: int | None
+    """Size of the dict of bound values. CPython only."""
+
+    fields: int
+    """Number of fields."""
+
+    metadata_bytes: int | None
+    """Size of the Field objects and field name tuples. CPython only."""
+
+    decoration_bytes: int | None
+    """Heap allocated while decorating the class.
+
+    Measured with gc.mem_alloc() on MicroPython, and with tracemalloc on CPython
+    if it was tracing at the time.
+    """
+
+    instance_bytes: int | None
+    """Size of the instance and its storage, excluding field values.
+
+    None unless an instance was given.
+    """
+
+    def __init__(
+        self,
+        *,
+        functions: int,
+        properties: int,
+        bytecode_bytes: int | None,
+        bindings: int,
+        bindings_bytes: int | None,
+        fields: int,
+        metadata_bytes: int | None,
+        decoration_bytes: int | None,
+        instance_bytes: int | None,
+    ) -> None:
+        self.functions = functions
+        self.properties = properties
+        self.bytecode_bytes = bytecode_bytes
+        self.bindings = bindings
+        self.bindings_bytes = bindings_bytes
+        self.fields = fields
+        self.metadata_bytes = metadata_bytes
+        self.decoration_bytes = decoration_bytes
+        self.instance_bytes = instance_bytes
+
+    def __repr__(self) -> str:
+        names = (
+            "functions",
+            "properties",
+            "bytecode_bytes",
+            "bindings",
+            "bindings_bytes",
+            "fields",
+            "metadata_bytes",
+            "decoration_bytes",
+            "instance_bytes",
+        )
+        items = ", ".join(f"{name}={getattr(self, name)!r}" for name in names)
+        return f"Footprint({items})"
+
+
+def footprint(obj: object) -> Footprint:
+    """Reports the memory used by a dataclass or dataclass instance."""
+    from .decorator import make_global_bindings
+
+    cls = obj if isinstance(obj, type) else type(obj)
+    transform: TransformSpec | None = cls.__dict__.get(PARAMS_NAME)
+    if transform is None:
+        raise TypeError(f"Expected a dataclass, got {cls}")
+
+    functions: list[Any] = []
+    properties = 0
+    for name in transform.generated:
+        value = cls.__dict__.get(name)
+        if isinstance(value, property):
+            properties += 1
+            for accessor in ("fget", "fset", "fdel"):
+                function = getattr(value, accessor, None)
+                if function is not None:
+                    functions.append(function)
+        elif isinstance(value, classmethod):
+            functions.append(getattr(value, "__func__", value))
+        elif callable(value):
+            functions.append(value)
+
+    bindings = make_global_bindings(transform)
+    getsizeof = getattr(sys, "getsizeof", None)
+    bytecode_bytes = bindings_bytes = metadata_bytes = None
+    if getsizeof is not None:
+        bytecode_bytes = sum(len(f.__code__.co_code) for f in functions)
+        bindings_bytes = getsizeof(bindings)
+        metadata_bytes = getsizeof(getattr(cls, FIELDS_NAME)) + getsizeof(
+            getattr(cls, FIELD_TUPLE_NAME)
+        )
+        for f in transform.fields:
+            metadata_bytes += getsizeof(f) + getsizeof(f.__dict__)
+        for name in NAME_TUPLES:
+            metadata_bytes += getsizeof(getattr(cls, name))
+
+    return Footprint(
+        functions=len(functions),
+        properties=properties,
+        bytecode_bytes=bytecode_bytes,
+        bindings=len(bindings),
+        bindings_bytes=bindings_bytes,
+        fields=len(transform.fields),
+        metadata_bytes=metadata_bytes,
+        decoration_bytes=transform.decoration_bytes,
+        instance_bytes=None if obj is cls else instance_bytes(obj, transform),
+    )
+
+
+def instance_bytes(obj: "Any", transform: TransformSpec) -> int | None:
+    """Size of an instance and its storage, excluding field values."""
+    if transform.storage == STORAGE_TUPLE:
+        names = [VALUES_NAME]
+    else:
+        names = [attribute(f, transform.storage) for f in transform.fields]
+
+    getsizeof = getattr(sys, "getsizeof", None)
+    if getsizeof is not None:
+        size = int(getsizeof(obj))
+        if hasattr(obj, "__dict__"):
+            size += getsizeof(obj.__dict__)
+        if transform.storage == STORAGE_TUPLE:
+            size += getsizeof(getattr(obj, VALUES_NAME))
+        return size
+
+    # Measure the allocations needed to recreate the instance's storage.
+    start = heap_allocated()
+    if start is None:
+        return None
+    copy = object.__new__(type(obj))
+    for name in names:
+        if not hasattr(obj, name):
+            # Deleted field
+            continue
+        value = getattr(obj, name)
+        if transform.storage == STORAGE_TUPLE:
+            value = tuple(list(value))
+        setattr(copy, name, value)
+    return int(heap_allocated() or 0) - start
@@ -1,15 +1,20 @@
 """Module-level dataclasses functions."""
 
-from .constants import FIELDS_NAME
-from .decorator import _dataclass
+from .constants import (
+    ASDICT_NAME,
+    FIELD_TUPLE_NAME,
+    FIELDS_NAME,
+    FROMDICT_NAME,
+    STORAGE_PROPERTY,
+    TYPE_CHECKING,
+)
+from .decorator import _dataclass, make_builders
 from .field import Field
 
-try:
-    from typing import Any, Iterable, TypeVar
+if TYPE_CHECKING:
+    from typing import Any, Iterable, Iterator, TypeVar
 
     T = TypeVar("T")
-except ImportError:
-    pass
 
 
 def is_dataclass(obj: object) -> bool:
@@ -24,24 +29,15 @@ def fields(obj: object) -> tuple[Field, ...]:
     Fields are returned in alphabetical order by name.
     """
     cls = obj if isinstance(obj, type) else type(obj)
-    return tuple(sorted(getattr(cls, FIELDS_NAME).values(), key=lambda f: f.name))
+    return getattr(cls, FIELD_TUPLE_NAME)  # type: ignore[no-any-return]
 
 
-def replace(obj: T, **changes: Any) -> T:
+def replace(obj: "T", **changes: "Any") -> "T":
     """Create a new object with the specified fields replaced."""
-    fields = getattr(obj, FIELDS_NAME)
-    init_args = {f.name: getattr(obj, f.name) for f in fields.values() if f.init}
-    for name, new_value in changes.items():
-        field = fields.get(name)
-        if not field:
-            raise TypeError(f"Unknown field: {name}")
-        if not field.init:
-            raise ValueError(f"Cannot replace field defined with init=False: {name}")
-        init_args[name] = new_value
-    return (type(obj))(**init_args)
-
-
-def astuple(obj: object, *, tuple_factory: Any = tuple) -> Any:
+    return type(obj).__replace__(obj, **changes)  # type: ignore[attr-defined,no-any-return]
+
+
+def astuple(obj: object, *, tuple_factory: "Any" = tuple) -> "Any":
     """Intentionally unimplemented as we do not preserve field ordering."""
     raise NotImplementedError("astuple() is intentionally not implemented. ")
 
@@ -49,54 +45,78 @@ def astuple(obj: object, *, tuple_factory: Any = tuple) -> Any:
 def asdict(
     obj: object,
     *,
-    dict_factory: Any = dict,
-) -> Any:
-    """Convert dataclass instance to a dict."""
-    if not is_dataclass(obj):
+    dict_factory: "Any" = dict,
+) -> "Any":
+    """Convert dataclass instance to a dict.
+
+    If the class was decorated with ``cache_asdict=True``, calls with the default
+    dict_factory return the same dict every time. Don't modify it, or copy it
+    first, as later calls would return the modified dict.
+    """
+    converter = getattr(type(obj), ASDICT_NAME, None)
+    if converter is None:
         raise TypeError(f"Expected a dataclass, got an object of type {type(obj)}")
-    args: list[tuple[str, Any]] = []
-    for field in fields(obj):
-        name = field.name
-        value = getattr(obj, name)
-        args.append((name, asdict_value(value, dict_factory)))
-    return dict_factory(args)
-
-
-def asdict_value(obj: object, dict_factory: Any) -> Any:
-    """Internal helper for asdict.
-
-    Converts obj into a for storing into asdict entries, recursing to find
-    nested dataclass instances as needed."""
-
-    # Types that can simply be copied over without recursion.
-    simple_types = {int, float, bool, complex, bytes, str, type(None)}
-    if type(obj) in simple_types:
-        return obj
-    if is_dataclass(obj):
-        return asdict(obj, dict_factory=dict_factory)
-    if isinstance(obj, (list, tuple)):
-        return (type(obj))(asdict_value(item, dict_factory) for item in obj)
-    if isinstance(obj, dict):
-        return {
-            asdict_value(key, dict_factory): asdict_value(value, dict_factory)
-            for key, value in obj.items()
-        }
-    raise TypeError(f"Unsupported type: {type(obj)}")
+    return converter(obj, dict_factory)
+
+
+def fromdict(cls: "type[T]", data: "dict[str, Any]") -> "T":
+    """Create a dataclass instance from a dict, e.g. one returned by asdict().
+
+    Fields with a dataclass type, declared with ``field(type=...)``, are
+    converted recursively. Unknown keys raise TypeError.
+    """
+    constructor = getattr(cls, FROMDICT_NAME, None)
+    if constructor is None:
+        raise TypeError(f"Expected a dataclass, got {cls}")
+    return constructor(data)  # type: ignore[no-any-return]
+
+
+def build_many(
+    cls: "type[T]", rows: "Iterable[Any]", *, fields: "Iterable[str] | None" = None
+) -> "list[T]":
+    """Create a dataclass instance from each of many rows.
+
+    Rows are tuples or lists with the values of the given fields in order, or
+    dicts keyed by field name. fields defaults to all fields with init=True, in
+    alphabetical order. Other fields are assigned their default value. Dict
+    rows are converted as by fromdict(). Missing or unknown fields raise
+    TypeError.
+
+    Instances are created by a loop generated for the class and fields, without
+    calling __init__() unless the class defines its own.
+    """
+    names = None if fields is None else tuple(fields)
+    return make_builders(cls, names)["build_many"](cls, rows)  # type: ignore[no-any-return]
+
+
+def build_iter(
+    cls: "type[T]", rows: "Iterable[Any]", *, fields: "Iterable[str] | None" = None
+) -> "Iterator[T]":
+    """Like build_many(), but returns a generator of instances."""
+    names = None if fields is None else tuple(fields)
+    return make_builders(cls, names)["build_iter"](cls, rows)  # type: ignore[no-any-return]
 
 
 def make_dataclass(
     cls_name: str,
-    fields: Iterable[str | tuple[str, Any] | tuple[str, Any, Any]],
+    fields: "Iterable[str | tuple[str, Any] | tuple[str, Any, Any]]",
     *,
     bases: tuple[type, ...] = (),
-    namespace: dict[str, Any] | None = None,
+    namespace: "dict[str, Any] | None" = None,
     init: bool = True,
     repr: bool = True,
     eq: bool = True,
     order: bool = False,
     unsafe_hash: bool = False,
     frozen: bool = False,
-) -> type[Any]:
+    storage: str = STORAGE_PROPERTY,
+    slots: bool = False,
+    cache_hash: bool = False,
+    cache_asdict: bool = False,
+    lazy: bool = False,
+    positional: tuple[str, ...] = (),
+    intern: bool = False,
+) -> "type[Any]":
     """Dynamically create a dataclass."""
     # Attributes of dynamically-created class.
     attrs = dict(**(namespace or {}))
@@ -126,4 +146,11 @@ def make_dataclass(
         order=order,
         unsafe_hash=unsafe_hash,
         frozen=frozen,
+        storage=storage,
+        slots=slots,
+        cache_hash=cache_hash,
+        cache_asdict=cache_asdict,
+        lazy=lazy,
+        positional=positional,
+        intern=intern,
     )
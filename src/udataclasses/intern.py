@@ -0,0 +1,74 @@
+"""Tables of interned dataclass instances."""
+
+from collections import OrderedDict
+
+from .constants import INIT_NAMES_NAME, TYPE_CHECKING
+
+try:
+    from weakref import WeakValueDictionary
+except ImportError:
+    # MicroPython
+    WeakValueDictionary = None  # type: ignore[assignment,misc]
+
+if TYPE_CHECKING:
+    from typing import Any
+
+WEAK_TABLES = WeakValueDictionary is not None
+"""Whether tables hold weak references to instances, which requires weakref."""
+
+LRU_MAXSIZE = 256
+"""Number of instances kept by each table where weakref is unavailable."""
+
+
+class LRUTable:
+    """Least-recently-used table of interned instances.
+
+    Used instead of a WeakValueDictionary where weakref is unavailable, such as
+    on MicroPython. Instances stay alive while they are in the table.
+    """
+
+    maxsize: int
+    """Maximum number of instances to keep."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._items: OrderedDict[Any, Any] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, key: "Any") -> "Any":
+        """Looks up an instance, marking it as the most recently used."""
+        value = self._items.pop(key)
+        self._items[key] = value
+        return value
+
+    def __setitem__(self, key: "Any", value: "Any") -> None:
+        """Adds an instance, evicting the least recently used one if needed."""
+        self._items[key] = value
+        if len(self._items) > self.maxsize:
+            self._items.pop(next(iter(self._items)))
+
+
+def make_intern_table() -> "Any":
+    """Creates an empty table of interned instances for one dataclass."""
+    if WEAK_TABLES:
+        return WeakValueDictionary()
+    return LRUTable(LRU_MAXSIZE)
+
+
+def reduce_interned(self: "Any") -> "Any":
+    """__reduce__ of classes with intern=True.
+
+    The generated __new__ takes the __init__ arguments, so copies and pickles
+    call the class with the values of the init fields instead. Copies of an
+    interned instance are then the instance itself.
+    """
+    cls = type(self)
+    kwargs = {name: getattr(self, name) for name in getattr(cls, INIT_NAMES_NAME)}
+    return (new_interned, (cls, kwargs))
+
+
+def new_interned(cls: type, kwargs: "dict[str, Any]") -> "Any":
+    """Creates an interned instance when unpickling or copying it."""
+    return cls(**kwargs)
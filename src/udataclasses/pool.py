@@ -0,0 +1,99 @@
+"""Preallocated pools of dataclass instances."""
+
+from .constants import MISSING, PARAMS_NAME, TYPE_CHECKING
+from .source import attribute
+
+if TYPE_CHECKING:
+    from typing import Any
+
+
+class Pool:
+    """Fixed-size pool of preallocated instances of a dataclass.
+
+    All instances are created up front, so that acquiring and releasing them
+    doesn't allocate memory. Instances are created without calling __init__ and
+    are reset to their default values when released. Fields without a default
+    value must be assigned after acquiring an instance. A _reset method defined
+    by the class is used instead of the generated one.
+
+    In debug mode, the fields of released instances are deleted, so that reading
+    them raises AttributeError. Assigning a field of a released instance is
+    detected when the instance is acquired again. Releasing an instance twice,
+    or one that doesn't belong to the pool, raises ValueError.
+    """
+
+    size: int
+    """Total number of instances in the pool."""
+
+    debug: bool
+    """Whether to check for use of released instances."""
+
+    def __init__(self, cls: type, size: int, *, debug: bool = False) -> None:
+        transform = getattr(cls, PARAMS_NAME, None)
+        if transform is None:
+            raise TypeError(f"Expected a dataclass, got {cls!r}")
+        if transform.frozen:
+            raise ValueError("Instances of frozen dataclasses can't be pooled")
+        if not callable(getattr(cls, "_reset", None)):
+            raise TypeError(f"{cls.__name__} has a field named _reset")
+        self.size = size
+        self.debug = debug
+        self._cls = cls
+        self._attributes = [attribute(f, transform.storage) for f in transform.fields]
+        self._free: list[Any] = []
+        self._free_ids: set[int] = set()
+        self._all_ids: set[int] = set()
+        for _ in range(size):
+            obj: Any = object.__new__(cls)
+            obj._reset()
+            if debug:
+                self._all_ids.add(id(obj))
+                self._clear(obj)
+            self._free.append(obj)
+
+    def __len__(self) -> int:
+        """Number of instances available to acquire."""
+        return len(self._free)
+
+    def acquire(self) -> "Any":
+        """Takes an instance out of the pool.
+
+        Raises IndexError if all instances are in use.
+        """
+        if not self._free:
+            raise IndexError(f"All {self.size} instances are in use")
+        obj = self._free.pop()
+        if self.debug:
+            self._free_ids.discard(id(obj))
+            for name in self._attributes:
+                value = getattr(obj, name, MISSING)
+                # Plain storage fields may fall back to a class attribute.
+                if value is not MISSING and value is not getattr(
+                    self._cls, name, MISSING
+                ):
+                    raise RuntimeError(
+                        f"{self._cls.__name__} instance was modified after release"
+                    )
+            obj._reset()
+        return obj
+
+    def release(self, obj: "Any") -> None:
+        """Returns an instance to the pool."""
+        if self.debug:
+            if id(obj) not in self._all_ids:
+                raise ValueError("Instance does not belong to this pool")
+            if id(obj) in self._free_ids:
+                raise ValueError("Instance was already released")
+            self._clear(obj)
+        else:
+            obj._reset()
+        self._free.append(obj)
+
+    def _clear(self, obj: "Any") -> None:
+        """Deletes all field values of a free instance, in debug mode."""
+        self._free_ids.add(id(obj))
+        for name in self._attributes:
+            try:
+                delattr(obj, name)
+            except AttributeError:
+                pass
@@ -0,0 +1,187 @@
+"""Columnar storage for many records of a dataclass."""
+
+from array import array
+from struct import calcsize
+
+from .constants import PARAMS_NAME, TYPE_CHECKING
+from .field import Field
+
+if TYPE_CHECKING:
+    from typing import Any, Iterator
+
+ARRAY_KINDS = ("bhilq", "BHILQ", "fd")
+"""Array typecodes of signed integers, unsigned integers and floats."""
+
+
+def typecode(f: Field) -> str | None:
+    """Array typecode for a field's values, or None if they are stored in a list.
+
+    Taken from the field's binary format, e.g. ``field(format="<H")``. Arrays
+    use native sizes, so the typecode is the one of the same kind whose native
+    struct size matches the size of the format. MicroPython arrays have no
+    itemsize attribute, so sizes are compared with struct.calcsize().
+    """
+    code = f.format
+    if code is None:
+        return None
+    for kind in ARRAY_KINDS:
+        if code[-1] in kind:
+            break
+    else:
+        return None
+    size = calcsize(code)
+    for candidate in kind:
+        if calcsize(candidate) != size:
+            continue
+        try:
+            array(candidate)
+        except ValueError:
+            # Some MicroPython ports don't support 64-bit typecodes.
+            continue
+        return candidate
+    return None
+
+
+class RecordArray:
+    """Fixed-capacity array of dataclass records, stored column by column.
+
+    Each field with a numeric binary format is stored in an array.array of the
+    matching typecode, so a record costs only the bytes of its values. Other
+    fields are stored in lists.
+
+    Appending to a full array raises IndexError, unless ring is True, in which
+    case the oldest record is overwritten. Index 0 is always the oldest record.
+    """
+
+    cls: type
+    """The dataclass of the records."""
+
+    capacity: int
+    """Maximum number of records."""
+
+    ring: bool
+    """Whether appending to a full array overwrites the oldest record."""
+
+    columns: "dict[str, Any]"
+    """Buffer of each field's values, by field name.
+
+    Values are stored in the order they were written, which differs from the
+    order of records once a ring buffer has wrapped around. Use physical_index()
+    to find the record at an index.
+    """
+
+    def __init__(self, cls: type, capacity: int, *, ring: bool = False) -> None:
+        transform = cls.__dict__.get(PARAMS_NAME)
+        if transform is None:
+            raise TypeError(f"Expected a dataclass, got {cls!r}")
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.cls = cls
+        self.capacity = capacity
+        self.ring = ring
+        self.columns = {}
+        for f in transform.fields:
+            code = typecode(f)
+            if code is None:
+                self.columns[f.name] = [None] * capacity
+            else:
+                self.columns[f.name] = array(code, (0 for _ in range(capacity)))
+        self._names = tuple(self.columns)
+        self._make = getattr(cls, "_make") if transform.make else None
+        self._start = 0
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def append(self, obj: "Any") -> None:
+        """Copies the field values of an instance into the next record.
+
+        If a value can't be stored, e.g. because it is out of range for its
+        column, the error is raised and the array is left unchanged.
+        """
+        full = self._length == self.capacity
+        if not full:
+            i = self._start + self._length
+            if i >= self.capacity:
+                i -= self.capacity
+        elif self.ring:
+            # Overwrite the oldest record.
+            i = self._start
+        else:
+            raise IndexError(f"RecordArray is full ({self.capacity} records)")
+        values = [getattr(obj, name) for name in self._names]
+        columns = [self.columns[name] for name in self._names]
+        # Only a record that is still counted needs to be restored on failure.
+        old = [column[i] for column in columns] if full else None
+        try:
+            for column, value in zip(columns, values):
+                column[i] = value
+        except Exception:
+            if old is not None:
+                for column, value in zip(columns, old):
+                    column[i] = value
+            raise
+        if full:
+            self._start = i + 1 if i + 1 < self.capacity else 0
+        else:
+            self._length += 1
+
+    def physical_index(self, index: int) -> int:
+        """Position in the column buffers of the record at index."""
+        length = self._length
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("RecordArray index out of range")
+        index += self._start
+        return index - self.capacity if index >= self.capacity else index
+
+    def __getitem__(self, index: int) -> "RecordView":
+        """Returns a view of the record at index, without copying its values."""
+        return RecordView(self, self.physical_index(index))
+
+    def __iter__(self) -> "Iterator[RecordView]":
+        for index in range(self._length):
+            yield self[index]
+
+    def get(self, index: int) -> "Any":
+        """Creates a dataclass instance from the record at index."""
+        i = self.physical_index(index)
+        values = [self.columns[name][i] for name in self._names]
+        if self._make is not None:
+            return self._make(*values)
+        from .functions import fromdict
+
+        return fromdict(self.cls, dict(zip(self._names, values)))
+
+    def clear(self) -> None:
+        """Removes all records, without releasing their buffers."""
+        self._start = 0
+        self._length = 0
+
+
+class RecordView:
+    """Reads the fields of one record of a RecordArray.
+
+    The view reads the record's current values from the columns, so it reflects
+    later writes, including a ring buffer overwriting the record.
+    """
+
+    __slots__ = ("_columns", "_index")
+
+    def __init__(self, records: RecordArray, index: int) -> None:
+        self._columns = records.columns
+        self._index = index
+
+    def __getattr__(self, name: str) -> "Any":
+        column = self._columns.get(name)
+        if column is None:
+            raise AttributeError(name)
+        return column[self._index]
+
+    def __repr__(self) -> str:
+        items = ", ".join(
+            f"{name}={self.__getattr__(name)!r}" for name in self._columns
+        )
+        return f"RecordView({items})"
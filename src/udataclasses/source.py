@@ -1,62 +1,440 @@
-from .constants import MISSING
+from .constants import (
+    ASDICT_NAME,
+    DICT_NAME,
+    FROMDICT_NAME,
+    HASH_NAME,
+    MISSING,
+    STORAGE_PLAIN,
+    STORAGE_PROPERTY,
+    STORAGE_TUPLE,
+    TYPE_CHECKING,
+    VALUES_NAME,
+    WRITE_JSON_NAME,
+)
 from .field import Field
+from .transform_spec import TransformSpec
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
-def init(fields: list[Field], post_init: bool = False) -> str:
-    """Generates the __init__ method."""
-    args: list[str] = []
-    for field in fields:
-        if not field.init:
-            continue
-        arg = field.name
-        if field.default is not MISSING:
-            arg += f"={field.default_value_name}"
-        if field.default_factory is not MISSING:
-            arg += "=FACTORY_SENTINEL"
-        args.append(arg)
 
-    # Force all arguments to be keyword-only. Positional arguments are confusing
-    # in our use case because we don't preserve the user's field ordering.
-    if args:
-        args.insert(0, "*")
+def class_properties(transform: TransformSpec) -> dict[str, str]:
+    """Generates the properties for each field of a dataclass.
 
-    body = [line for f in fields if (line := init_initialize_field(f))]
+    Returns the source code for each property, keyed by field name.
+    """
+    properties: dict[str, str] = {}
+    if transform.storage == STORAGE_PLAIN:
+        return properties
+    for i, field in enumerate(transform.fields):
+        properties[field.name] = "\n".join(
+            [
+                getter(field, i if transform.storage == STORAGE_TUPLE else None),
+                setter(field, transform.frozen),
+                deleter(field, transform.frozen),
+            ]
+        )
+    return properties
+
+
+def class_methods(transform: TransformSpec) -> dict[str, str]:
+    """Generates all of the methods for a dataclass, except field properties.
+
+    Methods that are generated lazily are excluded. Returns the source code for
+    each class attribute, keyed by attribute name.
+    """
+    fields = transform.fields
+    storage = transform.storage
+    methods: dict[str, str] = {}
+    if transform.intern:
+        methods["__new__"] = intern_new(
+            fields,
+            post_init=transform.post_init,
+            storage=storage,
+            positional=transform.positional,
+        )
+        # Instances are initialized by __new__().
+        methods["__init__"] = method(
+            name="__init__", non_self_args=["*args", "**kwargs"], body="pass"
+        )
+    elif transform.init:
+        methods["__init__"] = init(
+            fields,
+            post_init=transform.post_init,
+            storage=storage,
+            positional=transform.positional,
+        )
+    if not transform.lazy:
+        for name in special_methods(transform):
+            methods[name] = special_method(transform, name)
+
+    methods[ASDICT_NAME] = asdict(fields, storage, cache=transform.cache_asdict)
+    methods[WRITE_JSON_NAME] = write_json(fields, storage)
+    if transform.write_json:
+        methods["write_json"] = f"write_json = {WRITE_JSON_NAME}"
+    methods[FROMDICT_NAME] = fromdict(
+        fields,
+        storage,
+        post_init=transform.post_init,
+        call_init=transform.custom_init or transform.intern,
+    )
+    if transform.make:
+        methods["_make"] = make(fields, storage, post_init=transform.post_init)
+    if transform.replace:
+        methods["__replace__"] = replace(
+            fields,
+            storage,
+            call_init=not transform.init or transform.post_init or transform.intern,
+        )
+
+    if transform.struct_format is not None:
+        formatted = [f for f in fields if f.format is not None]
+        fmt = transform.struct_format
+        methods["pack_into"] = pack_into(formatted, fmt, storage)
+        methods["to_bytes"] = to_bytes(formatted, fmt, storage)
+        methods["from_bytes"] = from_bytes(formatted, fmt)
+        methods["decode_into"] = decode_into(
+            formatted,
+            fmt,
+            storage,
+            frozen=transform.frozen,
+            cache_hash=transform.cache_hash,
+        )
+    if transform.update_from:
+        methods["update_from"] = update_from(
+            fields, storage, frozen=transform.frozen, cache_hash=transform.cache_hash
+        )
+    if transform.reset:
+        methods["_reset"] = reset(fields, storage, cache_hash=transform.cache_hash)
+
+    if transform.hash is None:
+        methods["__hash__"] = "__hash__ = None"
+    return methods
+
+
+def special_methods(transform: TransformSpec) -> list[str]:
+    """Names of the comparison, hashing and repr methods of a dataclass.
+
+    These are generated on first use if the dataclass is lazy.
+    """
+    names: list[str] = []
+    if transform.repr:
+        names.append("__repr__")
+    if transform.eq:
+        names.append("__eq__")
+    if transform.order:
+        names += ["__lt__", "__le__", "__gt__", "__ge__"]
+    if transform.hash:
+        names.append("__hash__")
+    return names
+
+
+def special_method(transform: TransformSpec, name: str) -> str:
+    """Generates one of the methods named by special_methods()."""
+    fields = transform.fields
+    storage = transform.storage
+    if name == "__repr__":
+        return repr(fields, storage)
+    if name == "__hash__":
+        return hash(fields, storage, cache=transform.cache_hash)
+    comparisons = {"__eq__": eq, "__lt__": lt, "__le__": le, "__gt__": gt, "__ge__": ge}
+    return comparisons[name](fields, storage)
+
+
+def factory(
+    name: str, params: list[str], properties: dict[str, str], methods: dict[str, str]
+) -> str:
+    """Generates a function that defines methods and returns them in a dict.
+
+    The parameters are made available to the methods as closure variables.
+    Properties are defined in a nested function, so that field names don't shadow
+    builtins or parameters used by the methods.
+    """
+    indent = " " * 4
+    lines = [f"def {name}({', '.join(params)}):"]
+    lines.append(f"{indent}def __dataclass_properties():")
+    for code in properties.values():
+        lines.extend(2 * indent + line for line in code.splitlines())
+    items = ", ".join(f"{n!r}: {n}" for n in properties)
+    lines.append(f"{indent * 2}return {{{items}}}")
+    lines.append(f"{indent}__dataclass_attributes = __dataclass_properties()")
+    for method_name, code in methods.items():
+        lines.extend(indent + line for line in code.splitlines())
+        lines.append(f"{indent}__dataclass_attributes[{method_name!r}] = {method_name}")
+    lines.append(f"{indent}return __dataclass_attributes")
+    return "\n".join(lines)
+
+
+def init(
+    fields: list[Field],
+    post_init: bool = False,
+    storage: str = STORAGE_PROPERTY,
+    positional: tuple[str, ...] = (),
+) -> str:
+    """Generates the __init__ method.
+
+    Fields named in positional are positional-or-keyword parameters, in that
+    order. All other parameters are keyword-only.
+    """
+    return method(
+        name="__init__",
+        non_self_args=init_args(fields, positional),
+        body=init_body(fields, post_init, storage) or "pass",
+    )
+
+
+def init_args(fields: list[Field], positional: tuple[str, ...] = ()) -> list[str]:
+    """Parameters of the __init__ method, excluding self."""
+    by_name = {f.name: f for f in fields}
+    args = [init_arg(by_name[name]) for name in positional]
+    keyword_args = [init_arg(f) for f in fields if f.init and f.name not in positional]
+
+    # Force the remaining arguments to be keyword-only. Positional arguments are
+    # confusing by default because we don't preserve the user's field ordering.
+    if keyword_args:
+        args.append("*")
+        args += keyword_args
+    return args
+
+
+def init_body(
+    fields: list[Field], post_init: bool = False, storage: str = STORAGE_PROPERTY
+) -> list[str]:
+    """Statements of the __init__ method, which initialize self."""
+    if storage == STORAGE_TUPLE:
+        values = (f"{init_value(f)}," for f in fields)
+        body = [f"self.{VALUES_NAME} = ({' '.join(values)})"]
+    else:
+        body = [line for f in fields if (line := init_initialize_field(f, storage))]
 
     if post_init:
         body.append("self.__post_init__()")
+    return body
 
+
+def intern_new(
+    fields: list[Field],
+    post_init: bool = False,
+    storage: str = STORAGE_PROPERTY,
+    positional: tuple[str, ...] = (),
+) -> str:
+    """Generates the __new__ method of a dataclass with intern=True.
+
+    Takes the same arguments as __init__() would. Returns the instance in
+    __dataclass_intern_table with the same argument values and types if there is
+    one. Otherwise initializes a new instance and adds it to the table. Default
+    factories are called before the lookup, so that each instance gets its own
+    value. Instances with unhashable argument values are not interned.
+    """
+    init_fields = [f for f in fields if f.init]
+    body: list[str] = []
+    for f in init_fields:
+        if f.default_factory is not MISSING:
+            body += [
+                f"if {f.name} is FACTORY_SENTINEL:",
+                f"    {f.name} = {f.default_value_name}()",
+            ]
+    key = " ".join(f"{f.name}, __dataclass_type({f.name})," for f in init_fields)
+    body += [
+        f"__dataclass_key = (__dataclass_cls, {key})",
+        "try:",
+        "    return __dataclass_intern_table[__dataclass_key]",
+        "except KeyError:",
+        "    pass",
+        "except TypeError:",
+        "    # Unhashable argument value",
+        "    __dataclass_key = None",
+        "self = __dataclass_object_new(__dataclass_cls)",
+        *init_body(fields, post_init, storage),
+        "if __dataclass_key is not None:",
+        "    __dataclass_intern_table[__dataclass_key] = self",
+        "return self",
+    ]
     return method(
-        name="__init__",
-        non_self_args=args,
-        body=body or "pass",
+        name="__new__",
+        self_name="__dataclass_cls",
+        non_self_args=init_args(fields, positional),
+        body=body,
     )
 
 
-def init_initialize_field(f: Field) -> str:
+def init_arg(f: Field) -> str:
+    """__init__() parameter for a field, with its default value if any."""
+    if f.default is not MISSING:
+        return f"{f.name}={f.default_value_name}"
+    if f.default_factory is not MISSING:
+        return f"{f.name}=FACTORY_SENTINEL"
+    return f.name
+
+
+def make(
+    fields: list[Field], storage: str = STORAGE_PROPERTY, post_init: bool = False
+) -> str:
+    """Generates the _make() classmethod.
+
+    Takes the value of every field positionally, in alphabetical order by name,
+    and assigns them to storage without calling __init__(). The class and
+    object.__new__ use reserved names, so that they can't clash with fields.
+    """
+    body = ["self = __dataclass_object_new(__dataclass_cls)"]
+    names = [f.name for f in fields]
+    if storage == STORAGE_TUPLE:
+        body.append(f"self.{VALUES_NAME} = ({' '.join(n + ',' for n in names)})")
+    else:
+        body += [f"self.{attribute(f, storage)} = {f.name}" for f in fields]
+    if post_init:
+        body.append("self.__post_init__()")
+    body.append("return self")
+    return method(
+        decorator="@classmethod",
+        name="_make",
+        self_name="__dataclass_cls",
+        non_self_args=names,
+        body=body,
+    )
+
+
+def build(
+    fields: list[Field],
+    names: tuple[str, ...],
+    storage: str = STORAGE_PROPERTY,
+    post_init: bool = False,
+    call_init: bool = False,
+    generator: bool = False,
+) -> str:
+    """Generates a function that creates an instance from each of many rows.
+
+    Rows are tuples or lists with the values of the named fields in order, or
+    dicts keyed by field name. Dicts are passed to the fromdict() constructor.
+    For tuple rows, other fields are assigned their default value, and unless
+    call_init is True, instances are created without calling __init__(). The
+    function returns a list, or is a generator if generator is True.
+    """
+    # Values are held in numbered variables, as field names may shadow builtins.
+    variables = [f"v{i}" for i in range(len(names))]
+    loop = [
+        "for row in rows:",
+        "    if isinstance(row, dict):",
+        "        self = fromdict(row)",
+        "    else:",
+    ]
+    if names:
+        loop += [
+            "        try:",
+            f"            {' '.join(v + ',' for v in variables)} = row",
+            "        except ValueError:",
+            f"            if len(row) < {len(names)}:",
+            f"                raise TypeError('Missing field: ' + {names!r}[len(row)])",
+            f"            raise TypeError('Expected {len(names)} values, got %d' "
+            "% len(row))",
+        ]
+    if call_init:
+        kwargs = ", ".join(f"{n}={v}" for n, v in zip(names, variables))
+        loop.append(f"        self = cls({kwargs})")
+    else:
+        by_name = dict(zip(names, variables))
+        values = [by_name.get(f.name) or default_value(f) for f in fields]
+        loop.append("        self = new(cls)")
+        if storage == STORAGE_TUPLE:
+            loop.append(
+                f"        self.{VALUES_NAME} = ({' '.join(v + ',' for v in values)})"
+            )
+        else:
+            for f, value in zip(fields, values):
+                if value:
+                    loop.append(f"        self.{attribute(f, storage)} = {value}")
+        if post_init:
+            loop.append("        self.__post_init__()")
+
+    body = ["new = object.__new__", f"fromdict = cls.{FROMDICT_NAME}"]
+    if generator:
+        body += loop
+        body.append("    yield self")
+    else:
+        body += ["instances = []", "append = instances.append", *loop]
+        body += ["    append(self)", "return instances"]
+    return method(
+        name="build_iter" if generator else "build_many",
+        self_name="cls",
+        non_self_args=["rows"],
+        body=body,
+    )
+
+
+def init_initialize_field(
+    f: Field, storage: str = STORAGE_PROPERTY, reset: bool = False
+) -> str:
     """__init__() body line to assign field an initial value.
 
-    Empty string if no initializion is needed.
+    If reset is True, the field is assigned its default value even if it is an
+    __init__() parameter. Empty string if no initializion is needed.
+    """
+    value = default_value(f) if reset else init_value(f)
+    if not value:
+        return ""
+    return f"self.{attribute(f, storage)} = {value}"
+
+
+def init_value(f: Field) -> str:
+    """Expression for a field's initial value inside __init__().
+
+    Empty string if the field has no initial value.
     """
-    left = f"self.{f._name}"
     if f.init:
-        value = f.name
         if f.default_factory is not MISSING:
-            value = f"{f.default_value_name}() if {f.name} is FACTORY_SENTINEL else {f.name}"
-        return f"{left} = {value}"
+            return f"{f.default_value_name}() if {f.name} is FACTORY_SENTINEL else {f.name}"
+        return f.name
     # Initialize init=False field
+    return default_value(f)
+
+
+def default_value(f: Field) -> str:
+    """Expression for a field's default value.
+
+    Empty string if the field has no default value.
+    """
     if f.default is not MISSING:
-        return f"{left} = {f.default_value_name}"
+        return f.default_value_name
     if f.default_factory is not MISSING:
-        return f"{left} = {f.default_value_name}()"
+        return f"{f.default_value_name}()"
     return ""
 
 
-def getter(field: Field) -> str:
-    """Generates a field getter."""
+def reset(
+    fields: list[Field], storage: str = STORAGE_PROPERTY, cache_hash: bool = False
+) -> str:
+    """Generates the _reset method, which reassigns all default values.
+
+    Fields without a default value are left as they are.
+    """
+    body = [
+        line for f in fields if (line := init_initialize_field(f, storage, reset=True))
+    ]
+    if cache_hash:
+        body += clear_cached_hash()
+    return method(name="_reset", body=body or "pass")
+
+
+def clear_cached_hash() -> list[str]:
+    """Statements that delete the hash cached with cache_hash=True, if any."""
+    return [
+        "try:",
+        f"    del self.{HASH_NAME}",
+        "except AttributeError:",
+        "    pass",
+    ]
+
+
+def getter(field: Field, index: int | None = None) -> str:
+    """Generates a field getter.
+
+    index is the position of the field in the values tuple of tuple storage.
+    """
+    value = f"self.{field._name}" if index is None else f"self.{VALUES_NAME}[{index}]"
     return method(
         decorator="@property",
         name=field.name,
-        body=f"return self.{field._name}",
+        body=f"return {value}",
     )
 
 
@@ -87,45 +465,387 @@ def deleter(field: Field, frozen: bool = False) -> str:
     )
 
 
-def repr(fields: list[Field]) -> str:
+def repr(fields: list[Field], storage: str = STORAGE_PROPERTY) -> str:
     """Generates the __repr__ method."""
     return method(
         name="__repr__",
         body=(
             "return f'{self.__class__.__name__}("
-            + ", ".join(f"{f.name}={{self.{f._name}!r}}" for f in fields if f.repr)
+            + ", ".join(
+                f"{f.name}={{{value}!r}}"
+                for f, value in zip(fields, field_values("self", fields, storage))
+                if f.repr
+            )
             + ")'"
         ),
     )
 
 
-def eq(fields: list[Field]) -> str:
-    return compare("__eq__", "==", fields)
+def eq(fields: list[Field], storage: str = STORAGE_PROPERTY) -> str:
+    return compare("__eq__", "==", fields, storage)
+
+
+def lt(fields: list[Field], storage: str = STORAGE_PROPERTY) -> str:
+    return compare("__lt__", "<", fields, storage)
+
 
+def le(fields: list[Field], storage: str = STORAGE_PROPERTY) -> str:
+    return compare("__le__", "<=", fields, storage)
 
-def lt(fields: list[Field]) -> str:
-    return compare("__lt__", "<", fields)
 
+def gt(fields: list[Field], storage: str = STORAGE_PROPERTY) -> str:
+    return compare("__gt__", ">", fields, storage)
 
-def le(fields: list[Field]) -> str:
-    return compare("__le__", "<=", fields)
 
+def ge(fields: list[Field], storage: str = STORAGE_PROPERTY) -> str:
+    return compare("__ge__", ">=", fields, storage)
 
-def gt(fields: list[Field]) -> str:
-    return compare("__gt__", ">", fields)
 
+HASH_SEED = "0x345678"
+"""Initial value of a hash folded by __hash__."""
 
-def ge(fields: list[Field]) -> str:
-    return compare("__ge__", ">=", fields)
+HASH_MIX = "(h & 0x7FFF) * 0x5BD1 ^ (h >> 15 & 0x7FFF) * 0x6F4F"
+"""Expression that mixes the bits of a folded hash h.
 
+Multiplies each 15-bit half of h by a 15-bit constant, so that the result is
+below 2**30 and fits in a MicroPython small integer.
+"""
 
-def hash(fields: list[Field]) -> str:
-    hash_fields = [f for f in fields if f.contributes_to_hash]
+
+def hash(
+    fields: list[Field], storage: str = STORAGE_PROPERTY, cache: bool = False
+) -> str:
+    """Generates the __hash__ method.
+
+    If __dataclass_fold_hashes is true, field hashes are combined one at a time
+    with arithmetic on small integers, so that no tuple is allocated. Otherwise
+    the tuple of field values is hashed. With tuple storage, the stored tuple is
+    hashed if every field contributes to the hash. If cache is True, the hash is
+    computed on first use and stored on the instance.
+    """
+    result = "h = " if cache else "return "
+    all_values = field_values("self", fields, storage)
+    values = [v for f, v in zip(fields, all_values) if f.contributes_to_hash]
+    values_tuple = tuple_str("self", fields, storage, lambda f: f.contributes_to_hash)
+    if not values or (storage == STORAGE_TUPLE and len(values) == len(fields)):
+        # Hashing the stored tuple or the empty tuple allocates nothing.
+        body = [f"{result}hash({values_tuple})"]
+    else:
+        body = [
+            "if __dataclass_fold_hashes:",
+            f"    h = {HASH_SEED} ^ hash({values[0]})",
+            *(f"    h = {HASH_MIX} ^ hash({v})" for v in values[1:]),
+            f"    {result}{HASH_MIX}",
+            "else:",
+            f"    {result}hash({values_tuple})",
+        ]
+    if not cache:
+        return method(name="__hash__", body=body)
     return method(
-        name="__hash__", body=f"return hash({tuple_str('self', hash_fields)})"
+        name="__hash__",
+        body=[
+            "try:",
+            f"    return self.{HASH_NAME}",
+            "except AttributeError:",
+            "    pass",
+            *body,
+            f"self.{HASH_NAME} = h",
+            "return h",
+        ],
     )
 
 
+def asdict(
+    fields: list[Field], storage: str = STORAGE_PROPERTY, cache: bool = False
+) -> str:
+    """Generates the converter used by asdict().
+
+    Values of simple types are used as-is, and others are converted by
+    __dataclass_asdict_value. If cache is True, the dict created for the default
+    dict_factory is stored on the instance.
+    """
+    body: list[str] = []
+    if cache:
+        body += [
+            "if dict_factory is dict:",
+            "    try:",
+            f"        return self.{DICT_NAME}",
+            "    except AttributeError:",
+            "        pass",
+        ]
+    for i, value in enumerate(field_values("self", fields, storage)):
+        body += [
+            f"v{i} = {value}",
+            f"if type(v{i}) not in __dataclass_simple_types:",
+            f"    v{i} = __dataclass_asdict_value(v{i}, dict_factory)",
+        ]
+    items = ", ".join(f"{f.name!r}: v{i}" for i, f in enumerate(fields))
+    pairs = ", ".join(f"({f.name!r}, v{i})" for i, f in enumerate(fields))
+    body.append("if dict_factory is dict:")
+    if cache:
+        body.append(f"    d = self.{DICT_NAME} = {{{items}}}")
+        body.append("    return d")
+    else:
+        body.append(f"    return {{{items}}}")
+    body.append(f"return dict_factory([{pairs}])")
+    return method(name=ASDICT_NAME, non_self_args=["dict_factory"], body=body)
+
+
+def write_json(fields: list[Field], storage: str = STORAGE_PROPERTY) -> str:
+    """Generates the write_json method, which writes an instance as JSON.
+
+    Output is the same as json.dumps(asdict(self)), but is written to the
+    stream piece by piece. The method is named WRITE_JSON_NAME, so that nested
+    dataclasses can be written even if they define their own write_json.
+    """
+    if not fields:
+        return method(
+            name=WRITE_JSON_NAME, non_self_args=["stream"], body="stream.write('{}')"
+        )
+    body = ["write = stream.write"]
+    separator = "{"
+    for f, value in zip(fields, field_values("self", fields, storage)):
+        key = f'{separator}"{f.name}": '
+        body += [
+            f"write({key!r})",
+            f"__dataclass_write_json_value({value}, stream)",
+        ]
+        separator = ", "
+    body.append("write('}')")
+    return method(name=WRITE_JSON_NAME, non_self_args=["stream"], body=body)
+
+
+def fromdict(
+    fields: list[Field],
+    storage: str = STORAGE_PROPERTY,
+    post_init: bool = False,
+    call_init: bool = False,
+) -> str:
+    """Generates the constructor used by fromdict().
+
+    Field values are assigned directly from the dict, without calling
+    __init__(). Values of fields with a dataclass type are converted by
+    __dataclass_fromdict_value. If call_init is True, e.g. because the class
+    defines its own __init__(), the converted dict is passed to it instead.
+    Values of init=False fields, which asdict() includes, are then dropped.
+    """
+    if call_init:
+        body = ["kwargs = dict(data)"]
+        for f in fields:
+            if not f.init:
+                body.append(f"kwargs.pop({f.name!r}, None)")
+            elif f.nested:
+                body += [
+                    f"if {f.name!r} in kwargs:",
+                    f"    kwargs[{f.name!r}] = __dataclass_fromdict_value("
+                    f"kwargs[{f.name!r}], {f.type_value_name})",
+                ]
+        body.append("return cls(**kwargs)")
+        return method(
+            decorator="@classmethod",
+            name=FROMDICT_NAME,
+            self_name="cls",
+            non_self_args=["data"],
+            body=body,
+        )
+
+    body = ["self = object.__new__(cls)", "n = 0"]
+    targets: list[str] = []
+    for i, f in enumerate(fields):
+        target = (
+            f"v{i}" if storage == STORAGE_TUPLE else f"self.{attribute(f, storage)}"
+        )
+        targets.append(target)
+        value = f"data[{f.name!r}]"
+        if f.nested:
+            value = f"__dataclass_fromdict_value({value}, {f.type_value_name})"
+        body += [
+            f"if {f.name!r} in data:",
+            f"    {target} = {value}",
+            "    n += 1",
+        ]
+        default = default_value(f)
+        if default:
+            body += ["else:", f"    {target} = {default}"]
+        elif f.init:
+            body += ["else:", f"    raise TypeError('Missing field: {f.name}')"]
+    names = tuple(f.name for f in fields)
+    body += [
+        "if n != len(data):",
+        "    for name in data:",
+        f"        if name not in {names!r}:",
+        "            raise TypeError(f'Unknown field: {name}')",
+    ]
+    if storage == STORAGE_TUPLE:
+        body.append(f"self.{VALUES_NAME} = ({' '.join(t + ',' for t in targets)})")
+    if post_init:
+        body.append("self.__post_init__()")
+    body.append("return self")
+    return method(
+        decorator="@classmethod",
+        name=FROMDICT_NAME,
+        self_name="cls",
+        non_self_args=["data"],
+        body=body,
+    )
+
+
+def replace(
+    fields: list[Field], storage: str = STORAGE_PROPERTY, call_init: bool = False
+) -> str:
+    """Generates the __replace__ method used by replace() and copy.replace().
+
+    Only the names of the given changes are validated. Unless call_init is True
+    or a subclass defines its own __init__, the new instance is created without
+    calling __init__: values of unchanged fields are copied from storage, and
+    init=False fields are reinitialized as they would be by __init__. Without
+    call_init, the method must be defined next to the generated __init__.
+    """
+    init_names = tuple(f.name for f in fields if f.init)
+    non_init_names = tuple(f.name for f in fields if not f.init)
+    body = [
+        "for name in changes:",
+        f"    if name not in {init_names!r}:",
+    ]
+    if non_init_names:
+        body += [
+            f"        if name in {non_init_names!r}:",
+            "            raise ValueError("
+            "f'Cannot replace field defined with init=False: {name}')",
+        ]
+    body.append("        raise TypeError(f'Unknown field: {name}')")
+
+    if storage == STORAGE_TUPLE:
+        body.append(f"values = self.{VALUES_NAME}")
+        values = [f"values[{i}]" for i in range(len(fields))]
+    else:
+        values = field_values("self", fields, storage)
+
+    items = ", ".join(
+        f"{f.name!r}: {value}" for f, value in zip(fields, values) if f.init
+    )
+    init_call = [
+        f"kwargs = {{{items}}}",
+        "kwargs.update(changes)",
+        "return type(self)(**kwargs)",
+    ]
+    if call_init:
+        body += init_call
+        return method(name="__replace__", non_self_args=["**changes"], body=body)
+
+    # __init__ is the generated method, unless a subclass defines its own.
+    body.append("if type(self).__init__ is not __init__:")
+    body += ["    " + line for line in init_call]
+    new_values = [
+        f"changes.get({f.name!r}, {value})" if f.init else init_value(f)
+        for f, value in zip(fields, values)
+    ]
+    body.append("new = object.__new__(type(self))")
+    if storage == STORAGE_TUPLE:
+        items = " ".join(f"{value}," for value in new_values)
+        body.append(f"new.{VALUES_NAME} = ({items})")
+    else:
+        body += [
+            f"new.{attribute(f, storage)} = {value}"
+            for f, value in zip(fields, new_values)
+            if value
+        ]
+    body.append("return new")
+    return method(name="__replace__", non_self_args=["**changes"], body=body)
+
+
+def pack_into(fields: list[Field], fmt: str, storage: str = STORAGE_PROPERTY) -> str:
+    """Generates the pack_into method, which writes fields into a buffer.
+
+    fields are the fields with a binary format, and fmt their combined format.
+    """
+    values = "".join(f", {v}" for v in field_values("self", fields, storage))
+    return method(
+        name="pack_into",
+        non_self_args=["buf", "offset=0"],
+        body=f"__dataclass_pack_into({fmt!r}, buf, offset{values})",
+    )
+
+
+def to_bytes(fields: list[Field], fmt: str, storage: str = STORAGE_PROPERTY) -> str:
+    """Generates the to_bytes method, which packs fields into a bytes object."""
+    values = "".join(f", {v}" for v in field_values("self", fields, storage))
+    return method(name="to_bytes", body=f"return __dataclass_pack({fmt!r}{values})")
+
+
+def from_bytes(fields: list[Field], fmt: str) -> str:
+    """Generates the from_bytes classmethod, which unpacks a new instance."""
+    names = [f"v{i}" for i in range(len(fields))]
+    args = ", ".join(f"{f.name}={name}" for f, name in zip(fields, names))
+    return method(
+        decorator="@classmethod",
+        name="from_bytes",
+        self_name="cls",
+        non_self_args=["buf", "offset=0"],
+        body=[
+            f"{', '.join(names)}, = __dataclass_unpack_from({fmt!r}, buf, offset)",
+            f"return cls({args})",
+        ],
+    )
+
+
+def decode_into(
+    fields: list[Field],
+    fmt: str,
+    storage: str = STORAGE_PROPERTY,
+    frozen: bool = False,
+    cache_hash: bool = False,
+) -> str:
+    """Generates the decode_into method, which unpacks fields in place."""
+    args = ["buf", "offset=0"]
+    if frozen:
+        return method(
+            name="decode_into",
+            non_self_args=args,
+            body=refuse_frozen("decode into"),
+        )
+    targets = "".join(f"self.{attribute(f, storage)}, " for f in fields)
+    body = [f"{targets}= __dataclass_unpack_from({fmt!r}, buf, offset)"]
+    if cache_hash:
+        body += clear_cached_hash()
+    return method(name="decode_into", non_self_args=args, body=body)
+
+
+def update_from(
+    fields: list[Field],
+    storage: str = STORAGE_PROPERTY,
+    frozen: bool = False,
+    cache_hash: bool = False,
+) -> str:
+    """Generates the update_from method, which assigns fields from a mapping.
+
+    Keys that aren't field names raise TypeError.
+    """
+    if frozen:
+        return method(
+            name="update_from",
+            non_self_args=["mapping"],
+            body=refuse_frozen("update"),
+        )
+    body = ["n = 0"]
+    for f in fields:
+        body += [
+            f"if {f.name!r} in mapping:",
+            f"    self.{attribute(f, storage)} = mapping[{f.name!r}]",
+            "    n += 1",
+        ]
+    names = tuple(f.name for f in fields)
+    body += [
+        "if n != len(mapping):",
+        "    for name in mapping:",
+        f"        if name not in {names!r}:",
+        "            raise TypeError(f'Unknown field: {name}')",
+    ]
+    if cache_hash:
+        body += clear_cached_hash()
+    return method(name="update_from", non_self_args=["mapping"], body=body)
+
+
 # Internal helpers below
 
 
@@ -134,13 +854,14 @@ def method(
     name: str,
     body: str | list[str],
     decorator: str | None = None,
+    self_name: str = "self",
     non_self_args: list[str] = [],
 ) -> str:
     """Generates code for a Python method."""
     lines: list[str] = []
     if decorator is not None:
         lines.append(decorator)
-    lines.append(f"def {name}({', '.join(['self'] + non_self_args)}):")
+    lines.append(f"def {name}({', '.join([self_name] + non_self_args)}):")
     if isinstance(body, str):
         body = [body]
     indent = " " * 4
@@ -149,19 +870,89 @@ def method(
     return "\n".join(lines)
 
 
-def tuple_str(object_name: str, fields: list[Field]) -> str:
-    """An expressing that represents a dataclass instance as a tuple of its fields."""
-    parts = (f"{object_name}._{f.name}," for f in fields)
+def attribute(field: Field, storage: str = STORAGE_PROPERTY) -> str:
+    """Name of the instance attribute that stores a field's value.
+
+    Not applicable to tuple storage, where all values share one attribute.
+    """
+    return field.name if storage == STORAGE_PLAIN else field._name
+
+
+def field_values(
+    object_name: str, fields: list[Field], storage: str = STORAGE_PROPERTY
+) -> list[str]:
+    """Expressions for the value of each field of a dataclass instance."""
+    if storage == STORAGE_TUPLE:
+        return [f"{object_name}.{VALUES_NAME}[{i}]" for i in range(len(fields))]
+    return [f"{object_name}.{attribute(f, storage)}" for f in fields]
+
+
+def tuple_str(
+    object_name: str,
+    fields: list[Field],
+    storage: str = STORAGE_PROPERTY,
+    include: "Callable[[Field], bool] | None" = None,
+) -> str:
+    """An expressing that represents a dataclass instance as a tuple of its fields.
+
+    If include is given, only fields for which it returns True are included.
+    """
+    selected = [include is None or include(f) for f in fields]
+    if storage == STORAGE_TUPLE and all(selected):
+        # Use the stored tuple as-is.
+        return f"{object_name}.{VALUES_NAME}"
+    values = field_values(object_name, fields, storage)
+    parts = (f"{v}," for v, s in zip(values, selected) if s)
     return f"({' '.join(parts)})"
 
 
-def compare(name: str, operator: str, fields: list[Field]) -> str:
-    """Generates a comparison operator method."""
-    compare_fields = [f for f in fields if f.compare]
-    left = tuple_str("self", compare_fields)
-    right = tuple_str("other", compare_fields)
-    return method(
-        name=name,
-        non_self_args=["other"],
-        body=f"return {left} {operator} {right}",
+def refuse_frozen(action: str) -> str:
+    """Statement that raises FrozenInstanceError for an in-place update."""
+    return (
+        "raise FrozenInstanceError("
+        f"f'cannot {action} frozen {{type(self).__name__}} instance')"
     )
+
+
+def compare(
+    name: str, operator: str, fields: list[Field], storage: str = STORAGE_PROPERTY
+) -> str:
+    """Generates a comparison operator method.
+
+    Instances of other classes are not compared. Fields are compared one by one
+    like tuples would be, without creating tuples of the field values: items
+    that are identical are equal, even if == says otherwise, as for NaN. With
+    tuple storage, the stored tuples are compared directly if every field is
+    compared.
+    """
+    # Identical objects are equal, as tuples treat their items.
+    identical = "True" if operator in ("==", "<=", ">=") else "False"
+    body = [
+        "if self is other:",
+        f"    return {identical}",
+        "if other.__class__ is not self.__class__:",
+        "    return NotImplemented",
+    ]
+    compared = [f for f in fields if f.compare]
+    if storage == STORAGE_TUPLE and fields and len(compared) == len(fields):
+        body.append(f"return self.{VALUES_NAME} {operator} other.{VALUES_NAME}")
+        return method(name=name, non_self_args=["other"], body=body)
+
+    all_left = field_values("self", fields, storage)
+    all_right = field_values("other", fields, storage)
+    pairs = [(l, r) for f, l, r in zip(fields, all_left, all_right) if f.compare]
+    if not pairs:
+        body.append(f"return {identical}")
+    elif operator == "==":
+        body.append(
+            "return " + " and ".join(f"({l} is {r} or {l} == {r})" for l, r in pairs)
+        )
+    else:
+        # The first field that differs decides the result.
+        for left, right in pairs:
+            body += [
+                f"if {left} is not {right} and {left} != {right}:",
+                f"    return {left} {operator} {right}",
+            ]
+        body.append(f"return {identical}")
+    return method(name=name, non_self_args=["other"], body=body)
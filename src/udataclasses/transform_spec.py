@@ -1,14 +1,39 @@
-from .constants import FIELDS_NAME
+from .constants import (
+    FIELDS_NAME,
+    MISSING,
+    SOURCE_VERSION,
+    STORAGE_PLAIN,
+    STORAGE_PROPERTY,
+    STORAGE_TUPLE,
+    TYPE_CHECKING,
+)
 from .field import Field
 
+if TYPE_CHECKING:
+    from typing import Any
+
 
 class TransformSpec:
     init: bool
+    custom_init: bool
+    """The class defines its own __init__, which fromdict() and build_many() call."""
+
     post_init: bool
     repr: bool
     eq: bool
     order: bool
     frozen: bool
+    replace: bool
+    make: bool
+    update_from: bool
+    """Add an update_from method. False if the name is taken by the class."""
+
+    write_json: bool
+    """Add a write_json method. False if the name is taken by the class."""
+
+    reset: bool
+    """Add a _reset method for Pool. False if frozen or the name is taken."""
+
     hash: bool | None
     """Tri-state value for adding a __hash__ method.
 
@@ -17,9 +42,42 @@ class TransformSpec:
     If None, set __hash__ to None
     """
 
+    cache_hash: bool
+    """Compute the hash of each instance only once."""
+
+    lazy: bool
+    """Generate comparison, hashing and repr methods on first use."""
+
+    intern: bool
+    """Return an existing equal instance from __new__ instead of a new one."""
+
+    intern_table: "Any"
+    """Interned instances, keyed by class and __init__ argument values and types."""
+
+    cache_asdict: bool
+    """Compute asdict() of each instance only once."""
+
+    storage: str
+    """How field values are stored on instances. One of the STORAGE_* constants."""
+
     fields: list[Field]
     """Fields sorted alphabetically by name."""
 
+    positional: tuple[str, ...]
+    """Names of the fields that __init__ accepts as positional arguments, in order."""
+
+    generated: tuple[str, ...]
+    """Names of the class attributes generated by the decorator."""
+
+    decoration_bytes: int | None
+    """Heap allocated while decorating the class, if it was measured."""
+
+    struct_format: str | None
+    """Combined struct format of all fields with a binary format.
+
+    None if no field has a format.
+    """
+
     def __init__(
         self,
         cls: type,
@@ -30,14 +88,31 @@ class TransformSpec:
         order: bool = False,
         unsafe_hash: bool = False,
         frozen: bool = False,
+        storage: str = STORAGE_PROPERTY,
+        cache_hash: bool = False,
+        cache_asdict: bool = False,
+        lazy: bool = False,
+        intern: bool = False,
+        positional: tuple[str, ...] = (),
     ) -> None:
         self.init = init and ("__init__" not in cls.__dict__)
+        self.custom_init = "__init__" in cls.__dict__
         self.post_init = "__post_init__" in cls.__dict__
         self.repr = repr and ("__repr__" not in cls.__dict__)
+        self.replace = "__replace__" not in cls.__dict__
+        self.make = "_make" not in cls.__dict__
         self.eq = eq
         self.order = order
         self.frozen = frozen
 
+        if storage not in (STORAGE_PROPERTY, STORAGE_PLAIN, STORAGE_TUPLE):
+            raise ValueError(f"Unknown storage: {storage!r}")
+        if storage == STORAGE_PLAIN and frozen:
+            raise ValueError(f"storage={storage!r} cannot be used with frozen=True")
+        if storage == STORAGE_TUPLE and not frozen:
+            raise ValueError(f"storage={storage!r} requires frozen=True")
+        self.storage = storage
+
         self.hash = False
         if eq:
             if frozen:
@@ -47,6 +122,20 @@ class TransformSpec:
         if unsafe_hash:
             self.hash = True
 
+        if cache_hash and not self.hash:
+            raise ValueError("cache_hash=True requires a generated __hash__ method")
+        self.cache_hash = cache_hash
+        if cache_asdict and not frozen:
+            raise ValueError("cache_asdict=True requires frozen=True")
+        self.cache_asdict = cache_asdict
+        self.lazy = lazy
+        if intern and not frozen:
+            raise ValueError("intern=True requires frozen=True")
+        if intern and not self.init:
+            raise ValueError("intern=True requires a generated __init__ method")
+        self.intern = intern
+        self.intern_table = None
+
         fields: dict[str, Field] = {}
         # Propagate any existing fields from base class.
         fields.update(getattr(cls, FIELDS_NAME, {}))
@@ -77,3 +166,160 @@ class TransformSpec:
 
             fields[name] = field
         self.fields = sorted(fields.values(), key=lambda f: f.name)
+        self.write_json = not defines(cls, self.fields, "write_json")
+        self.update_from = not defines(cls, self.fields, "update_from")
+        self.reset = not frozen and not defines(cls, self.fields, "_reset")
+
+        if intern:
+            for field in self.fields:
+                if not field.init and field.default_factory is not MISSING:
+                    # Interned instances would share the value.
+                    raise ValueError(
+                        f"Field {field.name!r} with init=False can't have a "
+                        "default_factory with intern=True"
+                    )
+
+        if storage == STORAGE_TUPLE:
+            for field in self.fields:
+                if field.init or field.default is not MISSING:
+                    continue
+                if field.default_factory is not MISSING:
+                    continue
+                raise ValueError(
+                    f"Field {field.name!r} with init=False must have a default "
+                    f"value with storage={storage!r}"
+                )
+
+        self.positional = tuple(positional)
+        check_positional(self.fields, self.positional)
+        self.struct_format = struct_format(self.fields)
+        self.generated = ()
+        self.decoration_bytes = None
+
+    def fingerprint(self) -> str:
+        """Key that uniquely identifies the generated methods for this spec.
+
+        Two specs with the same fingerprint generate identical source code.
+        Default values are not part of the fingerprint, as they are passed to
+        the generated code as bindings rather than embedded in it.
+        """
+        hash_flag = "n" if self.hash is None else flags("h", self.hash)
+        parts = [
+            str(SOURCE_VERSION),
+            flags(
+                "ikpreofcdxmltwus",
+                self.init,
+                self.custom_init,
+                self.post_init,
+                self.repr,
+                self.eq,
+                self.order,
+                self.frozen,
+                self.cache_hash,
+                self.cache_asdict,
+                self.replace,
+                self.make,
+                self.lazy,
+                self.intern,
+                self.write_json,
+                self.update_from,
+                self.reset,
+            )
+            + hash_flag,
+            self.storage,
+        ]
+        if self.positional:
+            parts[-1] += "(" + ",".join(self.positional) + ")"
+        for f in self.fields:
+            part = (
+                f.name
+                + "="
+                + flags(
+                    "irchdft",
+                    f.init,
+                    f.repr,
+                    f.compare,
+                    f.contributes_to_hash,
+                    f.default is not MISSING,
+                    f.default_factory is not MISSING,
+                    f.nested,
+                )
+            )
+            if f.format is not None:
+                part += ":" + f.format
+            parts.append(part)
+        return "|".join(parts)
+
+
+def flags(names: str, *values: bool) -> str:
+    """Compact string representation of boolean flags, e.g. 'a-c'."""
+    return "".join(name if value else "-" for name, value in zip(names, values))
+
+
+def defines(cls: type, fields: list[Field], name: str) -> bool:
+    """Whether a class attribute or field already uses the given name."""
+    return name in cls.__dict__ or any(f.name == name for f in fields)
+
+
+def check_positional(fields: list[Field], positional: tuple[str, ...]) -> None:
+    """Validates the names of fields that are positional __init__ parameters."""
+    by_name = {f.name: f for f in fields}
+    default_name = None
+    for i, name in enumerate(positional):
+        f = by_name.get(name)
+        if f is None:
+            raise ValueError(f"Unknown positional field: {name!r}")
+        if name in positional[:i]:
+            raise ValueError(f"Duplicate positional field: {name!r}")
+        if not f.init:
+            raise ValueError(f"Positional field {name!r} must have init=True")
+        if f.default is not MISSING or f.default_factory is not MISSING:
+            default_name = name
+        elif default_name is not None:
+            raise ValueError(
+                f"Positional field {name!r} without a default follows "
+                f"{default_name!r}, which has a default"
+            )
+
+
+BYTE_ORDER_CHARS = "@=<>!"
+"""Characters that can prefix a struct format to select byte order."""
+
+FORMAT_CHARS = "?bBhHiIlLqQnNefds"
+"""struct format characters that can be used for a single field value."""
+
+
+def struct_format(fields: list[Field]) -> str | None:
+    """Combines the binary formats of fields into a single struct format.
+
+    Fields without a format are skipped. Byte order prefixes of all fields must
+    agree. Returns None if no field has a format.
+    """
+    byte_order = ""
+    codes: list[str] = []
+    for f in fields:
+        if f.format is None:
+            continue
+        if not f.init:
+            raise ValueError(f"Field {f.name!r} with a format must have init=True")
+        code = f.format
+        if code[:1] in BYTE_ORDER_CHARS:
+            if byte_order and byte_order != code[0]:
+                raise ValueError(
+                    f"Field {f.name!r} has byte order {code[0]!r}, "
+                    f"but other fields use {byte_order!r}"
+                )
+            byte_order = code[0]
+            code = code[1:]
+        # A repeat count is only allowed for bytes, which are a single value.
+        count = code[:-1]
+        if (
+            not code
+            or code[-1] not in FORMAT_CHARS
+            or (count and (code[-1] != "s" or not count.isdigit()))
+        ):
+            raise ValueError(f"Invalid format for field {f.name!r}: {f.format!r}")
+        codes.append(code)
+    if not codes:
+        return None
+    return byte_order + "".join(codes)
@@ -0,0 +1,73 @@
+from udataclasses import dataclass, field
+from udataclasses.cache import MethodsCache
+from udataclasses.decorator import methods_cache
+
+try:
+    from typing import Any
+except ImportError:
+    pass
+
+
+def factory(**bindings: Any) -> dict[str, Any]:
+    return {}
+
+
+def test_get_put() -> None:
+    cache = MethodsCache(maxsize=2)
+    assert cache.get("a") is None
+    cache.put("a", factory)
+    assert cache.get("a") is factory
+    assert len(cache) == 1
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_evicts_least_recently_used() -> None:
+    cache = MethodsCache(maxsize=2)
+    cache.put("a", factory)
+    cache.put("b", factory)
+    # Mark "a" as the most recently used.
+    cache.get("a")
+    cache.put("c", factory)
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") is factory
+    assert cache.get("c") is factory
+
+
+def test_disabled() -> None:
+    cache = MethodsCache(maxsize=0)
+    cache.put("a", factory)
+    assert len(cache) == 0
+    assert cache.get("a") is None
+
+
+def test_clear() -> None:
+    cache = MethodsCache(maxsize=2)
+    cache.put("a", factory)
+    cache.get("a")
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.hits == 0
+    assert cache.misses == 0
+
+
+def test_identical_shapes_share_code() -> None:
+    @dataclass
+    class First:
+        cache_shape_a: int = field()
+        cache_shape_b: int = 1
+
+    hits = methods_cache.hits
+
+    @dataclass
+    class Second:
+        cache_shape_a: int = field()
+        cache_shape_b: int = 2
+
+    assert methods_cache.hits == hits + 1
+    # Default values are per-class even though the code is shared.
+    assert First(cache_shape_a=0).cache_shape_b == 1
+    assert Second(cache_shape_a=0).cache_shape_b == 2
+    if hasattr(First.__init__, "__code__"):
+        assert First.__init__.__code__ is Second.__init__.__code__
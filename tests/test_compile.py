@@ -0,0 +1,104 @@
+from pytest import raises
+
+from udataclasses import FrozenInstanceError, dataclass, field
+from udataclasses.compile import compile_module
+from udataclasses.constants import PARAMS_NAME
+from udataclasses.decorator import _precompiled, register_precompiled
+
+try:
+    from typing import Any
+except ImportError:
+    pass
+
+
+class module:
+    """Stand-in for an imported module containing dataclasses."""
+
+    @dataclass
+    class Point:
+        x: int = 0
+        y: int = 0
+
+    @dataclass
+    class Size:
+        # Same shape as Point
+        x: int = 1
+        y: int = 2
+
+    @dataclass(frozen=True)
+    class Record:
+        timestamp: int = field()
+        values: list[int] = field(default_factory=list)
+
+    class NotADataclass:
+        x: int = 0
+
+
+def test_compile_module_shares_identical_shapes() -> None:
+    code = compile_module([module])
+    assert code.count("register_precompiled(") == 2
+    assert "# module.Point\n# module.Size\n" in code
+    assert "# module.Record\n" in code
+    assert "NotADataclass" not in code
+
+
+def test_compiled_module_registers_fingerprints() -> None:
+    code = compile_module([module])
+    exec(code, {})
+    for cls in (module.Point, module.Record):
+        assert getattr(cls, PARAMS_NAME).fingerprint() in _precompiled
+
+
+def test_precompiled_methods_used() -> None:
+    code = compile_module([module])
+    exec(code, {})
+    fingerprint = getattr(module.Record, PARAMS_NAME).fingerprint()
+    factory = _precompiled[fingerprint]
+
+    calls = 0
+
+    def counting_factory(**bindings: Any) -> dict[str, Any]:
+        nonlocal calls
+        calls += 1
+        return factory(**bindings)
+
+    register_precompiled(fingerprint, counting_factory)
+    try:
+
+        @dataclass(frozen=True)
+        class SameShape:
+            timestamp: int = field()
+            values: list[int] = field(default_factory=lambda: [1])
+
+        assert calls == 1
+        obj = SameShape(timestamp=1)
+        assert obj.values == [1]
+        assert obj == SameShape(timestamp=1, values=[1])
+        with raises(FrozenInstanceError):
+            obj.timestamp = 2  # type: ignore
+
+        @dataclass(frozen=True)
+        class DifferentShape:
+            timestamp: int = field()
+            values: list[int] = field(default=[])
+
+        # Fingerprint mismatch falls back to runtime generation.
+        assert calls == 1
+        assert DifferentShape(timestamp=1).values == []
+    finally:
+        register_precompiled(fingerprint, factory)
+
+
+def test_compile_lazy_methods() -> None:
+    class lazy_module:
+        @dataclass(lazy=True)
+        class Lazy:
+            x: int = 0
+
+    code = compile_module([lazy_module])
+    # Main factory, plus __repr__ and __eq__.
+    assert code.count("register_precompiled(") == 3
+    exec(code, {})
+    fingerprint = getattr(lazy_module.Lazy, PARAMS_NAME).fingerprint()
+    assert f"{fingerprint}|__repr__" in _precompiled
+    assert repr(lazy_module.Lazy(x=1)) == "Lazy(x=1)"
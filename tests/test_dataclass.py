@@ -1,6 +1,16 @@
+from sys import implementation
+
 from pytest import raises
 
-from udataclasses import FrozenInstanceError, dataclass, field
+from udataclasses import (
+    FrozenInstanceError,
+    asdict,
+    dataclass,
+    field,
+    fromdict,
+    replace,
+)
+from udataclasses.constants import SLOTS_SUPPORTED
 
 
 def test_empty() -> None:
@@ -37,6 +47,80 @@ def test_init_is_keyword_only() -> None:
     Class(a=1, b=2)
 
 
+def test_init_positional() -> None:
+    @dataclass(positional=("x", "y"))
+    class Class:
+        label: str = field(default="")
+        x: int = field()
+        y: int = field(default=0)
+        z: int = field(default=0)
+
+    # mypy assumes that __init__ only takes keyword arguments.
+    obj = Class(1, 2, z=3)  # type: ignore
+    assert (obj.x, obj.y, obj.z) == (1, 2, 3)
+    assert Class(x=2) == Class(2)  # type: ignore
+    with raises(TypeError):
+        Class(1, 2, 3)  # type: ignore
+
+
+def test_make() -> None:
+    calls = 0
+
+    @dataclass(frozen=True)
+    class Class:
+        b: int = field()
+        a: int = field(default=0)
+        c: list[int] = field(default_factory=list, init=False)
+
+        def __post_init__(self) -> None:
+            nonlocal calls
+            calls += 1
+
+    # Values of all fields, in alphabetical order by name.
+    obj = Class._make(1, 2, [3])  # type: ignore[attr-defined]
+    assert (obj.a, obj.b, obj.c) == (1, 2, [3])
+    assert calls == 1
+    with raises(TypeError):
+        Class._make(1, 2)  # type: ignore[attr-defined]
+
+
+def test_make_tuple_storage() -> None:
+    @dataclass(frozen=True, storage="tuple")
+    class Class:
+        a: int = field()
+        b: int = field()
+
+    assert Class._make(1, 2) == Class(a=1, b=2)  # type: ignore[attr-defined]
+
+
+def test_make_fields_named_like_locals() -> None:
+    @dataclass
+    class Class:
+        cls: int = field()
+        object: int = field()
+
+    @dataclass(frozen=True)
+    class Frozen:
+        cls: int = field()
+        object: int = field()
+
+    obj = Class._make(1, 2)  # type: ignore[attr-defined]
+    assert (obj.cls, obj.object) == (1, 2)
+    assert Frozen._make(1, 2) == Frozen(cls=1, object=2)  # type: ignore[attr-defined]
+
+
+def test_make_defined_in_class() -> None:
+    @dataclass
+    class Class:
+        a: int = field()
+
+        @classmethod
+        def _make(cls, a: int) -> "Class":
+            return cls(a=a + 1)
+
+    assert Class._make(1).a == 2
+
+
 def test_init_calls_post_init() -> None:
     a_value: int | None = None
 
@@ -108,6 +192,79 @@ def test_eq() -> None:
     assert Class(a=1, b=2, c=3) != Class(a=1, b=1, c=3)
 
 
+def test_compare_other_class() -> None:
+    @dataclass(order=True)
+    class Class:
+        a: int = field()
+
+    @dataclass(order=True)
+    class Other:
+        a: int = field()
+
+    assert Class(a=1) != Other(a=1)  # type: ignore[comparison-overlap]
+    assert Class(a=1) != 1  # type: ignore[comparison-overlap]
+    assert Class(a=1).__eq__(Other(a=1)) is NotImplemented
+    with raises(TypeError):
+        Class(a=1) < Other(a=1)  # type: ignore[operator]
+
+
+def test_order_matches_tuples() -> None:
+    @dataclass(order=True, frozen=True)
+    class Class:
+        a: int = field()
+        b: int = field()
+        c: int = field(compare=False)
+
+    values = [(a, b, c) for a in range(3) for b in range(3) for c in range(2)]
+    objects = [Class(a=a, b=b, c=c) for a, b, c in values]
+    for x, (xa, xb, _) in zip(objects, values):
+        for y, (ya, yb, _) in zip(objects, values):
+            assert (x == y) == ((xa, xb) == (ya, yb))
+            assert (x < y) == ((xa, xb) < (ya, yb))
+            assert (x <= y) == ((xa, xb) <= (ya, yb))
+            assert (x > y) == ((xa, xb) > (ya, yb))
+            assert (x >= y) == ((xa, xb) >= (ya, yb))
+    nan = float("nan")
+    x = Class(a=1, b=nan, c=0)  # type: ignore[arg-type]
+    assert x == x
+    assert x <= x
+    assert not x < x
+
+
+def test_compare_same_nan() -> None:
+    @dataclass(order=True)
+    class Class:
+        a: float = field()
+        b: float = field()
+
+    nan = float("nan")
+    other_nan = float("nan")
+    for a, b in [(nan, 1.0), (1.0, nan), (nan, nan)]:
+        x = Class(a=a, b=b)
+        y = Class(a=a, b=b)
+        # Distinct instances holding the same NaN object compare like tuples.
+        assert x == y
+        assert x <= y and x >= y
+        assert not x < y and not x > y
+        assert x in [y]
+    assert Class(a=nan, b=1.0) != Class(a=other_nan, b=1.0)
+    assert not Class(a=1.0, b=nan) <= Class(a=1.0, b=other_nan)
+
+
+def test_compare_equal_unorderable() -> None:
+    @dataclass(order=True)
+    class Class:
+        a: int = field()
+        b: dict[str, int] = field()
+
+    # Equal values are skipped without being ordered, like in tuples.
+    assert not Class(a=0, b={}) < Class(a=0, b={})
+    assert Class(a=0, b={}) <= Class(a=0, b={})
+    assert Class(a=0, b={}) >= Class(a=0, b={})
+    with raises(TypeError):
+        Class(a=0, b={}) < Class(a=0, b={"x": 1})
+
+
 def test_compare() -> None:
     @dataclass(order=True)
     class Class:
@@ -146,6 +303,18 @@ def test_implicit_hash() -> None:
     assert hash(Class(a=1, b=2)) != hash(Class(a=1, b=1))
 
 
+def test_hash_dict_keys() -> None:
+    @dataclass(frozen=True)
+    class Key:
+        channel: int = field()
+        unit: str = field()
+
+    keys = [Key(channel=i, unit=str(i % 7)) for i in range(1000)]
+    assert len({hash(key) for key in keys}) > 990
+    table = {key: i for i, key in enumerate(keys)}
+    assert all(table[Key(channel=i, unit=str(i % 7))] == i for i in range(1000))
+
+
 def test_disabled_hash() -> None:
     @dataclass(eq=True, frozen=False)
     class Class:
@@ -211,3 +380,579 @@ def test_inherited_fields_override() -> None:
 
     assert Base().field == 1
     assert Class().field == 2
+
+
+def test_plain_storage() -> None:
+    @dataclass(storage="plain", unsafe_hash=True, order=True)
+    class Class:
+        a: int = field()
+        b: int = 2
+        c: list[int] = field(default_factory=list, hash=False)
+
+    obj = Class(a=1)
+    assert obj.__dict__ == {"a": 1, "b": 2, "c": []}
+    assert repr(obj) == "Class(a=1, b=2, c=[])"
+    assert obj == Class(a=1, b=2)
+    assert obj < Class(a=2)
+    assert hash(obj) == hash(Class(a=1, b=2))
+
+    obj.a = 3
+    assert obj.a == 3
+    assert obj == Class(a=3)
+
+
+def test_plain_storage_class_attributes() -> None:
+    @dataclass(storage="plain")
+    class Class:
+        a: int = field()
+        b: int = field(default=2)
+
+    # Field specifiers are replaced by their default value, if any.
+    assert not hasattr(Class, "a")
+    assert Class.b == 2
+
+
+def test_plain_storage_frozen() -> None:
+    with raises(ValueError):
+
+        @dataclass(storage="plain", frozen=True)
+        class Class:
+            a: int = field()
+
+
+def test_slots() -> None:
+    @dataclass(slots=True)
+    class Class:
+        a: int = field()
+        b: int = 2
+
+    obj = Class(a=1)
+    assert obj == Class(a=1, b=2)
+    assert repr(obj) == "Class(a=1, b=2)"
+    if not SLOTS_SUPPORTED:
+        return
+    assert getattr(Class, "__slots__") == ("_a", "_b")
+    assert not hasattr(obj, "__dict__")
+    with raises(AttributeError):
+        obj.c = 3  # type: ignore[attr-defined]
+
+
+def test_slots_plain_storage() -> None:
+    @dataclass(slots=True, storage="plain")
+    class Class:
+        a: int = field()
+        b: int = 2
+
+    obj = Class(a=1)
+    obj.b = 3
+    assert obj == Class(a=1, b=3)
+    if SLOTS_SUPPORTED:
+        assert getattr(Class, "__slots__") == ("a", "b")
+
+
+def test_slots_inherited() -> None:
+    @dataclass(slots=True)
+    class Base:
+        a: int = field()
+
+    @dataclass(slots=True)
+    class Class(Base):
+        b: int = field()
+
+    obj = Class(a=1, b=2)
+    assert obj.a == 1
+    assert obj.b == 2
+    if not SLOTS_SUPPORTED:
+        return
+    assert getattr(Class, "__slots__") == ("_b",)
+    assert not hasattr(obj, "__dict__")
+
+
+def test_slots_memory_per_instance() -> None:
+    try:
+        import tracemalloc
+    except ImportError:
+        return
+    if not SLOTS_SUPPORTED:
+        return
+
+    @dataclass
+    class WithDict:
+        a: int = field()
+        b: int = field()
+        c: int = field()
+
+    @dataclass(slots=True)
+    class WithSlots:
+        a: int = field()
+        b: int = field()
+        c: int = field()
+
+    def instance_size(cls: type[WithDict] | type[WithSlots]) -> float:
+        count = 1000
+        tracemalloc.start()
+        try:
+            instances = [cls(a=1, b=2, c=3) for _ in range(count)]
+            size = tracemalloc.get_traced_memory()[0] / count
+        finally:
+            tracemalloc.stop()
+        del instances
+        return size
+
+    with_dict = instance_size(WithDict)
+    with_slots = instance_size(WithSlots)
+    # Measured on CPython 3.11: ~110 bytes with __dict__, ~65 bytes with slots.
+    assert with_slots < with_dict * 0.75, (with_slots, with_dict)
+
+
+def test_slots_already_defined() -> None:
+    if not SLOTS_SUPPORTED:
+        return
+    with raises(TypeError):
+
+        @dataclass(slots=True)
+        class Class:  # type: ignore[misc]
+            __slots__ = ("_a",)
+            a: int = field()
+
+
+def test_tuple_storage() -> None:
+    @dataclass(frozen=True, storage="tuple", order=True)
+    class Class:
+        a: int = field()
+        b: int = 2
+        c: list[int] = field(default_factory=list, compare=False, hash=False)
+        d: int = field(default=4, init=False)
+
+    obj = Class(a=1)
+    assert getattr(obj, "__dataclass_values__") == (1, 2, [], 4)
+    assert (obj.a, obj.b, obj.c, obj.d) == (1, 2, [], 4)
+    assert repr(obj) == "Class(a=1, b=2, c=[], d=4)"
+    assert obj == Class(a=1, c=[5])
+    assert obj != Class(a=1, b=3)
+    assert obj < Class(a=1, b=3)
+    assert hash(obj) == hash(Class(a=1, c=[5]))
+
+    with raises(FrozenInstanceError):
+        obj.a = 2  # type: ignore
+    with raises(FrozenInstanceError):
+        del obj.a
+
+
+def test_tuple_storage_requires_frozen() -> None:
+    with raises(ValueError):
+
+        @dataclass(storage="tuple")
+        class Class:
+            a: int = field()
+
+
+def test_tuple_storage_slots() -> None:
+    @dataclass(frozen=True, storage="tuple", slots=True)
+    class Class:
+        a: int = field()
+
+    assert Class(a=1).a == 1
+    if SLOTS_SUPPORTED:
+        assert getattr(Class, "__slots__") == ("__dataclass_values__",)
+
+
+def test_cache_hash() -> None:
+    calls = 0
+
+    class Value:
+        def __hash__(self) -> int:
+            nonlocal calls
+            calls += 1
+            return 1
+
+    @dataclass(frozen=True, cache_hash=True)
+    class Class:
+        a: Value = field()
+
+    obj = Class(a=Value())
+    assert hash(obj) == hash(Class(a=Value()))
+    calls = 0
+    hash(obj)
+    hash(obj)
+    assert calls == 0
+
+
+def test_cache_hash_slots() -> None:
+    @dataclass(frozen=True, cache_hash=True, slots=True)
+    class Class:
+        a: int = field()
+
+    assert hash(Class(a=1)) == hash(Class(a=1))
+
+
+def test_cache_hash_pickle() -> None:
+    """The cached hash isn't pickled, as it depends on the process's hash seed."""
+    if implementation.name == "micropython":
+        return
+    import subprocess
+    import sys
+
+    import udataclasses
+
+    define = (
+        "import pickle\n"
+        "from udataclasses import dataclass, field\n"
+        "@dataclass(frozen=True, cache_hash=True, cache_asdict=True, slots={slots})\n"
+        "class Key:\n"
+        "    unit: str = field()\n"
+    )
+    dump = "key = Key(unit='kPa'); hash(key); print(pickle.dumps(key).hex())"
+    load = (
+        "key = pickle.loads(bytes.fromhex({data!r})); print(key in {{Key(unit='kPa')}})"
+    )
+
+    def run(code: str, seed: str) -> str:
+        return subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            check=True,
+            env={
+                "PYTHONHASHSEED": seed,
+                "PYTHONPATH": udataclasses.__file__.rsplit("/", 2)[0],
+            },
+            text=True,
+        ).stdout.strip()
+
+    for slots in (False, True):
+        data = run(define.format(slots=slots) + dump, "1")
+        assert run(define.format(slots=slots) + load.format(data=data), "2") == "True"
+
+
+def test_cache_getstate() -> None:
+    if implementation.name == "micropython":
+        return
+    import copy
+
+    @dataclass(frozen=True, cache_hash=True, cache_asdict=True)
+    class Class:
+        a: int = field()
+
+    obj = Class(a=1)
+    hash(obj)
+    asdict(obj)
+    assert obj.__getstate__() == {"_a": 1}
+    assert copy.copy(obj) == obj
+
+    @dataclass(frozen=True, cache_hash=True)
+    class Custom:
+        a: int = field()
+
+        def __getstate__(self) -> object:
+            return "custom"
+
+    assert Custom(a=1).__getstate__() == "custom"
+
+
+def test_cache_hash_requires_hash() -> None:
+    with raises(ValueError):
+
+        @dataclass(cache_hash=True)
+        class Class:
+            a: int = field()
+
+
+def test_fields_named_like_builtins() -> None:
+    """Fields must not shadow builtins used by generated methods."""
+
+    @dataclass(frozen=True, order=True)
+    class Class:
+        dict: int = 1
+        hash: int = 2
+        type: int = 3
+
+    obj = Class()
+    assert hash(obj) == hash(Class())
+    assert obj <= Class()
+    assert repr(obj) == "Class(dict=1, hash=2, type=3)"
+
+
+def test_binary_format() -> None:
+    @dataclass
+    class Class:
+        id: int = field(format="<H")
+        name: bytes = field(format="4s")
+        note: str = field(default="")
+        value: float = field(format="f")
+
+    obj = Class(id=513, name=b"abcd", value=1.5)
+    data = obj.to_bytes()  # type: ignore[attr-defined]
+    # Fields are packed in alphabetical order: id, name, value
+    assert data == b"\x01\x02abcd\x00\x00\xc0\x3f"
+    assert Class.from_bytes(data) == obj  # type: ignore[attr-defined]
+
+    buf = bytearray(12)
+    obj.pack_into(buf, 2)  # type: ignore[attr-defined]
+    assert buf[2:] == data
+    assert Class.from_bytes(memoryview(buf), 2) == obj  # type: ignore[attr-defined]
+
+
+def test_binary_format_tuple_storage() -> None:
+    @dataclass(frozen=True, storage="tuple")
+    class Class:
+        a: int = field(format=">i")
+        b: int = field(format="b")
+
+    obj = Class(a=-2, b=3)
+    data = obj.to_bytes()  # type: ignore[attr-defined]
+    assert data == b"\xff\xff\xff\xfe\x03"
+    assert Class.from_bytes(data) == obj  # type: ignore[attr-defined]
+
+
+def test_decode_into() -> None:
+    @dataclass
+    class Class:
+        a: int = field(format="<h", default=0)
+        b: int = field(format="B", default=0)
+        c: str = field(default="unchanged")
+
+    obj = Class()
+    obj.decode_into(b"\x01\x00\x02")  # type: ignore[attr-defined]
+    assert obj == Class(a=1, b=2)
+    obj.decode_into(memoryview(bytearray(b"\xff\x03\x00\x04")), 1)  # type: ignore[attr-defined]
+    assert obj == Class(a=3, b=4)
+
+
+def test_decode_into_frozen() -> None:
+    @dataclass(frozen=True)
+    class Class:
+        a: int = field(format="<h")
+
+    obj = Class(a=1)
+    with raises(FrozenInstanceError):
+        obj.decode_into(b"\x02\x00")  # type: ignore[attr-defined]
+    assert obj.a == 1
+
+
+def test_update_from() -> None:
+    @dataclass
+    class Class:
+        a: int = field()
+        b: int = field()
+        c: int = field(init=False, default=0)
+
+    obj = Class(a=1, b=2)
+    obj.update_from({"b": 3, "c": 4})  # type: ignore[attr-defined]
+    assert (obj.a, obj.b, obj.c) == (1, 3, 4)
+
+    with raises(TypeError):
+        obj.update_from({"a": 5, "d": 6})  # type: ignore[attr-defined]
+
+
+def test_update_from_plain_storage() -> None:
+    @dataclass(storage="plain")
+    class Class:
+        a: int = field()
+
+    obj = Class(a=1)
+    obj.update_from({"a": 2})  # type: ignore[attr-defined]
+    assert obj.a == 2
+
+
+def test_update_from_frozen() -> None:
+    @dataclass(frozen=True)
+    class Class:
+        a: int = field()
+
+    obj = Class(a=1)
+    with raises(FrozenInstanceError):
+        obj.update_from({"a": 2})  # type: ignore[attr-defined]
+    assert obj.a == 1
+
+
+def test_update_from_cache_hash() -> None:
+    @dataclass(unsafe_hash=True, cache_hash=True)
+    class Class:
+        a: int = field(format="<H")
+
+    obj = Class(a=1)
+    hash(obj)
+    obj.update_from({"a": 2})  # type: ignore[attr-defined]
+    assert hash(obj) == hash(Class(a=2))
+    obj.decode_into(b"\x03\x00")  # type: ignore[attr-defined]
+    assert obj == Class(a=3)
+    assert hash(obj) == hash(Class(a=3))
+
+
+def test_update_from_user_defined() -> None:
+    @dataclass
+    class Class:
+        a: int = field()
+
+        def update_from(self, mapping: dict[str, int]) -> str:
+            return "user"
+
+    assert Class(a=1).update_from({"a": 2}) == "user"
+
+    @dataclass
+    class Named:
+        update_from: int = field()
+
+    assert Named(update_from=1).update_from == 1
+
+
+def test_lazy() -> None:
+    @dataclass(lazy=True, order=True, frozen=True)
+    class Class:
+        a: int = field()
+
+    stub = Class.__dict__["__repr__"]
+    assert repr(Class(a=1)) == "Class(a=1)"
+    # The stub replaced itself with the generated method.
+    assert Class.__dict__["__repr__"] is not stub
+    assert Class(a=1) == Class(a=1)
+    assert Class(a=1) != Class(a=2)
+    assert Class(a=1) < Class(a=2)
+    assert Class(a=1) <= Class(a=1)
+    assert Class(a=2) > Class(a=1)
+    assert Class(a=2) >= Class(a=1)
+    assert hash(Class(a=1)) == hash(Class(a=1))
+
+
+def test_lazy_subclass() -> None:
+    @dataclass(lazy=True, slots=True)
+    class Base:
+        a: int = field()
+
+    class Derived(Base):
+        pass
+
+    assert repr(Derived(a=1)) == "Derived(a=1)"
+    # The generated method replaced the stub on the dataclass itself.
+    assert "__repr__" not in Derived.__dict__
+    assert repr(Base(a=2)) == "Base(a=2)"
+
+
+def test_intern() -> None:
+    @dataclass(frozen=True, intern=True)
+    class Key:
+        channel: int = field(default=0)
+        unit: int = field()
+
+    a = Key(unit=1, channel=2)
+    assert Key(unit=1, channel=2) is a
+    assert Key(unit=1) is Key(unit=1, channel=0)
+    assert Key(unit=1) is not a
+    assert replace(a, channel=3) is Key(unit=1, channel=3)
+
+
+def test_intern_unhashable() -> None:
+    @dataclass(frozen=True, intern=True)
+    class Class:
+        values: list[int] = field()
+
+    a = Class(values=[1])
+    assert a.values == [1]
+    assert Class(values=[1]) is not a
+    assert Class(values=[1]) == a
+
+
+def test_intern_slots_post_init() -> None:
+    calls = 0
+
+    @dataclass(frozen=True, intern=True, slots=True, storage="tuple")
+    class Class:
+        a: int = field()
+
+        def __post_init__(self) -> None:
+            nonlocal calls
+            calls += 1
+
+    a = Class(a=1)
+    assert Class(a=1) is a
+    assert a.a == 1
+    # __post_init__ only runs for new instances.
+    assert calls == 1
+
+
+def test_intern_subclass() -> None:
+    @dataclass(frozen=True, intern=True)
+    class Base:
+        a: int = field()
+
+    class Derived(Base):
+        pass
+
+    assert Derived(a=1) is Derived(a=1)
+    assert type(Derived(a=1)) is Derived
+    assert Base(a=1) is not Derived(a=1)
+
+
+@dataclass(frozen=True, intern=True)
+class InternedKey:
+    channel: int = field(default=0)
+    unit: int = field()
+
+
+def test_intern_copy_pickle() -> None:
+    if implementation.name == "micropython":
+        return
+    import copy
+    import pickle
+
+    a = InternedKey(unit=1, channel=2)
+    assert copy.copy(a) is a
+    assert copy.deepcopy(a) is a
+    assert pickle.loads(pickle.dumps(a)) is a
+
+
+def test_intern_default_factory() -> None:
+    @dataclass(frozen=True, intern=True)
+    class Class:
+        items: list[int] = field(default_factory=list)
+        values: tuple[int, ...] = field(default_factory=tuple)
+
+    # Each instance gets its own value from the factory.
+    assert Class(values=(1,)).items is not Class(values=(1,)).items
+    assert Class(items=None).values is Class(items=None).values  # type: ignore[arg-type]
+
+    with raises(ValueError):
+
+        @dataclass(frozen=True, intern=True)
+        class NotInit:
+            items: list[int] = field(default_factory=list, init=False)
+
+
+def test_intern_argument_types() -> None:
+    a = InternedKey(unit=True)
+    b = InternedKey(unit=1)
+    c = InternedKey(unit=1.0)  # type: ignore[arg-type]
+    assert a is not b and b is not c
+    assert type(a.unit) is bool
+    assert type(b.unit) is int
+    assert type(c.unit) is float
+    assert InternedKey(unit=1) is b
+
+
+def test_intern_fromdict_init_false() -> None:
+    @dataclass(frozen=True, intern=True)
+    class Class:
+        a: int = field()
+        b: int = field(default=5, init=False)
+
+    a = Class(a=1)
+    assert fromdict(Class, asdict(a)) is a
+    with raises(TypeError):
+        fromdict(Class, {"a": 1, "c": 2})
+
+
+def test_intern_field_named_type() -> None:
+    @dataclass(frozen=True, intern=True)
+    class Class:
+        type: str = field(default="a")
+
+    assert Class(type="x").type == "x"
+    assert Class(type="x") is Class(type="x")
+
+
+def test_intern_requires_frozen() -> None:
+    with raises(ValueError):
+
+        @dataclass(intern=True)
+        class Class:
+            a: int = field()
@@ -0,0 +1,67 @@
+import sys
+
+from pytest import raises
+
+from udataclasses import dataclass, field, footprint
+
+
+def test_class() -> None:
+    @dataclass
+    class Class:
+        a: int = field()
+        b: list[int] = field(default_factory=list)
+
+    result = footprint(Class)
+    assert result.fields == 2
+    assert result.properties == 2
+    # Getter, setter and deleter of each property, plus methods.
+    assert result.functions > 6
+    assert result.bindings > 0
+    assert result.instance_bytes is None
+    if hasattr(sys, "getsizeof"):
+        assert result.bytecode_bytes
+        assert result.bindings_bytes
+        assert result.metadata_bytes
+
+
+def test_instance() -> None:
+    @dataclass(storage="plain")
+    class Class:
+        a: int = field()
+
+    result = footprint(Class(a=1))
+    assert result.properties == 0
+    if hasattr(sys, "getsizeof"):
+        assert result.instance_bytes
+
+
+def test_decoration_bytes() -> None:
+    try:
+        import tracemalloc
+    except ImportError:
+        # MicroPython measures decoration with gc.mem_alloc(), which is always
+        # available.
+        return
+
+    tracemalloc.start()
+    try:
+
+        @dataclass
+        class Class:
+            a: int = field()
+
+    finally:
+        tracemalloc.stop()
+    decoration_bytes = footprint(Class).decoration_bytes
+    assert decoration_bytes is not None and decoration_bytes > 0
+
+    @dataclass
+    class Untraced:
+        a: int = field()
+
+    assert footprint(Untraced).decoration_bytes is None
+
+
+def test_not_dataclass() -> None:
+    with raises(TypeError):
+        footprint(object())
@@ -9,9 +9,12 @@ from udataclasses import (
     MISSING,
     asdict,
     astuple,
+    build_iter,
+    build_many,
     dataclass,
     field,
     fields,
+    fromdict,
     is_dataclass,
     make_dataclass,
     replace,
@@ -50,6 +53,22 @@ def test_fields() -> None:
     assert instance_fields[1].name == "b"
     assert instance_fields[1].default == 1
 
+    # The same precomputed tuple is returned every time.
+    assert fields(Class) is fields(Class)
+
+
+def test_field_name_tuples() -> None:
+    @dataclass(unsafe_hash=True)
+    class Class:
+        c: int = field(compare=False)
+        b: int = field(init=False, default=0)
+        a: int = field(hash=False)
+
+    assert Class.__dataclass_names__ == ("a", "b", "c")  # type: ignore[attr-defined]
+    assert Class.__dataclass_init_names__ == ("a", "c")  # type: ignore[attr-defined]
+    assert Class.__dataclass_compare_names__ == ("a", "b")  # type: ignore[attr-defined]
+    assert Class.__dataclass_hash_names__ == ("b",)  # type: ignore[attr-defined]
+
 
 def test_replace() -> None:
     @dataclass
@@ -81,6 +100,78 @@ def test_replace_init_false_field() -> None:
         replace(obj, b=3)
 
 
+def test_replace_reinitializes_init_false_fields() -> None:
+    @dataclass
+    class Class:
+        a: int = field()
+        b: list[int] = field(init=False, default_factory=list)
+        c: int = field(init=False, default=0)
+
+    obj = Class(a=1)
+    obj.b.append(1)
+    obj.c = 2
+    new_obj = replace(obj, a=2)
+    assert new_obj.a == 2
+    assert new_obj.b == []
+    assert new_obj.c == 0
+
+
+def test_replace_post_init() -> None:
+    @dataclass
+    class Class:
+        a: int = field()
+        b: int = field(init=False)
+
+        def __post_init__(self) -> None:
+            self.b = self.a * 2
+
+    assert replace(Class(a=1), a=2).b == 4
+
+
+def test_replace_subclass_init() -> None:
+    @dataclass
+    class Base:
+        a: int = field()
+
+    class Subclass(Base):
+        def __init__(self, a: int) -> None:
+            super().__init__(a=a)
+            self.doubled = a * 2
+
+    new_obj = replace(Subclass(a=1), a=2)
+    assert type(new_obj) is Subclass
+    assert new_obj.doubled == 4
+    assert type(replace(Base(a=1), a=2)) is Base
+
+
+def test_replace_user_defined() -> None:
+    @dataclass
+    class Class:
+        a: int = field()
+
+        def __replace__(self, **changes: Any) -> "Class":
+            return Class(a=-1)
+
+    assert replace(Class(a=1), a=2).a == -1
+
+
+def test_copy_replace() -> None:
+    try:
+        import copy
+    except ImportError:
+        return
+    if not hasattr(copy, "replace"):
+        # Python < 3.13
+        return
+
+    @dataclass(frozen=True)
+    class Class:
+        a: int = field()
+        b: int = field()
+
+    assert copy.replace(Class(a=1, b=2), b=3) == Class(a=1, b=3)
+
+
 def test_asdict_nondataclass() -> None:
     with raises(TypeError):
         asdict(3)
@@ -166,6 +257,173 @@ def test_asdict_custom_factory() -> None:
     ]
 
 
+def test_write_json() -> None:
+    import io
+    import json
+
+    @dataclass
+    class Point:
+        x: float = field(default=0.0)
+        y: Any = field(default=None)
+
+    @dataclass
+    class Class:
+        empty: Any = field(default_factory=list)
+        mapping: dict[Any, Any] = field(default_factory=dict)
+        name: str = field(default="")
+        points: list[Point] = field(default_factory=list)
+        position: Point = field(default_factory=Point)
+
+    @dataclass
+    class Empty:
+        pass
+
+    objects = [
+        Class(),
+        Class(
+            empty=Empty(),
+            mapping={"a": (1, 2), "b": Point(x=1.5), "c": {}},
+            name='quote " and \\ backslash',
+            points=[Point(y=True), Point(y=[1, "2"])],
+        ),
+        Class(points=[Point(x=float("inf"), y=float("nan")), Point(x=-2, y=0.1)]),
+    ]
+    for obj in objects:
+        stream = io.StringIO()
+        obj.write_json(stream)  # type: ignore[attr-defined]
+        assert stream.getvalue() == json.dumps(asdict(obj))
+
+    # Non-string keys are converted to strings, like json.dumps() does.
+    stream = io.StringIO()
+    Class(mapping={1: 2, None: 3}).write_json(stream)  # type: ignore[attr-defined]
+    assert '"mapping": {"1": 2, "null": 3}' in stream.getvalue()
+
+
+def test_write_json_unsupported_type() -> None:
+    import io
+
+    @dataclass
+    class Class:
+        a: Any = field()
+
+    with raises(TypeError):
+        Class(a=object()).write_json(io.StringIO())  # type: ignore[attr-defined]
+
+
+def test_write_json_user_defined() -> None:
+    import io
+
+    @dataclass
+    class Point:
+        x: int = field()
+
+        def write_json(self, stream: Any) -> None:
+            stream.write("user")
+
+    @dataclass
+    class Class:
+        point: Point = field()
+        write_json: int = field(default=0)
+
+    stream = io.StringIO()
+    Point(x=1).write_json(stream)
+    assert stream.getvalue() == "user"
+
+    # Nested dataclasses are still written with the generated method.
+    obj = Class(point=Point(x=1))
+    assert obj.write_json == 0
+    stream = io.StringIO()
+    Class.__dataclass_write_json__(obj, stream)  # type: ignore[attr-defined]
+    assert stream.getvalue() == '{"point": {"x": 1}, "write_json": 0}'
+
+
+def test_fromdict() -> None:
+    @dataclass
+    class Point:
+        x: int = field(default=0)
+        y: int = field(default=0)
+
+    @dataclass
+    class Class:
+        name: str = field()
+        points: list[Point] = field(type=Point, default_factory=list)
+        position: Point | None = field(type=Point, default=None)
+
+    obj = Class(name="a", points=[Point(x=1), Point(y=2)], position=Point(x=3))
+    assert fromdict(Class, asdict(obj)) == obj
+
+    obj = fromdict(Class, {"name": "b"})
+    assert obj == Class(name="b")
+    assert obj.points == []
+    assert obj.points is not fromdict(Class, {"name": "b"}).points
+
+
+def test_fromdict_invalid_keys() -> None:
+    @dataclass
+    class Class:
+        a: int = field()
+        b: int = field(default=0)
+
+    with raises(TypeError):
+        fromdict(Class, {"b": 1})
+    with raises(TypeError):
+        fromdict(Class, {"a": 1, "c": 2})
+    with raises(TypeError):
+        fromdict(int, {})
+
+
+def test_fromdict_init_false() -> None:
+    @dataclass
+    class Class:
+        a: int = field()
+        b: int = field(init=False)
+        c: int = field(init=False, default=2)
+
+    obj = fromdict(Class, {"a": 1, "b": 3})
+    assert (obj.a, obj.b, obj.c) == (1, 3, 2)
+
+
+def test_fromdict_post_init() -> None:
+    @dataclass
+    class Class:
+        a: int = field()
+        b: int = field(init=False)
+
+        def __post_init__(self) -> None:
+            self.b = self.a * 2
+
+    assert fromdict(Class, {"a": 2}).b == 4
+
+
+def test_fromdict_custom_init() -> None:
+    @dataclass
+    class Point:
+        x: int = field(default=0)
+
+    @dataclass
+    class Class:
+        a: int = field()
+        point: Point = field(type=Point)
+
+        def __init__(self, a: int, point: Point) -> None:
+            self.a = a * 10
+            self.point = point
+
+    obj = fromdict(Class, {"a": 1, "point": {"x": 2}})
+    assert obj.a == 10
+    assert obj.point == Point(x=2)
+
+
+def test_fromdict_tuple_storage() -> None:
+    @dataclass(frozen=True, storage="tuple")
+    class Class:
+        a: int = field()
+        b: list[int] = field(init=False, default_factory=list)
+
+    obj = Class(a=1)
+    assert fromdict(Class, asdict(obj)) == obj
+
+
 def test_astuple() -> None:
     @dataclass
     class Class:
@@ -207,3 +465,165 @@ def test_make_dataclass_namespace() -> None:
     assert class_fields[0].name == "value"
 
     assert Class(value=2).square() == 4
+
+
+def test_replace_tuple_storage() -> None:
+    @dataclass(frozen=True, storage="tuple")
+    class Class:
+        a: int = field()
+        b: int = field()
+        c: list[int] = field(default_factory=list, init=False)
+
+    obj = Class(a=1, b=2)
+    new_obj = replace(obj, b=3)
+    assert new_obj == Class(a=1, b=3)
+    # init=False fields are reinitialized.
+    assert new_obj.c is not obj.c
+
+    with raises(TypeError):
+        replace(obj, d=3)
+    with raises(ValueError):
+        replace(obj, c=[])
+
+
+def test_asdict_cached() -> None:
+    @dataclass(frozen=True, cache_asdict=True)
+    class Class:
+        a: int = field()
+
+    obj = Class(a=1)
+    result = asdict(obj)
+    assert result == {"a": 1}
+    assert asdict(obj) is result
+    # Custom dict factories bypass the cache.
+    assert asdict(obj, dict_factory=list) == [("a", 1)]
+
+
+def test_asdict_cached_requires_frozen() -> None:
+    with raises(ValueError):
+
+        @dataclass(cache_asdict=True)
+        class Class:
+            a: int = field()
+
+
+def test_asdict_fields_named_like_builtins() -> None:
+    @dataclass
+    class Class:
+        dict: int = 1
+        type: int = 2
+
+    assert asdict(Class()) == {"dict": 1, "type": 2}
+
+
+def test_build_many() -> None:
+    @dataclass
+    class Class:
+        a: int = field()
+        b: list[int] = field(default_factory=list)
+        c: int = field(default=3, init=False)
+
+    rows: list[Any] = [(1, [2]), [4, [5]], {"a": 6, "b": [7]}]
+    instances = build_many(Class, rows)
+    assert [(x.a, x.b, x.c) for x in instances] == [
+        (1, [2], 3),
+        (4, [5], 3),
+        (6, [7], 3),
+    ]
+    assert list(build_iter(Class, rows)) == instances
+
+    instances = build_many(Class, [(2,), (1,)], fields=["a"])
+    assert [x.a for x in instances] == [2, 1]
+    # Default factories are called for each instance.
+    assert instances[0].b is not instances[1].b
+
+
+def test_build_many_tuple_storage() -> None:
+    @dataclass(frozen=True, storage="tuple")
+    class Class:
+        a: int = field()
+        b: int = field(default=2)
+
+    assert build_many(Class, [(1,)], fields=["a"]) == [Class(a=1, b=2)]
+
+
+def test_build_many_post_init() -> None:
+    @dataclass
+    class Class:
+        a: int = field()
+        b: int = field(default=0, init=False)
+
+        def __post_init__(self) -> None:
+            self.b = self.a * 2
+
+    assert [x.b for x in build_iter(Class, [(1,), (2,)])] == [2, 4]
+
+
+def test_build_many_invalid() -> None:
+    @dataclass
+    class Class:
+        a: int = field()
+        b: int = field(default=0, init=False)
+
+    with raises(TypeError):
+        build_many(Class, [], fields=["x"])
+    with raises(TypeError):
+        build_many(Class, [], fields=[])
+    with raises(ValueError):
+        build_many(Class, [], fields=["a", "a"])
+    with raises(ValueError):
+        build_many(Class, [], fields=["a", "b"])
+    with raises(TypeError):
+        build_many(Class, [(1, 2)])
+    with raises(TypeError):
+        build_many(object, [])
+
+
+def test_build_many_invalid_rows() -> None:
+    @dataclass
+    class Class:
+        a: int = field()
+        b: int = field()
+
+    with raises(TypeError, match="Missing field: b"):
+        build_many(Class, [(1,)])
+    with raises(TypeError, match="Missing field: a"):
+        list(build_iter(Class, [()]))
+    with raises(TypeError, match="Missing field: b"):
+        build_many(Class, [{"a": 1}])
+    with raises(TypeError, match="Unknown field: c"):
+        build_many(Class, [{"a": 1, "b": 2, "c": 3}])
+
+
+def test_build_many_dict_defaults() -> None:
+    @dataclass
+    class Class:
+        a: int = field()
+        b: list[int] = field(default_factory=list)
+        c: int = field(default=3)
+
+    instances = build_many(Class, [{"a": 1}, {"a": 2, "c": 4}])
+    assert [(x.a, x.b, x.c) for x in instances] == [(1, [], 3), (2, [], 4)]
+    assert instances[0].b is not instances[1].b
+
+
+def test_build_many_init_false() -> None:
+    @dataclass(init=False)
+    class Class:
+        a: int = field()
+        b: int = field(default=2)
+
+    instances = build_many(Class, [(1, 3), {"a": 4}])
+    assert [(x.a, x.b) for x in instances] == [(1, 3), (4, 2)]
+    assert fromdict(Class, {"a": 5}).a == 5
+
+
+def test_build_many_custom_init() -> None:
+    @dataclass
+    class Class:
+        a: int = field()
+
+        def __init__(self, a: int) -> None:
+            self.a = a + 1
+
+    assert [x.a for x in build_many(Class, [(1,), {"a": 2}])] == [2, 3]
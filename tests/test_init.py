@@ -0,0 +1,96 @@
+from sys import implementation
+
+from pytest import raises
+
+import udataclasses
+from udataclasses import MISSING
+
+
+def test_lazy_attributes() -> None:
+    for name in udataclasses.__all__:
+        assert getattr(udataclasses, name) is not None
+    assert udataclasses.make_dataclass.__name__ == "make_dataclass"
+    assert udataclasses.footprint.__name__ == "footprint"
+
+
+def test_lazy_attributes_unsupported() -> None:
+    if implementation.name == "micropython":
+        return
+    import subprocess
+    import sys
+
+    # Ports without module __getattr__ support import all names up front.
+    code = (
+        "import udataclasses\n"
+        "udataclasses._import_lazy_names(object())\n"
+        "print(all(n in vars(udataclasses) for n in udataclasses._LAZY_MODULES))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        env={"PYTHONPATH": udataclasses.__file__.rsplit("/", 2)[0]},
+        text=True,
+    ).stdout
+    assert output == "True\n"
+
+
+def test_unknown_attribute() -> None:
+    with raises(AttributeError):
+        getattr(udataclasses, "missing_attribute")
+
+
+def test_missing() -> None:
+    assert repr(MISSING) == "MISSING"
+    assert MISSING == MISSING
+    assert MISSING != None
+    if implementation.name == "micropython":
+        return
+    import copy
+    import pickle
+
+    assert copy.deepcopy(MISSING) is MISSING
+    assert pickle.loads(pickle.dumps(MISSING)) is MISSING
+
+
+def test_import_dependencies() -> None:
+    if implementation.name == "micropython":
+        return
+    import subprocess
+    import sys
+
+    # Modules that are slow to import, which the decorator doesn't need.
+    code = (
+        "import sys\n"
+        "from udataclasses import dataclass, field\n"
+        "slow = {'collections', 'enum', 'json', 'typing', 'udataclasses.functions'}\n"
+        "print(sorted(slow & set(sys.modules)))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        env={"PYTHONPATH": udataclasses.__file__.rsplit("/", 2)[0]},
+        text=True,
+    ).stdout
+    assert output == "[]\n"
+
+
+def test_mip_manifest() -> None:
+    if implementation.name == "micropython":
+        return
+    import json
+    import os
+
+    package_dir = os.path.dirname(udataclasses.__file__)
+    manifest = os.path.join(package_dir, "..", "..", "package.json")
+    with open(manifest) as f:
+        urls = json.load(f)["urls"]
+    installed = {destination for destination, _ in urls}
+    # The compile tool runs on the host, so it isn't installed on devices.
+    modules = {
+        f"udataclasses/{name}"
+        for name in os.listdir(package_dir)
+        if name.endswith(".py") and name != "compile.py"
+    }
+    assert installed == modules
@@ -0,0 +1,41 @@
+import gc
+from sys import implementation
+
+from udataclasses import dataclass, field
+from udataclasses.constants import PARAMS_NAME
+from udataclasses.intern import LRUTable
+
+
+def test_lru_table() -> None:
+    table = LRUTable(2)
+    table["a"] = 1
+    table["b"] = 2
+    assert table["a"] == 1
+    # "b" is the least recently used.
+    table["c"] = 3
+    assert len(table) == 2
+    assert table["a"] == 1
+    assert table["c"] == 3
+    try:
+        table["b"]
+    except KeyError:
+        pass
+    else:
+        raise AssertionError("Expected KeyError")
+
+
+def test_table_releases_instances() -> None:
+    if implementation.name == "micropython":
+        # Instances are kept alive by the LRU table.
+        return
+
+    @dataclass(frozen=True, intern=True)
+    class Class:
+        a: int = field()
+
+    table = getattr(Class, PARAMS_NAME).intern_table
+    obj = Class(a=1)
+    assert len(table) == 1
+    del obj
+    gc.collect()
+    assert len(table) == 0
@@ -0,0 +1,144 @@
+from pytest import raises
+
+from udataclasses import Pool, dataclass, field
+
+
+@dataclass
+class Message:
+    payload: list[int] = field(default_factory=list)
+    sequence: int = field()
+    status: str = field(default="new")
+
+
+def test_acquire_release() -> None:
+    pool = Pool(Message, 2)
+    assert len(pool) == 2
+
+    a = pool.acquire()
+    b = pool.acquire()
+    assert a is not b
+    assert len(pool) == 0
+    with raises(IndexError):
+        pool.acquire()
+
+    pool.release(a)
+    assert len(pool) == 1
+    assert pool.acquire() is a
+
+
+def test_release_resets_defaults() -> None:
+    pool = Pool(Message, 1)
+    message = pool.acquire()
+    assert message.payload == []
+    assert message.status == "new"
+
+    payload = message.payload
+    message.payload.append(1)
+    message.sequence = 1
+    message.status = "done"
+    pool.release(message)
+
+    message = pool.acquire()
+    assert message.payload == []
+    assert message.payload is not payload
+    assert message.status == "new"
+
+
+def test_frozen() -> None:
+    @dataclass(frozen=True)
+    class Frozen:
+        a: int = field(default=0)
+
+    with raises(ValueError):
+        Pool(Frozen, 1)
+
+
+def test_not_dataclass() -> None:
+    class Class:
+        pass
+
+    with raises(TypeError):
+        Pool(Class, 1)
+
+
+def test_debug_read_after_release() -> None:
+    pool = Pool(Message, 1, debug=True)
+    message = pool.acquire()
+    message.sequence = 1
+    assert message.status == "new"
+    pool.release(message)
+
+    with raises(AttributeError):
+        message.status
+
+
+def test_debug_write_after_release() -> None:
+    pool = Pool(Message, 1, debug=True)
+    message = pool.acquire()
+    pool.release(message)
+
+    message.sequence = 2
+    with raises(RuntimeError):
+        pool.acquire()
+
+
+def test_debug_double_release() -> None:
+    pool = Pool(Message, 1, debug=True)
+    message = pool.acquire()
+    pool.release(message)
+    with raises(ValueError):
+        pool.release(message)
+
+
+def test_debug_foreign_instance() -> None:
+    pool = Pool(Message, 1, debug=True)
+    with raises(ValueError):
+        pool.release(Message(sequence=1))
+
+
+def test_debug_plain_storage() -> None:
+    @dataclass(storage="plain")
+    class Plain:
+        a: int = field(default=0)
+
+    pool = Pool(Plain, 1, debug=True)
+    obj = pool.acquire()
+    obj.a = 1
+    pool.release(obj)
+    obj = pool.acquire()
+    assert obj.a == 0
+    pool.release(obj)
+
+    obj.a = 2
+    with raises(RuntimeError):
+        pool.acquire()
+
+
+def test_user_defined_reset() -> None:
+    @dataclass
+    class Class:
+        a: int = field(default=0)
+
+        def _reset(self) -> None:
+            self.a = -1
+
+    obj = Class()
+    obj._reset()
+    assert obj.a == -1
+
+    pool = Pool(Class, 1)
+    obj = pool.acquire()
+    assert obj.a == -1
+    obj.a = 1
+    pool.release(obj)
+    assert obj.a == -1
+
+
+def test_field_named_reset() -> None:
+    @dataclass
+    class Class:
+        _reset: int = field(default=0)
+
+    assert Class()._reset == 0
+    with raises(TypeError):
+        Pool(Class, 1)
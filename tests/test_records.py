@@ -0,0 +1,139 @@
+from array import array
+
+from pytest import raises
+
+from udataclasses import RecordArray, dataclass, field
+from udataclasses.records import typecode
+
+
+@dataclass
+class Sample:
+    label: str = field(default="")
+    sequence: int = field(format="<I")
+    value: float = field(format="<f")
+
+
+def test_columns() -> None:
+    records = RecordArray(Sample, 4)
+    assert len(records) == 0
+    assert isinstance(records.columns["sequence"], array)
+    assert isinstance(records.columns["value"], array)
+    assert records.columns["label"] == [None] * 4
+
+    records.append(Sample(sequence=1, value=0.5, label="a"))
+    records.append(Sample(sequence=2, value=1.5))
+    assert len(records) == 2
+    assert list(records.columns["sequence"][:2]) == [1, 2]
+    assert sum(records.columns["value"]) == 2.0
+
+
+def test_column_item_sizes() -> None:
+    from struct import calcsize
+
+    # Arrays use native sizes, which differ from standard sizes, e.g. for "L"
+    # on 64-bit platforms.
+    @dataclass
+    class Standard:
+        a: int = field(format="<L")
+        b: int = field(format="<q")
+        c: int = field(format="<b")
+        d: float = field(format="<d")
+
+    @dataclass
+    class Native:
+        a: int = field(format="L")
+        b: int = field(format="H")
+
+    for cls in (Standard, Native):
+        records = RecordArray(cls, 1)
+        for f in cls.__dataclass_fields__.values():
+            code = typecode(f)
+            assert code is not None
+            assert calcsize(code) == calcsize(f.format)
+            assert isinstance(records.columns[f.name], array)
+    assert typecode(Native.__dataclass_fields__["a"]) == "L"
+
+
+def test_views() -> None:
+    records = RecordArray(Sample, 2)
+    records.append(Sample(sequence=1, value=0.5, label="a"))
+    records.append(Sample(sequence=2, value=1.5, label="b"))
+    assert records[0].sequence == 1
+    assert records[-1].label == "b"
+    assert [view.sequence for view in records] == [1, 2]
+    with raises(AttributeError):
+        records[0].missing
+    with raises(IndexError):
+        records[2]
+
+
+def test_get() -> None:
+    records = RecordArray(Sample, 1)
+    records.append(Sample(sequence=1, value=0.5, label="a"))
+    assert records.get(0) == Sample(sequence=1, value=0.5, label="a")
+
+
+def test_full() -> None:
+    records = RecordArray(Sample, 1)
+    records.append(Sample(sequence=1, value=0.5))
+    with raises(IndexError):
+        records.append(Sample(sequence=2, value=0.5))
+    records.clear()
+    assert len(records) == 0
+    records.append(Sample(sequence=2, value=0.5))
+    assert records[0].sequence == 2
+
+
+def test_ring() -> None:
+    records = RecordArray(Sample, 3, ring=True)
+    for i in range(5):
+        records.append(Sample(sequence=i, value=0.0))
+    assert len(records) == 3
+    # Oldest records were overwritten.
+    assert [view.sequence for view in records] == [2, 3, 4]
+    assert records.get(0).sequence == 2
+    assert records.physical_index(0) == 2
+    assert list(records.columns["sequence"]) == [3, 4, 2]
+
+
+def test_append_invalid_value() -> None:
+    @dataclass
+    class Class:
+        a: int = field(format="<H")
+        b: int = field(format="<H")
+
+    for ring in (False, True):
+        records = RecordArray(Class, 1, ring=ring)
+        with raises(OverflowError):
+            records.append(Class(a=1, b=-1))
+        assert len(records) == 0
+
+    records = RecordArray(Class, 1, ring=True)
+    records.append(Class(a=1, b=2))
+    with raises(OverflowError):
+        records.append(Class(a=3, b=-1))
+    with raises(AttributeError):
+        records.append(object())  # type: ignore[arg-type]
+    assert len(records) == 1
+    assert records.get(0) == Class(a=1, b=2)
+
+
+def test_make_defined_in_class() -> None:
+    @dataclass
+    class Class:
+        a: int = field()
+
+        @classmethod
+        def _make(cls, *args: int) -> "Class":
+            raise AssertionError("Not a generated _make()")
+
+    records = RecordArray(Class, 1)
+    records.append(Class(a=1))
+    assert records.get(0) == Class(a=1)
+
+
+def test_invalid() -> None:
+    with raises(TypeError):
+        RecordArray(object, 1)
+    with raises(ValueError):
+        RecordArray(Sample, 0)
@@ -1,7 +1,15 @@
 from sys import implementation
 
 import udataclasses.source as source
+from udataclasses import field
+from udataclasses.constants import SOURCE_VERSION
 from udataclasses.field import Field
+from udataclasses.transform_spec import TransformSpec
+
+try:
+    from typing import Any, Callable
+except ImportError:
+    pass
 
 
 def assert_lines(actual: str, expected_lines: list[str]) -> None:
@@ -37,6 +45,37 @@ def test_init() -> None:
     )
 
 
+def test_init_positional() -> None:
+    out = source.init(
+        [Field("a"), Field("b", default=2), Field("c")], positional=("c", "a")
+    )
+    assert_lines(
+        out,
+        [
+            "def __init__(self, c, a, *, b=__dataclass_default_b):",
+            "    self._a = a",
+            "    self._b = b",
+            "    self._c = c",
+        ],
+    )
+
+
+def test_make() -> None:
+    out = source.make([Field("a"), Field("b", init=False)], post_init=True)
+    assert_lines(
+        out,
+        [
+            "@classmethod",
+            "def _make(__dataclass_cls, a, b):",
+            "    self = __dataclass_object_new(__dataclass_cls)",
+            "    self._a = a",
+            "    self._b = b",
+            "    self.__post_init__()",
+            "    return self",
+        ],
+    )
+
+
 def test_init_empty() -> None:
     out = source.init([])
     assert_lines(
@@ -155,7 +194,12 @@ def test_eq() -> None:
         out,
         [
             "def __eq__(self, other):",
-            "    return (self._a, self._b,) == (other._a, other._b,)",
+            "    if self is other:",
+            "        return True",
+            "    if other.__class__ is not self.__class__:",
+            "        return NotImplemented",
+            "    return (self._a is other._a or self._a == other._a)"
+            " and (self._b is other._b or self._b == other._b)",
         ],
     )
 
@@ -166,7 +210,15 @@ def test_lt() -> None:
         out,
         [
             "def __lt__(self, other):",
-            "    return (self._a, self._b,) < (other._a, other._b,)",
+            "    if self is other:",
+            "        return False",
+            "    if other.__class__ is not self.__class__:",
+            "        return NotImplemented",
+            "    if self._a is not other._a and self._a != other._a:",
+            "        return self._a < other._a",
+            "    if self._b is not other._b and self._b != other._b:",
+            "        return self._b < other._b",
+            "    return False",
         ],
     )
 
@@ -177,7 +229,15 @@ def test_le() -> None:
         out,
         [
             "def __le__(self, other):",
-            "    return (self._a, self._b,) <= (other._a, other._b,)",
+            "    if self is other:",
+            "        return True",
+            "    if other.__class__ is not self.__class__:",
+            "        return NotImplemented",
+            "    if self._a is not other._a and self._a != other._a:",
+            "        return self._a <= other._a",
+            "    if self._b is not other._b and self._b != other._b:",
+            "        return self._b <= other._b",
+            "    return True",
         ],
     )
 
@@ -188,7 +248,15 @@ def test_gt() -> None:
         out,
         [
             "def __gt__(self, other):",
-            "    return (self._a, self._b,) > (other._a, other._b,)",
+            "    if self is other:",
+            "        return False",
+            "    if other.__class__ is not self.__class__:",
+            "        return NotImplemented",
+            "    if self._a is not other._a and self._a != other._a:",
+            "        return self._a > other._a",
+            "    if self._b is not other._b and self._b != other._b:",
+            "        return self._b > other._b",
+            "    return False",
         ],
     )
 
@@ -199,7 +267,15 @@ def test_ge() -> None:
         out,
         [
             "def __ge__(self, other):",
-            "    return (self._a, self._b,) >= (other._a, other._b,)",
+            "    if self is other:",
+            "        return True",
+            "    if other.__class__ is not self.__class__:",
+            "        return NotImplemented",
+            "    if self._a is not other._a and self._a != other._a:",
+            "        return self._a >= other._a",
+            "    if self._b is not other._b and self._b != other._b:",
+            "        return self._b >= other._b",
+            "    return True",
         ],
     )
 
@@ -217,11 +293,62 @@ def test_hash() -> None:
         out,
         [
             "def __hash__(self):",
-            "    return hash((self._a, self._b, self._c,))",
+            "    if __dataclass_fold_hashes:",
+            "        h = 0x345678 ^ hash(self._a)",
+            "        h = (h & 0x7FFF) * 0x5BD1 ^ (h >> 15 & 0x7FFF) * 0x6F4F ^ hash(self._b)",
+            "        h = (h & 0x7FFF) * 0x5BD1 ^ (h >> 15 & 0x7FFF) * 0x6F4F ^ hash(self._c)",
+            "        return (h & 0x7FFF) * 0x5BD1 ^ (h >> 15 & 0x7FFF) * 0x6F4F",
+            "    else:",
+            "        return hash((self._a, self._b, self._c,))",
         ],
     )
 
 
+def test_hash_tuple_storage() -> None:
+    out = source.hash([Field("a"), Field("b")], storage="tuple")
+    assert_lines(
+        out,
+        [
+            "def __hash__(self):",
+            "    return hash(self.__dataclass_values__)",
+        ],
+    )
+
+
+class Values:
+    def __init__(self, a: object, b: object) -> None:
+        self._a = a
+        self._b = b
+
+
+def folded_hash() -> Callable[[Values], int]:
+    """Compiles a __hash__ method for Values that folds field hashes."""
+    namespace: dict[str, Any] = {"__dataclass_fold_hashes": True}
+    exec(source.hash([Field("a"), Field("b")]), namespace)
+    return namespace["__hash__"]  # type: ignore[no-any-return]
+
+
+def test_hash_folded() -> None:
+    hash_values = folded_hash()
+    assert hash_values(Values(1, "x")) == hash_values(Values(1, "x"))
+    assert hash_values(Values(1, 2)) != hash_values(Values(2, 1))
+    # Results are small integers, even for large field hashes.
+    for a in (-1, 0, 2**29, -(2**29), "x", 1.5, None):
+        assert 0 <= hash_values(Values(a, a)) < 2**30
+
+
+def test_hash_folded_collisions() -> None:
+    hash_values = folded_hash()
+    size = 100
+    hashes = [hash_values(Values(a, b)) for a in range(size) for b in range(size)]
+    # Nearly all hashes are distinct, including in the low bits used by dicts.
+    assert len(set(hashes)) > 0.99 * size**2
+    low_bits = {h & 0x3FF for h in hashes}
+    assert len(low_bits) == 0x400
+    strings = [hash_values(Values(f"key{i}", i % 3)) for i in range(size**2)]
+    assert len(set(strings)) > 0.99 * size**2
+
+
 def test_hash_empty() -> None:
     out = source.hash([])
     assert_lines(
@@ -231,3 +358,514 @@ def test_hash_empty() -> None:
             "    return hash(())",
         ],
     )
+
+
+def test_factory() -> None:
+    out = source.factory(
+        "make",
+        ["FrozenInstanceError"],
+        {"a": source.getter(Field("a"))},
+        {"__hash__": "__hash__ = None"},
+    )
+    assert_lines(
+        out,
+        [
+            "def make(FrozenInstanceError):",
+            "    def __dataclass_properties():",
+            "        @property",
+            "        def a(self):",
+            "            return self._a",
+            "        return {'a': a}",
+            "    __dataclass_attributes = __dataclass_properties()",
+            "    __hash__ = None",
+            "    __dataclass_attributes['__hash__'] = __hash__",
+            "    return __dataclass_attributes",
+        ],
+    )
+
+
+def test_asdict() -> None:
+    out = source.asdict([Field("a"), Field("b")])
+    assert_lines(
+        out,
+        [
+            "def __dataclass_asdict__(self, dict_factory):",
+            "    v0 = self._a",
+            "    if type(v0) not in __dataclass_simple_types:",
+            "        v0 = __dataclass_asdict_value(v0, dict_factory)",
+            "    v1 = self._b",
+            "    if type(v1) not in __dataclass_simple_types:",
+            "        v1 = __dataclass_asdict_value(v1, dict_factory)",
+            "    if dict_factory is dict:",
+            "        return {'a': v0, 'b': v1}",
+            "    return dict_factory([('a', v0), ('b', v1)])",
+        ],
+    )
+
+
+def test_init_plain_storage() -> None:
+    out = source.init([Field("a"), Field("b", default_factory=list)], storage="plain")
+    assert_lines(
+        out,
+        [
+            "def __init__(self, *, a, b=FACTORY_SENTINEL):",
+            "    self.a = a",
+            "    self.b = __dataclass_default_b() if b is FACTORY_SENTINEL else b",
+        ],
+    )
+
+
+def test_eq_plain_storage() -> None:
+    out = source.eq([Field("a"), Field("b")], storage="plain")
+    assert_lines(
+        out,
+        [
+            "def __eq__(self, other):",
+            "    if self is other:",
+            "        return True",
+            "    if other.__class__ is not self.__class__:",
+            "        return NotImplemented",
+            "    return (self.a is other.a or self.a == other.a)"
+            " and (self.b is other.b or self.b == other.b)",
+        ],
+    )
+
+
+def test_getter_tuple_storage() -> None:
+    out = source.getter(Field("member"), index=2)
+    assert_lines(
+        out,
+        [
+            "@property",
+            "def member(self):",
+            "    return self.__dataclass_values__[2]",
+        ],
+    )
+
+
+def test_init_tuple_storage() -> None:
+    out = source.init(
+        [
+            Field("a"),
+            Field("b", default_factory=list),
+            Field("c", init=False, default=3),
+        ],
+        storage="tuple",
+    )
+    assert_lines(
+        out,
+        [
+            "def __init__(self, *, a, b=FACTORY_SENTINEL):",
+            "    self.__dataclass_values__ = (a,"
+            " __dataclass_default_b() if b is FACTORY_SENTINEL else b,"
+            " __dataclass_default_c,)",
+        ],
+    )
+
+
+def test_eq_tuple_storage() -> None:
+    out = source.eq([Field("a"), Field("b")], storage="tuple")
+    assert_lines(
+        out,
+        [
+            "def __eq__(self, other):",
+            "    if self is other:",
+            "        return True",
+            "    if other.__class__ is not self.__class__:",
+            "        return NotImplemented",
+            "    return self.__dataclass_values__ == other.__dataclass_values__",
+        ],
+    )
+
+
+def test_eq_tuple_storage_excluded_field() -> None:
+    out = source.eq([Field("a"), Field("b", compare=False)], storage="tuple")
+    assert_lines(
+        out,
+        [
+            "def __eq__(self, other):",
+            "    if self is other:",
+            "        return True",
+            "    if other.__class__ is not self.__class__:",
+            "        return NotImplemented",
+            "    return (self.__dataclass_values__[0] is other.__dataclass_values__[0]"
+            " or self.__dataclass_values__[0] == other.__dataclass_values__[0])",
+        ],
+    )
+
+
+def test_hash_cached() -> None:
+    out = source.hash([Field("a")], cache=True)
+    assert_lines(
+        out,
+        [
+            "def __hash__(self):",
+            "    try:",
+            "        return self.__dataclass_hash__",
+            "    except AttributeError:",
+            "        pass",
+            "    if __dataclass_fold_hashes:",
+            "        h = 0x345678 ^ hash(self._a)",
+            "        h = (h & 0x7FFF) * 0x5BD1 ^ (h >> 15 & 0x7FFF) * 0x6F4F",
+            "    else:",
+            "        h = hash((self._a,))",
+            "    self.__dataclass_hash__ = h",
+            "    return h",
+        ],
+    )
+
+
+def test_replace() -> None:
+    out = source.replace([Field("a"), Field("b", init=False, default=0)])
+    assert_lines(
+        out,
+        [
+            "def __replace__(self, **changes):",
+            "    for name in changes:",
+            "        if name not in ('a',):",
+            "            if name in ('b',):",
+            "                raise ValueError("
+            "f'Cannot replace field defined with init=False: {name}')",
+            "            raise TypeError(f'Unknown field: {name}')",
+            "    if type(self).__init__ is not __init__:",
+            "        kwargs = {'a': self._a}",
+            "        kwargs.update(changes)",
+            "        return type(self)(**kwargs)",
+            "    new = object.__new__(type(self))",
+            "    new._a = changes.get('a', self._a)",
+            "    new._b = __dataclass_default_b",
+            "    return new",
+        ],
+    )
+
+
+def test_replace_call_init() -> None:
+    out = source.replace([Field("a"), Field("b")], call_init=True)
+    assert_lines(
+        out,
+        [
+            "def __replace__(self, **changes):",
+            "    for name in changes:",
+            "        if name not in ('a', 'b'):",
+            "            raise TypeError(f'Unknown field: {name}')",
+            "    kwargs = {'a': self._a, 'b': self._b}",
+            "    kwargs.update(changes)",
+            "    return type(self)(**kwargs)",
+        ],
+    )
+
+
+def test_replace_tuple_storage() -> None:
+    out = source.replace([Field("a"), Field("b")], storage="tuple")
+    assert_lines(
+        out,
+        [
+            "def __replace__(self, **changes):",
+            "    for name in changes:",
+            "        if name not in ('a', 'b'):",
+            "            raise TypeError(f'Unknown field: {name}')",
+            "    values = self.__dataclass_values__",
+            "    if type(self).__init__ is not __init__:",
+            "        kwargs = {'a': values[0], 'b': values[1]}",
+            "        kwargs.update(changes)",
+            "        return type(self)(**kwargs)",
+            "    new = object.__new__(type(self))",
+            "    new.__dataclass_values__ = "
+            "(changes.get('a', values[0]), changes.get('b', values[1]),)",
+            "    return new",
+        ],
+    )
+
+
+def test_pack_into() -> None:
+    out = source.pack_into([Field("a"), Field("b")], "<hf")
+    assert_lines(
+        out,
+        [
+            "def pack_into(self, buf, offset=0):",
+            "    __dataclass_pack_into('<hf', buf, offset, self._a, self._b)",
+        ],
+    )
+
+
+def test_to_bytes() -> None:
+    out = source.to_bytes([Field("a"), Field("b")], "<hf")
+    assert_lines(
+        out,
+        [
+            "def to_bytes(self):",
+            "    return __dataclass_pack('<hf', self._a, self._b)",
+        ],
+    )
+
+
+def test_from_bytes() -> None:
+    out = source.from_bytes([Field("a"), Field("b")], "<hf")
+    assert_lines(
+        out,
+        [
+            "@classmethod",
+            "def from_bytes(cls, buf, offset=0):",
+            "    v0, v1, = __dataclass_unpack_from('<hf', buf, offset)",
+            "    return cls(a=v0, b=v1)",
+        ],
+    )
+
+
+def test_decode_into() -> None:
+    out = source.decode_into([Field("a"), Field("b")], "<hf")
+    assert_lines(
+        out,
+        [
+            "def decode_into(self, buf, offset=0):",
+            "    self._a, self._b, = __dataclass_unpack_from('<hf', buf, offset)",
+        ],
+    )
+
+
+def test_update_from() -> None:
+    out = source.update_from([Field("a"), Field("b")])
+    assert_lines(
+        out,
+        [
+            "def update_from(self, mapping):",
+            "    n = 0",
+            "    if 'a' in mapping:",
+            "        self._a = mapping['a']",
+            "        n += 1",
+            "    if 'b' in mapping:",
+            "        self._b = mapping['b']",
+            "        n += 1",
+            "    if n != len(mapping):",
+            "        for name in mapping:",
+            "            if name not in ('a', 'b'):",
+            "                raise TypeError(f'Unknown field: {name}')",
+        ],
+    )
+
+
+def test_update_from_frozen() -> None:
+    out = source.update_from([Field("a")], frozen=True)
+    assert_lines(
+        out,
+        [
+            "def update_from(self, mapping):",
+            "    raise FrozenInstanceError("
+            "f'cannot update frozen {type(self).__name__} instance')",
+        ],
+    )
+
+
+def test_reset() -> None:
+    out = source.reset(
+        [
+            Field("a"),
+            Field("b", default=1),
+            Field("c", default_factory=list),
+            Field("d", init=False, default=2),
+        ]
+    )
+    assert_lines(
+        out,
+        [
+            "def _reset(self):",
+            "    self._b = __dataclass_default_b",
+            "    self._c = __dataclass_default_c()",
+            "    self._d = __dataclass_default_d",
+        ],
+    )
+
+
+def test_write_json() -> None:
+    out = source.write_json([Field("a"), Field("b")])
+    assert_lines(
+        out,
+        [
+            "def __dataclass_write_json__(self, stream):",
+            "    write = stream.write",
+            "    write('{\"a\": ')",
+            "    __dataclass_write_json_value(self._a, stream)",
+            "    write(', \"b\": ')",
+            "    __dataclass_write_json_value(self._b, stream)",
+            "    write('}')",
+        ],
+    )
+
+
+def test_fromdict_call_init() -> None:
+    out = source.fromdict(
+        [Field("a"), Field("b", init=False, default=1)],
+        call_init=True,
+    )
+    assert_lines(
+        out,
+        [
+            "@classmethod",
+            "def __dataclass_fromdict__(cls, data):",
+            "    kwargs = dict(data)",
+            "    kwargs.pop('b', None)",
+            "    return cls(**kwargs)",
+        ],
+    )
+
+
+def test_fromdict() -> None:
+    out = source.fromdict(
+        [Field("a"), Field("b", default=1), Field("c", init=False)],
+        post_init=True,
+    )
+    assert_lines(
+        out,
+        [
+            "@classmethod",
+            "def __dataclass_fromdict__(cls, data):",
+            "    self = object.__new__(cls)",
+            "    n = 0",
+            "    if 'a' in data:",
+            "        self._a = data['a']",
+            "        n += 1",
+            "    else:",
+            "        raise TypeError('Missing field: a')",
+            "    if 'b' in data:",
+            "        self._b = data['b']",
+            "        n += 1",
+            "    else:",
+            "        self._b = __dataclass_default_b",
+            "    if 'c' in data:",
+            "        self._c = data['c']",
+            "        n += 1",
+            "    if n != len(data):",
+            "        for name in data:",
+            "            if name not in ('a', 'b', 'c'):",
+            "                raise TypeError(f'Unknown field: {name}')",
+            "    self.__post_init__()",
+            "    return self",
+        ],
+    )
+
+
+def test_special_methods() -> None:
+    class Class:
+        a: int = field()
+
+    transform = TransformSpec(
+        Class, repr=True, eq=True, order=True, frozen=True, lazy=True
+    )
+    names = source.special_methods(transform)
+    assert names == [
+        "__repr__",
+        "__eq__",
+        "__lt__",
+        "__le__",
+        "__gt__",
+        "__ge__",
+        "__hash__",
+    ]
+    assert source.special_method(transform, "__lt__") == source.lt(
+        transform.fields, transform.storage
+    )
+    # Lazy methods are not generated with the others.
+    assert not set(names) & set(source.class_methods(transform))
+
+
+def test_lt_no_compared_fields() -> None:
+    out = source.lt([Field("a", compare=False)])
+    assert_lines(
+        out,
+        [
+            "def __lt__(self, other):",
+            "    if self is other:",
+            "        return False",
+            "    if other.__class__ is not self.__class__:",
+            "        return NotImplemented",
+            "    return False",
+        ],
+    )
+
+
+def test_intern_new() -> None:
+    out = source.intern_new(
+        [
+            Field("a"),
+            Field("b", default=1, init=False),
+            Field("c", default_factory=tuple),
+        ]
+    )
+    assert_lines(
+        out,
+        [
+            "def __new__(__dataclass_cls, *, a, c=FACTORY_SENTINEL):",
+            "    if c is FACTORY_SENTINEL:",
+            "        c = __dataclass_default_c()",
+            "    __dataclass_key = (__dataclass_cls, a, __dataclass_type(a), c,"
+            " __dataclass_type(c),)",
+            "    try:",
+            "        return __dataclass_intern_table[__dataclass_key]",
+            "    except KeyError:",
+            "        pass",
+            "    except TypeError:",
+            "        # Unhashable argument value",
+            "        __dataclass_key = None",
+            "    self = __dataclass_object_new(__dataclass_cls)",
+            "    self._a = a",
+            "    self._b = __dataclass_default_b",
+            "    self._c = __dataclass_default_c() if c is FACTORY_SENTINEL else c",
+            "    if __dataclass_key is not None:",
+            "        __dataclass_intern_table[__dataclass_key] = self",
+            "    return self",
+        ],
+    )
+
+
+GENERATED_SOURCE_DIGEST = (28, "68ceee48f20f9593")
+"""SOURCE_VERSION and a digest of the source generated by test_source_version.
+
+When the generated source changes, increment SOURCE_VERSION and update both.
+"""
+
+
+def test_source_version() -> None:
+    """Fails if generated methods change without a new SOURCE_VERSION."""
+    if implementation.name == "micropython":
+        return
+    import hashlib
+
+    class Class:
+        a: int = field()
+        b: int = field(default=1, repr=False, format="<H")
+        c: list[int] = field(default_factory=list, compare=False)
+
+        def __post_init__(self) -> None:
+            pass
+
+    class Plain:
+        a: int = field()
+        b: int = field(default=2, hash=True, compare=False)
+
+    transforms = [
+        TransformSpec(Class, init=True, repr=True, eq=True),
+        TransformSpec(
+            Class,
+            init=True,
+            eq=True,
+            order=True,
+            frozen=True,
+            cache_hash=True,
+            cache_asdict=True,
+            positional=("a",),
+        ),
+        TransformSpec(Class, init=True, eq=True, frozen=True, storage="tuple"),
+        TransformSpec(Class, init=True, repr=True, eq=True, frozen=True, intern=True),
+        TransformSpec(Plain, init=True, repr=True, eq=True, storage="plain"),
+        TransformSpec(Plain, init=True, eq=True, order=True, unsafe_hash=True),
+    ]
+    parts: list[str] = []
+    for transform in transforms:
+        parts += source.class_properties(transform).values()
+        parts += source.class_methods(transform).values()
+        parts += (
+            source.special_method(transform, name)
+            for name in source.special_methods(transform)
+        )
+    digest = hashlib.sha256("\n".join(parts).encode()).hexdigest()[:16]
+    assert (SOURCE_VERSION, digest) == GENERATED_SOURCE_DIGEST
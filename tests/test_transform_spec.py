@@ -1,4 +1,6 @@
-from udataclasses.constants import MISSING
+from pytest import raises
+
+from udataclasses.constants import MISSING, SOURCE_VERSION
 from udataclasses.field import Field, field
 from udataclasses.transform_spec import TransformSpec
 
@@ -99,3 +101,108 @@ def test_fields_non_field_attributes_excluded() -> None:
             return 2
 
     assert TransformSpec(Class).fields == []
+
+
+def test_fingerprint() -> None:
+    class Class:
+        a = field()
+        b = field(default=1, repr=False)
+        c = field(default_factory=list, compare=False)
+
+    assert TransformSpec(Class, init=True, eq=True).fingerprint() == (
+        f"{SOURCE_VERSION}|i---e----xm--wusn|property|a=irch---|b=i-chd--|c=ir---f-"
+    )
+
+
+def test_fingerprint_ignores_default_values() -> None:
+    class A:
+        a: int = 1
+
+    class B:
+        a: int = 2
+
+    class C:
+        a = field(default_factory=int)
+
+    assert TransformSpec(A).fingerprint() == TransformSpec(B).fingerprint()
+    assert TransformSpec(A).fingerprint() != TransformSpec(C).fingerprint()
+    assert TransformSpec(A).fingerprint() != TransformSpec(A, frozen=True).fingerprint()
+
+
+def test_storage() -> None:
+    class Empty:
+        pass
+
+    assert TransformSpec(Empty).storage == "property"
+    assert TransformSpec(Empty, storage="plain").storage == "plain"
+
+    with raises(ValueError):
+        TransformSpec(Empty, storage="unknown")
+
+    with raises(ValueError):
+        TransformSpec(Empty, storage="plain", frozen=True)
+
+
+def test_tuple_storage() -> None:
+    class Empty:
+        pass
+
+    assert TransformSpec(Empty, frozen=True, storage="tuple").storage == "tuple"
+    with raises(ValueError):
+        TransformSpec(Empty, storage="tuple")
+
+    class InitFalseNoDefault:
+        a = field(init=False)
+
+    with raises(ValueError):
+        TransformSpec(InitFalseNoDefault, frozen=True, storage="tuple")
+
+
+def test_struct_format() -> None:
+    class NoFormat:
+        a = field()
+
+    assert TransformSpec(NoFormat).struct_format is None
+
+    class Class:
+        c = field(format="<h")
+        b = field(default="")
+        a = field(format="8s")
+
+    assert TransformSpec(Class).struct_format == "<8sh"
+    assert TransformSpec(Class).fingerprint().endswith("|c=irch---:<h")
+
+    class MismatchedByteOrder:
+        a = field(format="<h")
+        b = field(format=">h")
+
+    with raises(ValueError):
+        TransformSpec(MismatchedByteOrder)
+
+    class MultipleValues:
+        a = field(format="2h")
+
+    with raises(ValueError):
+        TransformSpec(MultipleValues)
+
+    class InitFalse:
+        a = field(format="h", init=False, default=0)
+
+    with raises(ValueError):
+        TransformSpec(InitFalse)
+
+
+def test_positional() -> None:
+    class Class:
+        a = field()
+        b = field(default=0)
+        c = field(default=0, init=False)
+
+    assert TransformSpec(Class, positional=("b",)).positional == ("b",)
+    for positional in (("x",), ("a", "a"), ("c",), ("b", "a")):
+        with raises(ValueError):
+            TransformSpec(Class, positional=positional)
+    assert (
+        TransformSpec(Class, positional=("a", "b")).fingerprint()
+        != TransformSpec(Class, positional=("b",)).fingerprint()
+    )